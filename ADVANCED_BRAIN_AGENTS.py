@@ -14,6 +14,7 @@ import re
 
 # Import base framework
 from BRAIN_AGENT_FRAMEWORK import BrainAgent, AgentState, AgentOrchestrator
+from BRAIN_INDEX_REGISTRY import cyclotron_atoms, get_index_registry, graph_entities, task_memories
 
 # Paths
 HOME = Path.home()
@@ -25,6 +26,9 @@ DEPLOYMENT = HOME / "100X_DEPLOYMENT"
 class CyclotronAgent(BrainAgent):
     """Agent that interfaces with C1's Cyclotron brain."""
 
+    reads = frozenset({"task"})
+    writes = frozenset({"context.cyclotron_atoms", "context.cyclotron_keywords", "memory", "outputs"})
+
     def __init__(self):
         super().__init__(
             name="Cyclotron",
@@ -37,21 +41,17 @@ class CyclotronAgent(BrainAgent):
         """Query Cyclotron for relevant knowledge."""
         task = state.task.lower()
 
-        # Load Cyclotron index
-        index = self._load_index()
-        if not index:
+        # Load Cyclotron index (shared, reloaded only when INDEX.json changes)
+        atoms, atom_index = cyclotron_atoms(self.cyclotron_path / "INDEX.json")
+        if atom_index is None:
             state.add_memory("Cyclotron index not found - operating without knowledge base", "warning")
             return state
 
         # Extract keywords from task
         keywords = self._extract_keywords(task)
 
-        # Search for relevant atoms
-        relevant_atoms = []
-        for atom in index.get("atoms", []):
-            atom_text = f"{atom.get('content', '')} {' '.join(atom.get('tags', []))}".lower()
-            if any(kw in atom_text for kw in keywords):
-                relevant_atoms.append(atom)
+        # Atoms whose content or tags contain any keyword
+        relevant_atoms = [atoms[i] for i in atom_index.search_any(keywords)]
 
         # Add to context
         state.context["cyclotron_atoms"] = relevant_atoms[:10]  # Top 10
@@ -69,14 +69,6 @@ class CyclotronAgent(BrainAgent):
 
         return state
 
-    def _load_index(self) -> dict:
-        """Load Cyclotron index."""
-        index_path = self.cyclotron_path / "INDEX.json"
-        if index_path.exists():
-            with open(index_path) as f:
-                return json.load(f)
-        return {}
-
     def _extract_keywords(self, text: str) -> list:
         """Extract meaningful keywords from text."""
         # Remove common words
@@ -97,6 +89,9 @@ class CyclotronAgent(BrainAgent):
 class PatternAgent(BrainAgent):
     """Agent that detects patterns using Pattern Theory."""
 
+    reads = frozenset({"task"})
+    writes = frozenset({"context.pattern_analysis", "memory", "outputs"})
+
     def __init__(self):
         super().__init__(
             name="PatternDetector",
@@ -149,6 +144,9 @@ class PatternAgent(BrainAgent):
 class KnowledgeAgent(BrainAgent):
     """Agent that manages and queries knowledge graphs."""
 
+    reads = frozenset({"task"})
+    writes = frozenset({"context.knowledge", "memory", "outputs"})
+
     def __init__(self):
         super().__init__(
             name="KnowledgeGraph",
@@ -164,14 +162,13 @@ class KnowledgeAgent(BrainAgent):
         # Load brain knowledge
         knowledge = self._load_brain_knowledge()
 
-        # Find relevant entities
+        # Find relevant entities (names containing any task word)
         entities = []
         relationships = []
 
         if "entities" in knowledge:
-            for entity in knowledge["entities"]:
-                if any(kw in entity.get("name", "").lower() for kw in task.split()):
-                    entities.append(entity)
+            entity_list, entity_index = graph_entities(CONSCIOUSNESS / "graphrag" / "entities")
+            entities = [entity_list[i] for i in entity_index.search_any(task.split())]
 
         # Store in context
         state.context["knowledge"] = {
@@ -199,16 +196,12 @@ class KnowledgeAgent(BrainAgent):
         # Load entities
         entities_path = CONSCIOUSNESS / "graphrag" / "entities"
         if entities_path.exists():
-            knowledge["entities"] = []
-            for f in entities_path.glob("*.json"):
-                with open(f) as file:
-                    knowledge["entities"].extend(json.load(file).get("entities", []))
+            knowledge["entities"] = graph_entities(entities_path)[0]
 
         # Load summary
-        summary_path = self.brain_path / "knowledge_summary.json"
-        if summary_path.exists():
-            with open(summary_path) as f:
-                knowledge["summary"] = json.load(f)
+        summary = get_index_registry().load_json(self.brain_path / "knowledge_summary.json")
+        if summary is not None:
+            knowledge["summary"] = summary
 
         return knowledge
 
@@ -216,6 +209,10 @@ class KnowledgeAgent(BrainAgent):
 class DecisionAgent(BrainAgent):
     """Agent that makes autonomous decisions based on context."""
 
+    reads = frozenset({"task", "context.cyclotron_atoms", "context.pattern_analysis",
+                       "context.knowledge", "context.plan"})
+    writes = frozenset({"context.decisions", "decisions", "outputs"})
+
     def __init__(self):
         super().__init__(
             name="DecisionMaker",
@@ -303,6 +300,9 @@ class DecisionAgent(BrainAgent):
 class MemoryAgent(BrainAgent):
     """Agent that manages persistent memory across sessions."""
 
+    reads = frozenset({"task"})
+    writes = frozenset({"context.related_memories", "memory", "outputs"})
+
     def __init__(self):
         super().__init__(
             name="Memory",
@@ -315,13 +315,10 @@ class MemoryAgent(BrainAgent):
     def process(self, state: AgentState) -> AgentState:
         """Manage task memory."""
         # Load relevant memories
-        memories = self._load_memories()
+        memories, memory_index = task_memories(self.memory_path)
 
-        # Find related past tasks
-        related = []
-        for memory in memories:
-            if any(word in memory.get("task", "").lower() for word in state.task.lower().split()[:5]):
-                related.append(memory)
+        # Find related past tasks (newest first)
+        related = [memories[i] for i in memory_index.search_any(state.task.lower().split()[:5])]
 
         state.context["related_memories"] = related[:5]
 
@@ -347,12 +344,8 @@ class MemoryAgent(BrainAgent):
         return state
 
     def _load_memories(self) -> list:
-        """Load all stored memories."""
-        memories = []
-        for f in self.memory_path.glob("*.json"):
-            with open(f) as file:
-                memories.append(json.load(file))
-        return sorted(memories, key=lambda x: x.get("timestamp", ""), reverse=True)
+        """Load all stored memories, newest first."""
+        return task_memories(self.memory_path)[0]
 
     def store(self, state: AgentState, success: bool = True):
         """Store task memory for future recall."""
@@ -372,8 +365,8 @@ class MemoryAgent(BrainAgent):
 class AdvancedOrchestrator(AgentOrchestrator):
     """Extended orchestrator with advanced agents."""
 
-    def __init__(self):
-        super().__init__()
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
 
         # Add advanced agents
         self.agents.update({
@@ -398,6 +391,9 @@ class AdvancedOrchestrator(AgentOrchestrator):
         7. Decision - make decisions
         8. Executor - execute
         9. Synthesizer - combine results
+
+        Steps 1-6 only read the task and run concurrently; the critical
+        path is (slowest of 1-6) → Decision → Executor → Synthesizer.
         """
         sequence = [
             "memory",
@@ -31,8 +31,16 @@ from CODE_GENERATOR import CodeGenerator
 from DATABASE_DESIGNER import DatabaseDesigner
 from TEST_GENERATOR import TestGenerator
 
+sys.path.insert(0, "C:/Users/dwrek/100X_DEPLOYMENT")
+try:
+    from API_INFRASTRUCTURE import init_request_timing
+except ImportError:
+    init_request_timing = None
+
 app = Flask(__name__)
 CORS(app)
+if init_request_timing:
+    init_request_timing(app, 'generator')
 
 # Initialize generators
 app_generator = AIAppGenerator()
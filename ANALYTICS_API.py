@@ -11,8 +11,11 @@ import os
 from datetime import datetime, timedelta
 from pathlib import Path
 
+from API_INFRASTRUCTURE import init_request_timing
+
 app = Flask(__name__)
 CORS(app)
+init_request_timing(app, 'analytics')
 
 # Paths
 BASE_DIR = Path(os.path.expanduser("~"))
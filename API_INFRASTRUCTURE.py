@@ -1,93 +1,304 @@
 #!/usr/bin/env python3
 """
 API INFRASTRUCTURE LAYER
-Connection pooling, request validation, rate limiting.
+Connection pooling, request validation, rate limiting, response
+compression, conditional GET and request timing (/metrics).
 
 Prevents:
-- Connection exhaustion (max 10 concurrent → pooled)
+- Connection exhaustion (10 read-only readers + 1 serialized writer, pooled)
 - SQL injection attacks (input validation)
 - DoS attacks (rate limiting)
 - Invalid queries (parameter validation)
 """
 
 import sqlite3
+import gzip
+import hashlib
 import json
+import math
+import os
 import time
 import threading
+import zlib
+from bisect import bisect_left
+from contextlib import contextmanager
 from pathlib import Path
 from datetime import datetime
 from functools import wraps
-from collections import defaultdict
+from collections import OrderedDict, deque
 from typing import Tuple, Optional
 
 # ============================================================================
 # CONNECTION POOL
 # ============================================================================
 
+# Upper bounds (ms) of the acquisition wait-time histogram buckets
+WAIT_BUCKETS_MS = (0.1, 1, 5, 10, 50, 100, 500, 1000, 5000)
+
+
+class _PoolSlot:
+    """One class of pooled connections (readers or the writer).
+
+    Waiters queue FIFO on a Condition so acquisition is fair under
+    contention: only the thread at the head of the queue may take a
+    connection, everyone else keeps sleeping.
+    """
+
+    def __init__(self, name: str, size: int, factory):
+        self.name = name
+        self.size = size
+        self.factory = factory
+        self.cond = threading.Condition()
+        self.available = deque()      # (conn, created_at, last_used, uses)
+        self.checked_out = {}         # id(conn) -> (conn, created_at, uses)
+        self.owed = 0                 # connections lost to factory failures, reopened on acquire
+        self.waiters = deque()        # FIFO tickets
+        self.next_ticket = 0
+
+        self.acquired = 0
+        self.timeouts = 0
+        self.replaced = 0
+        self.wait_total_ms = 0.0
+        self.wait_max_ms = 0.0
+        self.wait_histogram = [0] * (len(WAIT_BUCKETS_MS) + 1)
+
+    def record_wait(self, wait_ms: float):
+        self.acquired += 1
+        self.wait_total_ms += wait_ms
+        self.wait_max_ms = max(self.wait_max_ms, wait_ms)
+        self.wait_histogram[bisect_left(WAIT_BUCKETS_MS, wait_ms)] += 1
+
+    def stats(self) -> dict:
+        buckets = {f"le_{b}ms": c for b, c in zip(WAIT_BUCKETS_MS, self.wait_histogram)}
+        buckets['gt_%dms' % WAIT_BUCKETS_MS[-1]] = self.wait_histogram[-1]
+        return {
+            'size': self.size,
+            'available': len(self.available),
+            'in_use': len(self.checked_out),
+            'owed': self.owed,
+            'waiting': len(self.waiters),
+            'acquired': self.acquired,
+            'timeouts': self.timeouts,
+            'replaced': self.replaced,
+            'wait_mean_ms': round(self.wait_total_ms / self.acquired, 3) if self.acquired else 0.0,
+            'wait_max_ms': round(self.wait_max_ms, 3),
+            'wait_histogram': buckets
+        }
+
+
 class SQLiteConnectionPool:
-    """Thread-safe connection pool for SQLite database."""
+    """Reader/writer connection pool for SQLite.
+
+    SQLite in WAL mode allows many concurrent readers but only one writer,
+    so the pool keeps `pool_size` read-only connections and a single
+    serialized writer connection. Connections are validated after sitting
+    idle, recycled after `max_uses` / `max_age`, and replaced when broken.
+    """
 
-    def __init__(self, db_path: str, pool_size: int = 10, timeout: float = 5.0):
+    def __init__(self, db_path: str, pool_size: int = 10, timeout: float = 5.0,
+                 validate_after: float = 30.0, max_uses: int = 10000,
+                 max_age: float = 3600.0):
         self.db_path = db_path
         self.pool_size = pool_size
         self.timeout = timeout
-        self.connections = []
-        self.available = []
-        self.lock = threading.Lock()
-
-        # Initialize pool
-        for i in range(pool_size):
-            try:
-                conn = sqlite3.connect(db_path, check_same_thread=False, timeout=timeout)
-                conn.row_factory = sqlite3.Row
-                self.connections.append(conn)
-                self.available.append(conn)
-            except Exception as e:
-                print(f"[POOL] Connection {i} initialization failed: {e}")
+        self.validate_after = validate_after
+        self.max_uses = max_uses
+        self.max_age = max_age
 
-        print(f"[POOL] Initialized {len(self.available)}/{pool_size} connections")
+        self.readers = _PoolSlot('readers', pool_size, self._open_reader)
+        self.writer = _PoolSlot('writer', 1, self._open_writer)
 
-    def acquire(self, timeout: Optional[float] = None) -> sqlite3.Connection:
-        """Get connection from pool (waits if necessary)."""
+        # Writer first: it switches the database to WAL so readers never block it
+        for slot in (self.writer, self.readers):
+            for i in range(slot.size):
+                try:
+                    slot.available.append((slot.factory(), time.monotonic(), time.monotonic(), 0))
+                except Exception as e:
+                    slot.owed += 1
+                    print(f"[POOL] {slot.name} connection {i} initialization failed: {e}")
+
+        print(f"[POOL] Initialized {len(self.readers.available)}/{pool_size} readers + "
+              f"{len(self.writer.available)}/1 writer")
+
+    # ------------------------------------------------------------------
+    # Connection factories
+    # ------------------------------------------------------------------
+
+    def _open_reader(self) -> sqlite3.Connection:
+        uri = Path(self.db_path).resolve().as_uri() + "?mode=ro"
+        conn = sqlite3.connect(uri, uri=True, check_same_thread=False, timeout=self.timeout)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA query_only = ON")
+        return conn
+
+    def _open_writer(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, check_same_thread=False, timeout=self.timeout)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute("PRAGMA synchronous = NORMAL")
+        return conn
+
+    # ------------------------------------------------------------------
+    # Acquire / release
+    # ------------------------------------------------------------------
+
+    def _slot(self, write: bool) -> _PoolSlot:
+        return self.writer if write else self.readers
+
+    def _is_healthy(self, conn: sqlite3.Connection) -> bool:
+        try:
+            conn.execute("SELECT 1").fetchone()
+            return True
+        except sqlite3.Error:
+            return False
+
+    def _checkout(self, slot: _PoolSlot) -> sqlite3.Connection:
+        """Pop a connection, validating or recycling it (caller holds cond).
+
+        With nothing available but connections owed (earlier factory
+        failures), open a new one; if that fails again the debt stays.
+        """
+        now = time.monotonic()
+        if not slot.available:
+            conn = slot.factory()
+            slot.owed -= 1
+            slot.replaced += 1
+            slot.checked_out[id(conn)] = (conn, now, 1)
+            return conn
+
+        conn, created, last_used, uses = slot.available.popleft()
+
+        stale = uses >= self.max_uses or now - created > self.max_age
+        if not stale and now - last_used > self.validate_after:
+            stale = not self._is_healthy(conn)
+
+        if stale:
+            try:
+                conn.close()
+            except Exception:
+                pass
+            try:
+                conn, created, uses = slot.factory(), now, 0
+            except Exception:
+                # Capacity is kept: the next acquire retries the factory
+                slot.owed += 1
+                raise
+            slot.replaced += 1
+
+        slot.checked_out[id(conn)] = (conn, created, uses + 1)
+        return conn
+
+    def acquire(self, timeout: Optional[float] = None, write: bool = False) -> sqlite3.Connection:
+        """Get a connection (read-only by default; write=True for the writer).
+
+        Waits on a Condition in FIFO order until one is free or `timeout`
+        seconds pass.
+        """
         timeout = timeout or self.timeout
-        start = time.time()
-
-        while True:
-            with self.lock:
-                if self.available:
-                    conn = self.available.pop()
-                    return conn
-
-            if time.time() - start > timeout:
-                raise TimeoutError(f"No available connections after {timeout}s")
-
-            time.sleep(0.01)
-
-    def release(self, conn: sqlite3.Connection):
-        """Return connection to pool."""
-        with self.lock:
-            if conn not in self.available:
-                self.available.append(conn)
+        slot = self._slot(write)
+        start = time.monotonic()
+        deadline = start + timeout
+
+        with slot.cond:
+            ticket = slot.next_ticket
+            slot.next_ticket += 1
+            slot.waiters.append(ticket)
+            try:
+                while not (slot.waiters[0] == ticket and (slot.available or slot.owed)):
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        slot.timeouts += 1
+                        raise TimeoutError(f"No available {slot.name} connections after {timeout}s")
+                    slot.cond.wait(remaining)
+
+                conn = self._checkout(slot)
+            finally:
+                slot.waiters.remove(ticket)
+                # Wake the next waiter in line (it may now be at the head)
+                slot.cond.notify_all()
+
+            slot.record_wait((time.monotonic() - start) * 1000)
+            return conn
+
+    def release(self, conn: sqlite3.Connection, broken: bool = False):
+        """Return connection to pool (pass broken=True to force replacement)."""
+        for slot in (self.readers, self.writer):
+            with slot.cond:
+                entry = slot.checked_out.pop(id(conn), None)
+                if entry is None:
+                    continue
+
+                _, created, uses = entry
+                if not broken:
+                    try:
+                        # Caller forgot to commit/rollback - never hand out a dirty writer
+                        if conn.in_transaction:
+                            conn.rollback()
+                    except sqlite3.Error:
+                        # Includes ProgrammingError from a connection the caller closed
+                        broken = True
+
+                if broken:
+                    try:
+                        conn.close()
+                    except Exception:
+                        pass
+                    try:
+                        conn, created, uses = slot.factory(), time.monotonic(), 0
+                        slot.replaced += 1
+                    except Exception as e:
+                        print(f"[POOL] {slot.name} replacement failed: {e}")
+                        slot.owed += 1  # reopened by a later acquire
+                        slot.cond.notify_all()
+                        return
+
+                slot.available.append((conn, created, time.monotonic(), uses))
+                slot.cond.notify_all()
+                return
+
+    @contextmanager
+    def connection(self, write: bool = False, timeout: Optional[float] = None):
+        """Context manager: acquire, commit (writer) and release."""
+        conn = self.acquire(timeout=timeout, write=write)
+        broken = False
+        try:
+            yield conn
+            if write:
+                conn.commit()
+        except sqlite3.DatabaseError:
+            broken = not self._is_healthy(conn)
+            raise
+        finally:
+            self.release(conn, broken=broken)
 
     def close_all(self):
         """Close all connections."""
-        with self.lock:
-            for conn in self.connections:
-                try:
-                    conn.close()
-                except:
-                    pass
-            self.connections.clear()
-            self.available.clear()
+        for slot in (self.readers, self.writer):
+            with slot.cond:
+                for conn, *_ in list(slot.available) + list(slot.checked_out.values()):
+                    try:
+                        conn.close()
+                    except:
+                        pass
+                slot.available.clear()
+                slot.checked_out.clear()
 
     def get_stats(self) -> dict:
-        """Get pool statistics."""
-        with self.lock:
-            return {
-                'total_connections': len(self.connections),
-                'available_connections': len(self.available),
-                'in_use': len(self.connections) - len(self.available)
-            }
+        """Get pool statistics, including acquisition wait-time histograms."""
+        with self.readers.cond:
+            readers = self.readers.stats()
+        with self.writer.cond:
+            writer = self.writer.stats()
+
+        total = readers['available'] + readers['in_use'] + writer['available'] + writer['in_use']
+        available = readers['available'] + writer['available']
+        return {
+            'total_connections': total,
+            'available_connections': available,
+            'in_use': total - available,
+            'readers': readers,
+            'writer': writer
+        }
 
 
 # ============================================================================
@@ -185,46 +396,110 @@ class RequestValidator:
 # ============================================================================
 
 class RateLimiter:
-    """Rate limit API requests by client IP address."""
+    """Token-bucket rate limiter keyed by client IP (optionally per route).
+
+    Each client holds O(1) state - [tokens, last_refill] - refilled lazily at
+    max_requests/window_seconds. Buckets live in an OrderedDict in
+    last-seen order, so idle clients are swept from the front in amortized
+    O(1) and scanning traffic cannot grow memory without bound.
+    """
 
-    def __init__(self, max_requests: int = 100, window_seconds: int = 60):
+    def __init__(self, max_requests: int = 100, window_seconds: int = 60,
+                 route_limits: Optional[dict] = None, idle_seconds: Optional[float] = None,
+                 sweep_interval: float = 10.0, clock=time.monotonic):
         self.max_requests = max_requests
         self.window_seconds = window_seconds
-        self.requests = defaultdict(list)
+        # route -> (max_requests, window_seconds)
+        self.route_limits = dict(route_limits or {})
+        # A bucket idle for a full window is full again - forgetting it is lossless
+        self.idle_seconds = idle_seconds or max(
+            [window_seconds] + [w for _, w in self.route_limits.values()]
+        )
+        self.sweep_interval = sweep_interval
+        self.clock = clock
+
+        self.buckets = OrderedDict()   # key -> [tokens, last_refill]
         self.lock = threading.Lock()
+        self.next_sweep = clock() + sweep_interval
+        self.evicted = 0
 
-    def is_allowed(self, ip: str) -> Tuple[bool, Optional[str]]:
-        """Check if request from IP is allowed."""
-        with self.lock:
-            now = time.time()
-            cutoff = now - self.window_seconds
+    def _limits(self, route: Optional[str]) -> Tuple[int, float]:
+        return self.route_limits.get(route, (self.max_requests, self.window_seconds))
+
+    def _key(self, ip: str, route: Optional[str]):
+        return (route, ip) if route in self.route_limits else ip
 
-            # Clean old requests
-            self.requests[ip] = [t for t in self.requests[ip] if t > cutoff]
+    def _refill(self, key, now: float, capacity: int, window: float) -> list:
+        """Return the bucket for key, topped up for the time elapsed."""
+        bucket = self.buckets.get(key)
+        if bucket is None:
+            bucket = [float(capacity), now]
+            self.buckets[key] = bucket
+        else:
+            bucket[0] = min(capacity, bucket[0] + (now - bucket[1]) * capacity / window)
+            bucket[1] = now
+            self.buckets.move_to_end(key)
+        return bucket
+
+    def _sweep(self, now: float):
+        """Drop buckets idle long enough to have refilled completely."""
+        cutoff = now - self.idle_seconds
+        while self.buckets:
+            key, bucket = next(iter(self.buckets.items()))
+            if bucket[1] > cutoff:
+                break
+            self.buckets.popitem(last=False)
+            self.evicted += 1
+        self.next_sweep = now + self.sweep_interval
+
+    def is_allowed(self, ip: str, route: Optional[str] = None) -> Tuple[bool, Optional[str]]:
+        """Check if request from IP (to route) is allowed; consumes a token."""
+        capacity, window = self._limits(route)
+        with self.lock:
+            now = self.clock()
+            if now >= self.next_sweep:
+                self._sweep(now)
 
-            # Check limit
-            if len(self.requests[ip]) >= self.max_requests:
-                return False, f"Rate limit exceeded ({self.max_requests}/{self.window_seconds}s)"
+            bucket = self._refill(self._key(ip, route), now, capacity, window)
+            if bucket[0] < 1:
+                return False, f"Rate limit exceeded ({capacity}/{window}s)"
 
-            # Add request
-            self.requests[ip].append(now)
+            bucket[0] -= 1
             return True, None
 
-    def get_stats(self, ip: str) -> dict:
-        """Get rate limit stats for IP."""
+    def get_stats(self, ip: str, route: Optional[str] = None) -> dict:
+        """Get rate limit stats for IP (does not consume a token)."""
+        capacity, window = self._limits(route)
         with self.lock:
-            now = time.time()
-            cutoff = now - self.window_seconds
-            count = sum(1 for t in self.requests[ip] if t > cutoff)
-            remaining = max(0, self.max_requests - count)
-            reset_in = self.window_seconds - (now % self.window_seconds)
+            now = self.clock()
+            bucket = self.buckets.get(self._key(ip, route))
+            if bucket is None:
+                tokens = float(capacity)
+            else:
+                tokens = min(capacity, bucket[0] + (now - bucket[1]) * capacity / window)
+
+            remaining = int(tokens)
+            # Seconds until the bucket is full again
+            reset_in = (capacity - tokens) * window / capacity
 
             return {
-                'requests': count,
-                'max_requests': self.max_requests,
+                'requests': capacity - remaining,
+                'max_requests': capacity,
                 'remaining': remaining,
+                'window_seconds': window,
+                'reset_in': int(math.ceil(reset_in))
+            }
+
+    def get_summary(self) -> dict:
+        """Limiter-wide state (tracked clients, evictions)."""
+        with self.lock:
+            return {
+                'tracked_clients': len(self.buckets),
+                'evicted': self.evicted,
+                'max_requests': self.max_requests,
                 'window_seconds': self.window_seconds,
-                'reset_in': int(reset_in)
+                'route_limits': {r: {'max_requests': m, 'window_seconds': w}
+                                 for r, (m, w) in self.route_limits.items()}
             }
 
 
@@ -241,9 +516,10 @@ def require_validation(f):
 
         # Get client IP
         ip = request.remote_addr or '127.0.0.1'
+        route = request.url_rule.rule if request.url_rule else request.path
 
         # Check rate limit
-        allowed, error = _rate_limiter.is_allowed(ip)
+        allowed, error = _rate_limiter.is_allowed(ip, route)
         if not allowed:
             return {
                 'error': error,
@@ -251,7 +527,7 @@ def require_validation(f):
             }, 429
 
         # Get rate limit stats for response headers
-        stats = _rate_limiter.get_stats(ip)
+        stats = _rate_limiter.get_stats(ip, route)
 
         # Call decorated function
         response = f(*args, **kwargs)
@@ -278,45 +554,452 @@ def require_validation(f):
     return decorated_function
 
 
+# ============================================================================
+# RESPONSE OPTIMIZATION (compression + conditional GET)
+# ============================================================================
+
+COMPRESS_MIN_BYTES = 1024      # Smaller payloads aren't worth the CPU
+COMPRESS_LEVEL = 6
+COMPRESSIBLE_TYPES = ('application/json', 'text/')
+
+
+def make_etag(*parts) -> str:
+    """Build a short opaque ETag from any version parts (generation, hash, path)."""
+    key = '|'.join(str(p) for p in parts).encode()
+    return hashlib.blake2b(key, digest_size=12).hexdigest()
+
+
+def file_generation(*paths) -> str:
+    """Cheap change token for files: mtime + size of each (missing files count too).
+
+    For SQLite pass both the db and its -wal file - every committed write
+    touches one of them.
+    """
+    parts = []
+    for path in paths:
+        try:
+            stat = os.stat(path)
+            parts.append(f"{stat.st_mtime_ns}:{stat.st_size}")
+        except OSError:
+            parts.append("missing")
+    return '/'.join(parts)
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Compare If-None-Match against our ETag, ignoring W/ and encoding suffixes."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == '*':
+        return True
+    for candidate in if_none_match.split(','):
+        candidate = candidate.strip()
+        if candidate.startswith('W/'):
+            candidate = candidate[2:]
+        candidate = candidate.strip('"')
+        for suffix in ('-gzip', '-deflate'):
+            if candidate.endswith(suffix):
+                candidate = candidate[:-len(suffix)]
+        if candidate == etag:
+            return True
+    return False
+
+
+def _not_modified(etag: str):
+    from flask import make_response
+
+    response = make_response('', 304)
+    response.headers['ETag'] = f'"{etag}"'
+    response.headers['Cache-Control'] = 'no-cache'
+    return response
+
+
+def conditional_get(etag_fn):
+    """Decorator: answer If-None-Match with 304 before running the view.
+
+    etag_fn(*view_args, **view_kwargs) returns a cheap version key (index
+    generation, stored file hash, ...) or None to skip. On a match the view
+    never runs, so repeat polls cost a stat() instead of a query + encode.
+    """
+    def decorator(f):
+        @wraps(f)
+        def decorated_function(*args, **kwargs):
+            from flask import request, make_response
+
+            version = etag_fn(*args, **kwargs)
+            if version is None:
+                return f(*args, **kwargs)
+
+            etag = make_etag(version)
+            if _etag_matches(request.headers.get('If-None-Match'), etag):
+                return _not_modified(etag)
+
+            response = make_response(f(*args, **kwargs))
+            if response.status_code == 200:
+                response.headers['ETag'] = f'"{etag}"'
+                response.headers['Cache-Control'] = 'no-cache'
+            return response
+
+        return decorated_function
+    return decorator
+
+
+def _choose_encoding(accept_encoding: str) -> Optional[str]:
+    """Pick gzip or deflate from Accept-Encoding (honours q=0)."""
+    offered = {}
+    for item in (accept_encoding or '').split(','):
+        name, _, params = item.strip().partition(';')
+        q = 1.0
+        if params.strip().startswith('q='):
+            try:
+                q = float(params.strip()[2:])
+            except ValueError:
+                q = 0.0
+        offered[name.strip().lower()] = q
+    for encoding in ('gzip', 'deflate'):
+        if offered.get(encoding, offered.get('*', 0)) > 0:
+            return encoding
+    return None
+
+
+def init_response_optimization(app, min_size: int = COMPRESS_MIN_BYTES,
+                               level: int = COMPRESS_LEVEL, hash_etags: bool = True):
+    """Register ETag + gzip/deflate handling on a Flask app.
+
+    - Responses without an ETag get one from a hash of the body, and a
+      matching If-None-Match turns into an empty 304 (saves bandwidth).
+    - Bodies over `min_size` are compressed when the client accepts it.
+    Streaming responses (send_file, generators) are left untouched.
+    """
+    from flask import request
+
+    @app.after_request
+    def optimize_response(response):
+        if request.method not in ('GET', 'HEAD') or response.status_code != 200:
+            return response
+        if response.direct_passthrough or response.is_streamed:
+            return response
+
+        data = response.get_data()
+        etag = None
+        if hash_etags:
+            existing = response.headers.get('ETag')
+            if existing:
+                etag = existing.strip('"')
+            else:
+                etag = hashlib.blake2b(data, digest_size=12).hexdigest()
+                response.headers['ETag'] = f'"{etag}"'
+            if _etag_matches(request.headers.get('If-None-Match'), etag):
+                return _not_modified(etag)
+
+        if (len(data) < min_size or 'Content-Encoding' in response.headers
+                or not (response.mimetype or '').startswith(COMPRESSIBLE_TYPES)):
+            return response
+
+        response.vary.add('Accept-Encoding')
+        encoding = _choose_encoding(request.headers.get('Accept-Encoding', ''))
+        if encoding is None:
+            return response
+
+        with span('compress'):
+            if encoding == 'gzip':
+                compressed = gzip.compress(data, compresslevel=level)
+            else:
+                compressed = zlib.compress(data, level)
+
+        response.set_data(compressed)
+        response.headers['Content-Encoding'] = encoding
+        response.headers['Content-Length'] = str(len(compressed))
+        if etag:
+            # Different bytes need a different validator (RFC 9110 8.8.3)
+            response.headers['ETag'] = f'"{etag}-{encoding}"'
+        return response
+
+    return app
+
+
+# ============================================================================
+# REQUEST TIMING (Server-Timing + Prometheus /metrics)
+# ============================================================================
+
+# Upper bounds (seconds) of the request latency histogram buckets
+LATENCY_BUCKETS_S = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+METRICS_PREFIX = 'cyclotron'
+
+# Per-thread span accumulator for the request currently being served
+_timing_local = threading.local()
+
+
+@contextmanager
+def span(name: str):
+    """Time a block inside a request: `with span('db'): cursor.execute(...)`.
+
+    Conventional names: db, model, serialize. Repeated spans with the same
+    name add up. Outside a timed request this is a no-op.
+    """
+    spans = getattr(_timing_local, 'spans', None)
+    if spans is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        spans[name] = spans.get(name, 0.0) + (time.perf_counter() - start)
+
+
+def timed(name: str):
+    """Decorator form of span() for helpers called from views."""
+    def decorator(f):
+        @wraps(f)
+        def decorated_function(*args, **kwargs):
+            with span(name):
+                return f(*args, **kwargs)
+        return decorated_function
+    return decorator
+
+
+def _label_value(value) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _labels(**labels) -> str:
+    return ','.join(f'{k}="{_label_value(v)}"' for k, v in labels.items())
+
+
+class RequestMetrics:
+    """Process-wide request aggregates (latency histograms, errors, in-flight).
+
+    Keyed by (service, method, route rule) - the rule, not the raw path, so
+    /api/file?path=... stays one series.
+    """
+
+    def __init__(self, buckets: tuple = LATENCY_BUCKETS_S):
+        self.buckets = buckets
+        self.lock = threading.Lock()
+        self.latency = {}       # (service, method, route) -> [per-bucket counts..., +Inf]
+        self.latency_sum = {}   # (service, method, route) -> seconds
+        self.responses = {}     # (service, method, route, status) -> count
+        self.errors = {}        # (service, method, route) -> 5xx + unhandled
+        self.in_flight = {}     # service -> count
+        self.spans = {}         # (service, route, span) -> [seconds, count]
+
+    def begin(self, service: str):
+        with self.lock:
+            self.in_flight[service] = self.in_flight.get(service, 0) + 1
+
+    def record(self, service: str, method: str, route: str, status: int,
+               seconds: float, spans: Optional[dict] = None):
+        key = (service, method, route)
+        with self.lock:
+            self.in_flight[service] = max(0, self.in_flight.get(service, 0) - 1)
+
+            histogram = self.latency.get(key)
+            if histogram is None:
+                histogram = self.latency[key] = [0] * (len(self.buckets) + 1)
+            histogram[bisect_left(self.buckets, seconds)] += 1
+            self.latency_sum[key] = self.latency_sum.get(key, 0.0) + seconds
+
+            status_key = key + (status,)
+            self.responses[status_key] = self.responses.get(status_key, 0) + 1
+            if status >= 500:
+                self.errors[key] = self.errors.get(key, 0) + 1
+
+            for name, elapsed in (spans or {}).items():
+                totals = self.spans.setdefault((service, route, name), [0.0, 0])
+                totals[0] += elapsed
+                totals[1] += 1
+
+    def render_prometheus(self) -> str:
+        """Prometheus text exposition format (version 0.0.4)."""
+        p = METRICS_PREFIX
+        lines = []
+
+        with self.lock:
+            lines += [f"# HELP {p}_http_request_duration_seconds Request latency by route.",
+                      f"# TYPE {p}_http_request_duration_seconds histogram"]
+            for (service, method, route), histogram in sorted(self.latency.items()):
+                base = _labels(service=service, method=method, route=route)
+                cumulative = 0
+                for bound, count in zip(self.buckets, histogram):
+                    cumulative += count
+                    lines.append(f'{p}_http_request_duration_seconds_bucket{{{base},le="{bound}"}} {cumulative}')
+                cumulative += histogram[-1]
+                lines.append(f'{p}_http_request_duration_seconds_bucket{{{base},le="+Inf"}} {cumulative}')
+                lines.append(f'{p}_http_request_duration_seconds_sum{{{base}}} '
+                             f'{self.latency_sum[(service, method, route)]:.6f}')
+                lines.append(f'{p}_http_request_duration_seconds_count{{{base}}} {cumulative}')
+
+            lines += [f"# HELP {p}_http_requests_total Responses by route and status.",
+                      f"# TYPE {p}_http_requests_total counter"]
+            for (service, method, route, status), count in sorted(self.responses.items()):
+                lines.append(f'{p}_http_requests_total{{'
+                             f'{_labels(service=service, method=method, route=route, status=status)}}} {count}')
+
+            lines += [f"# HELP {p}_http_request_errors_total 5xx responses and unhandled exceptions.",
+                      f"# TYPE {p}_http_request_errors_total counter"]
+            for (service, method, route), count in sorted(self.errors.items()):
+                lines.append(f'{p}_http_request_errors_total{{'
+                             f'{_labels(service=service, method=method, route=route)}}} {count}')
+
+            lines += [f"# HELP {p}_http_requests_in_flight Requests currently being served.",
+                      f"# TYPE {p}_http_requests_in_flight gauge"]
+            for service, count in sorted(self.in_flight.items()):
+                lines.append(f'{p}_http_requests_in_flight{{{_labels(service=service)}}} {count}')
+
+            lines += [f"# HELP {p}_http_span_seconds_total Time inside named spans (db, model, serialize).",
+                      f"# TYPE {p}_http_span_seconds_total counter"]
+            for (service, route, name), (seconds, _) in sorted(self.spans.items()):
+                lines.append(f'{p}_http_span_seconds_total{{'
+                             f'{_labels(service=service, route=route, span=name)}}} {seconds:.6f}')
+            lines += [f"# HELP {p}_http_span_count_total Requests that entered each span.",
+                      f"# TYPE {p}_http_span_count_total counter"]
+            for (service, route, name), (_, count) in sorted(self.spans.items()):
+                lines.append(f'{p}_http_span_count_total{{'
+                             f'{_labels(service=service, route=route, span=name)}}} {count}')
+
+        return '\n'.join(lines) + '\n'
+
+
+def render_metrics() -> str:
+    """Request metrics plus connection pool and rate limiter gauges."""
+    p = METRICS_PREFIX
+    text = _request_metrics.render_prometheus()
+    lines = []
+
+    if _pool is not None:
+        stats = _pool.get_stats()
+        lines += [f"# TYPE {p}_db_pool_connections gauge"]
+        for pool in ('readers', 'writer'):
+            for state in ('available', 'in_use', 'waiting'):
+                lines.append(f'{p}_db_pool_connections{{{_labels(pool=pool, state=state)}}} '
+                             f'{stats[pool][state]}')
+        lines += [f"# TYPE {p}_db_pool_acquire_timeouts_total counter"]
+        for pool in ('readers', 'writer'):
+            lines.append(f'{p}_db_pool_acquire_timeouts_total{{{_labels(pool=pool)}}} '
+                         f'{stats[pool]["timeouts"]}')
+
+    if _rate_limiter is not None:
+        summary = _rate_limiter.get_summary()
+        lines += [f"# TYPE {p}_rate_limiter_tracked_clients gauge",
+                  f"{p}_rate_limiter_tracked_clients {summary['tracked_clients']}",
+                  f"# TYPE {p}_rate_limiter_evicted_total counter",
+                  f"{p}_rate_limiter_evicted_total {summary['evicted']}"]
+
+    return text + ('\n'.join(lines) + '\n' if lines else '')
+
+
+def init_request_timing(app, service: str, metrics_path: Optional[str] = '/metrics',
+                        server_timing: bool = True):
+    """Record per-route latency, status and spans for a Flask app.
+
+    - Every response gets `Server-Timing: db;dur=.., model;dur=.., total;dur=..`
+    - `metrics_path` serves all services in this process in Prometheus format
+    Call before init_response_optimization so `total` includes compression.
+    """
+    from flask import Response, g, request
+
+    @app.before_request
+    def start_request_timer():
+        _timing_local.spans = {}
+        g.request_timing_start = time.perf_counter()
+        _request_metrics.begin(service)
+
+    @app.after_request
+    def add_server_timing(response):
+        start = g.get('request_timing_start')
+        if start is None:
+            return response
+        g.request_timing_status = response.status_code
+        if server_timing:
+            spans = getattr(_timing_local, 'spans', None) or {}
+            parts = [f"{name};dur={elapsed * 1000:.2f}" for name, elapsed in spans.items()]
+            parts.append(f"total;dur={(time.perf_counter() - start) * 1000:.2f}")
+            response.headers.add('Server-Timing', ', '.join(parts))
+        return response
+
+    @app.teardown_request
+    def record_request_timing(exc=None):
+        start = g.pop('request_timing_start', None)
+        if start is None:
+            return
+        seconds = time.perf_counter() - start
+        status = 500 if exc is not None else g.pop('request_timing_status', 500)
+        route = request.url_rule.rule if request.url_rule else 'unmatched'
+        spans = getattr(_timing_local, 'spans', None)
+        _timing_local.spans = None
+        _request_metrics.record(service, request.method, route, status, seconds, spans)
+
+    if metrics_path and metrics_path not in {rule.rule for rule in app.url_map.iter_rules()}:
+        def prometheus_metrics():
+            return Response(render_metrics(), mimetype='text/plain; version=0.0.4')
+        app.add_url_rule(metrics_path, 'prometheus_metrics', prometheus_metrics)
+
+    return app
+
+
 # ============================================================================
 # GLOBAL INSTANCES
 # ============================================================================
 
 _pool = None
 _rate_limiter = None
+_request_metrics = RequestMetrics()
+
+# Per-route overrides: route rule -> (max_requests, window_seconds)
+ROUTE_LIMITS = {
+    '/api/file': (30, 60),      # Whole documents - expensive payloads
+    '/api/ask': (60, 60),       # Multi-term FTS queries
+}
+
 
+def init_api_infrastructure(app=None, route_limits: Optional[dict] = None):
+    """Initialize API infrastructure (call once at startup).
 
-def init_api_infrastructure(app=None):
-    """Initialize API infrastructure (call once at startup)."""
+    Safe to call again: a host mounting several apps in one process shares
+    the first pool and rate limiter.
+    """
     global _pool, _rate_limiter
 
+    if _pool is not None and _rate_limiter is not None:
+        return
+
     db_path = "C:/Users/dwrek/.consciousness/cyclotron_core/atoms.db"
 
     # Initialize connection pool
     _pool = SQLiteConnectionPool(db_path, pool_size=10, timeout=5.0)
 
     # Initialize rate limiter (100 requests per 60 seconds)
-    _rate_limiter = RateLimiter(max_requests=100, window_seconds=60)
+    _rate_limiter = RateLimiter(
+        max_requests=100, window_seconds=60,
+        route_limits=ROUTE_LIMITS if route_limits is None else route_limits
+    )
 
     print("\n[API] Infrastructure Initialized")
-    print(f"  - Connection pool size: 10")
+    print(f"  - Connection pool size: 10 readers + 1 writer")
     print(f"  - Rate limit: 100 requests/60s")
     print(f"  - Request validation: ENABLED")
     print(f"  - Connection pooling: ENABLED\n")
 
 
-def get_db_connection() -> sqlite3.Connection:
-    """Get database connection from pool."""
+def get_db_connection(write: bool = False) -> sqlite3.Connection:
+    """Get database connection from pool (read-only unless write=True)."""
     if _pool is None:
         raise RuntimeError("API infrastructure not initialized - call init_api_infrastructure()")
-    return _pool.acquire()
+    return _pool.acquire(write=write)
 
 
-def release_db_connection(conn: sqlite3.Connection):
+def release_db_connection(conn: sqlite3.Connection, broken: bool = False):
     """Return connection to pool."""
     if _pool is None:
         return
-    _pool.release(conn)
+    _pool.release(conn, broken=broken)
+
+
+def db_connection(write: bool = False):
+    """Context manager over the shared pool: `with db_connection() as conn:`."""
+    if _pool is None:
+        raise RuntimeError("API infrastructure not initialized - call init_api_infrastructure()")
+    return _pool.connection(write=write)
 
 
 def get_pool_stats() -> dict:
@@ -326,11 +1009,21 @@ def get_pool_stats() -> dict:
     return _pool.get_stats()
 
 
-def get_rate_limiter_stats(ip: str) -> dict:
-    """Get rate limiter stats for IP."""
+def get_rate_limiter() -> Optional[RateLimiter]:
+    """Get the shared rate limiter instance."""
+    return _rate_limiter
+
+
+def get_request_metrics() -> RequestMetrics:
+    """Get the process-wide request metrics registry."""
+    return _request_metrics
+
+
+def get_rate_limiter_stats(ip: str, route: Optional[str] = None) -> dict:
+    """Get rate limit stats for IP."""
     if _rate_limiter is None:
         return {}
-    return _rate_limiter.get_stats(ip)
+    return _rate_limiter.get_stats(ip, route)
 
 
 # ============================================================================
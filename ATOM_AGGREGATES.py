@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+"""
+ATOM AGGREGATES - Trigger-maintained summary tables for atoms.db
+Exact atom counts by type, source and day without scanning the atoms table.
+
+Before: every dashboard poll runs COUNT(*) / GROUP BY over all atoms (O(#atoms))
+After:  insert/update/delete triggers keep summary tables exact (O(#types))
+
+Usage:
+    python ATOM_AGGREGATES.py install   # create tables + triggers, backfill
+    python ATOM_AGGREGATES.py verify    # recompute and report drift
+    python ATOM_AGGREGATES.py repair    # recompute and overwrite on drift
+    python ATOM_AGGREGATES.py stats     # print current aggregates
+"""
+
+import sqlite3
+import sys
+import time
+from datetime import datetime
+from typing import Optional
+
+DB_PATH = "C:/Users/dwrek/.consciousness/cyclotron_core/atoms.db"
+
+# NULL keys are stored as '' so they collide under the primary key
+TYPE_KEY = "COALESCE({row}.type, '')"
+SOURCE_KEY = "COALESCE({row}.source, '')"
+DAY_KEY = "substr(COALESCE({row}.created, ''), 1, 10)"
+
+# table -> (key column, key expression)
+AGGREGATE_TABLES = {
+    "atom_counts_by_type": ("type", TYPE_KEY),
+    "atom_counts_by_source": ("source", SOURCE_KEY),
+    "atom_counts_by_day": ("day", DAY_KEY),
+}
+
+# Every trigger _schema_statements() creates
+TRIGGER_NAMES = ["trg_atoms_agg_insert", "trg_atoms_agg_delete"] + [
+    f"trg_atoms_agg_update_{column}" for column, _ in AGGREGATE_TABLES.values()
+]
+
+
+def _increment(table: str, column: str, expr: str) -> str:
+    key = expr.format(row="NEW")
+    return (f"INSERT INTO {table}({column}, count) VALUES ({key}, 1) "
+            f"ON CONFLICT({column}) DO UPDATE SET count = count + 1;")
+
+
+def _decrement(table: str, column: str, expr: str) -> str:
+    key = expr.format(row="OLD")
+    return (f"UPDATE {table} SET count = count - 1 WHERE {column} = {key};\n"
+            f"        DELETE FROM {table} WHERE {column} = {key} AND count <= 0;")
+
+
+def _schema_statements() -> list:
+    """Build CREATE TABLE / CREATE TRIGGER statements."""
+    statements = []
+
+    for table, (column, _) in AGGREGATE_TABLES.items():
+        statements.append(
+            f"CREATE TABLE IF NOT EXISTS {table} ("
+            f"{column} TEXT PRIMARY KEY, count INTEGER NOT NULL DEFAULT 0)"
+        )
+
+    inserts = "\n        ".join(_increment(t, c, e) for t, (c, e) in AGGREGATE_TABLES.items())
+    deletes = "\n        ".join(_decrement(t, c, e) for t, (c, e) in AGGREGATE_TABLES.items())
+
+    statements.append(f"""
+    CREATE TRIGGER IF NOT EXISTS trg_atoms_agg_insert AFTER INSERT ON atoms
+    BEGIN
+        {inserts}
+    END;""")
+
+    statements.append(f"""
+    CREATE TRIGGER IF NOT EXISTS trg_atoms_agg_delete AFTER DELETE ON atoms
+    BEGIN
+        {deletes}
+    END;""")
+
+    # Only fire when a grouped column actually changes - access_count bumps are free
+    for table, (column, expr) in AGGREGATE_TABLES.items():
+        source_col = {"type": "type", "source": "source", "day": "created"}[column]
+        statements.append(f"""
+    CREATE TRIGGER IF NOT EXISTS trg_atoms_agg_update_{column}
+    AFTER UPDATE OF {source_col} ON atoms
+    WHEN {expr.format(row='OLD')} IS NOT {expr.format(row='NEW')}
+    BEGIN
+        {_decrement(table, column, expr)}
+        {_increment(table, column, expr)}
+    END;""")
+
+    return statements
+
+
+def is_installed(conn: sqlite3.Connection) -> bool:
+    """Check whether every summary table and trigger exists.
+
+    A missing update trigger would let counts drift silently, so all of
+    them are required.
+    """
+    tables, triggers = list(AGGREGATE_TABLES), TRIGGER_NAMES
+    rows = conn.execute(f"""
+        SELECT name FROM sqlite_master
+        WHERE (type='table' AND name IN ({','.join('?' * len(tables))}))
+           OR (type='trigger' AND name IN ({','.join('?' * len(triggers))}))
+    """, tables + triggers).fetchall()
+    return len(rows) == len(tables) + len(triggers)
+
+
+def _recompute(conn: sqlite3.Connection) -> dict:
+    """Recompute exact counts from the atoms table (full scan)."""
+    result = {}
+    for table, (column, expr) in AGGREGATE_TABLES.items():
+        key = expr.format(row="atoms")
+        rows = conn.execute(f"SELECT {key}, COUNT(*) FROM atoms GROUP BY 1").fetchall()
+        result[table] = {row[0]: row[1] for row in rows}
+    return result
+
+
+def _stored(conn: sqlite3.Connection) -> dict:
+    result = {}
+    for table, (column, _) in AGGREGATE_TABLES.items():
+        rows = conn.execute(f"SELECT {column}, count FROM {table}").fetchall()
+        result[table] = {row[0]: row[1] for row in rows}
+    return result
+
+
+def _rebuild(conn: sqlite3.Connection, counts: dict):
+    for table, (column, _) in AGGREGATE_TABLES.items():
+        conn.execute(f"DELETE FROM {table}")
+        conn.executemany(
+            f"INSERT INTO {table}({column}, count) VALUES (?, ?)",
+            counts[table].items()
+        )
+
+
+def install(conn: sqlite3.Connection) -> dict:
+    """Create summary tables and triggers, then backfill exact counts.
+
+    Runs in one IMMEDIATE transaction so no insert can slip in between the
+    backfill scan and the triggers going live.
+    """
+    start = time.time()
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        for statement in _schema_statements():
+            conn.execute(statement)
+        counts = _recompute(conn)
+        _rebuild(conn, counts)
+        conn.execute("COMMIT")
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
+
+    total = sum(counts["atom_counts_by_type"].values())
+    print(f"[AGGREGATES] Installed - {total:,} atoms backfilled in {time.time() - start:.2f}s")
+    return {'installed': True, 'total_atoms': total}
+
+
+def uninstall(conn: sqlite3.Connection):
+    """Drop triggers and summary tables."""
+    for name in TRIGGER_NAMES:
+        conn.execute(f"DROP TRIGGER IF EXISTS {name}")
+    for table in AGGREGATE_TABLES:
+        conn.execute(f"DROP TABLE IF EXISTS {table}")
+    conn.commit()
+
+
+def read_aggregates(conn: sqlite3.Connection) -> Optional[dict]:
+    """Read counts from the summary tables (None if not installed)."""
+    if not is_installed(conn):
+        return None
+
+    stored = _stored(conn)
+    by_type = stored["atom_counts_by_type"]
+    return {
+        'total_atoms': sum(by_type.values()),
+        'by_type': {k or None: v for k, v in by_type.items()},
+        'by_source': {k or None: v for k, v in stored["atom_counts_by_source"].items()},
+        'by_day': {k or None: v for k, v in stored["atom_counts_by_day"].items()},
+    }
+
+
+def verify(conn: sqlite3.Connection, repair: bool = False) -> dict:
+    """Recompute aggregates and report drift against the stored tables."""
+    if not is_installed(conn):
+        return {'installed': False, 'drift': None}
+
+    conn.execute("BEGIN IMMEDIATE" if repair else "BEGIN")
+    try:
+        expected = _recompute(conn)
+        actual = _stored(conn)
+
+        drift = {}
+        for table in AGGREGATE_TABLES:
+            keys = set(expected[table]) | set(actual[table])
+            diffs = {
+                key: {'expected': expected[table].get(key, 0), 'stored': actual[table].get(key, 0)}
+                for key in keys
+                if expected[table].get(key, 0) != actual[table].get(key, 0)
+            }
+            if diffs:
+                drift[table] = diffs
+
+        repaired = False
+        if drift and repair:
+            _rebuild(conn, expected)
+            repaired = True
+        conn.execute("COMMIT")
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
+
+    return {
+        'installed': True,
+        'drift': drift,
+        'drifted_keys': sum(len(d) for d in drift.values()),
+        'repaired': repaired,
+        'timestamp': datetime.now().isoformat()
+    }
+
+
+def connect(db_path: str = DB_PATH) -> sqlite3.Connection:
+    """Open atoms.db in autocommit mode (transactions are explicit)."""
+    return sqlite3.connect(db_path, timeout=5, isolation_level=None)
+
+
+def main():
+    if len(sys.argv) < 2:
+        print(__doc__)
+        return
+
+    command = sys.argv[1]
+    conn = connect(sys.argv[2] if len(sys.argv) > 2 else DB_PATH)
+
+    if command == "install":
+        install(conn)
+    elif command == "uninstall":
+        uninstall(conn)
+        print("[AGGREGATES] Removed")
+    elif command in ("verify", "repair"):
+        report = verify(conn, repair=command == "repair")
+        if not report['installed']:
+            print("[AGGREGATES] Not installed - run 'install' first")
+        elif not report['drift']:
+            print("[AGGREGATES] OK - no drift")
+        else:
+            print(f"[AGGREGATES] DRIFT in {report['drifted_keys']} keys")
+            for table, diffs in report['drift'].items():
+                print(f"  {table}:")
+                for key, d in sorted(diffs.items()):
+                    print(f"    {key or '(none)':25} stored={d['stored']:,} expected={d['expected']:,}")
+            if report['repaired']:
+                print("[AGGREGATES] Repaired")
+    elif command == "stats":
+        stats = read_aggregates(conn)
+        if stats is None:
+            print("[AGGREGATES] Not installed")
+        else:
+            print(f"Total atoms: {stats['total_atoms']:,}")
+            for t, c in sorted(stats['by_type'].items(), key=lambda x: x[1], reverse=True):
+                print(f"  {t or '(none)':12} {c:,}")
+    else:
+        print(f"Unknown command: {command}")
+
+    conn.close()
+
+
+if __name__ == "__main__":
+    main()
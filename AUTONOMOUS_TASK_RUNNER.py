@@ -3,10 +3,17 @@
 AUTONOMOUS TASK RUNNER
 Runs tasks through the brain agent pipeline with Cyclotron integration.
 The autonomous execution engine for C2's brain.
+
+Queued tasks live in a SQLite priority queue (TASK_QUEUE.py) and are
+drained by a pool of workers; several runners on one box can process
+the same queue. Legacy JSON task files are imported on first use.
 """
 
 import json
+import os
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 from typing import Optional, List
@@ -14,6 +21,7 @@ from typing import Optional, List
 # Import our systems
 from ADVANCED_BRAIN_AGENTS import AdvancedOrchestrator
 from CYCLOTRON_BRAIN_BRIDGE import CyclotronBridge
+from TASK_QUEUE import TaskQueue, QueueWorkerPool, PRIORITIES
 
 # Paths
 HOME = Path.home()
@@ -24,22 +32,33 @@ RESULTS_PATH = CONSCIOUSNESS / "task_results"
 TASKS_PATH.mkdir(parents=True, exist_ok=True)
 RESULTS_PATH.mkdir(parents=True, exist_ok=True)
 
+# Concurrent brain pipelines per runner (environment overridable)
+RUNNER_WORKERS = int(os.environ.get("RUNNER_WORKERS", 4))
+
 
 class AutonomousRunner:
     """Autonomous task execution with full brain integration."""
 
-    def __init__(self):
+    def __init__(self, workers: int = RUNNER_WORKERS):
         self.orchestrator = AdvancedOrchestrator()
         self.cyclotron = CyclotronBridge()
+        self.queue = TaskQueue()
+        self.workers = max(1, workers)
         self.execution_log = []
+        self._cyclotron_lock = threading.Lock()  # CyclotronBridge rewrites INDEX.json
+        self._import_json_tasks()
 
-    def run_task(self, task: str, mode: str = "advanced") -> dict:
+    def run_task(self, task: str, mode: str = "advanced", task_id: Optional[int] = None,
+                 store: bool = True) -> dict:
         """
         Run a task through the brain pipeline.
 
         Args:
             task: Task description
             mode: "quick", "research", or "advanced" (default)
+            task_id: Queue id, when run from the task queue
+            store: Write the outputs to Cyclotron; False leaves that to the
+                   caller (e.g. to batch many tasks into one index write)
 
         Returns:
             Complete execution result
@@ -60,19 +79,30 @@ class AutonomousRunner:
         else:
             state = self.orchestrator.run_advanced(task)
 
-        # Store results in Cyclotron
-        print("\nStoring results in Cyclotron...")
-        atoms = self.cyclotron.store_agent_output(
-            agent_name="autonomous_runner",
-            task=task,
-            outputs=state.outputs,
-            decisions=state.decisions,
-            memory=state.memory
-        )
+        # Store results in Cyclotron - once per queued task: a retried lease
+        # reuses the atoms (and result file) of the attempt that stored them
+        previous = self._stored_result(task_id)
+        if not store:
+            atom_ids = []
+        elif previous is not None:
+            print(f"\nTask #{task_id} already stored in Cyclotron, skipping")
+            atom_ids = previous.get("atom_ids", [])
+        else:
+            print("\nStoring results in Cyclotron...")
+            with self._cyclotron_lock:
+                atoms = self.cyclotron.store_agent_output(
+                    agent_name="autonomous_runner",
+                    task=task,
+                    outputs=state.outputs,
+                    decisions=state.decisions,
+                    memory=state.memory
+                )
+            atom_ids = [atom.id for atom in atoms]
 
         # Create result report
         result = {
             "task": task,
+            "task_id": task_id,
             "mode": mode,
             "status": state.status,
             "timestamp": datetime.now().isoformat(),
@@ -87,14 +117,20 @@ class AutonomousRunner:
                 "knowledge_entities": len(state.context.get("knowledge", {}).get("entities", [])),
                 "related_memories": len(state.context.get("related_memories", []))
             },
-            "atoms_created": len(atoms),
+            "atoms_created": len(atom_ids),
+            "atom_ids": atom_ids,
             "agent_sequence": state.context.get("agent_sequence", [])
         }
 
         # Save result
-        result_file = RESULTS_PATH / f"result_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+        if previous is not None:
+            result_file = Path(previous["result_file"])
+        else:
+            suffix = f"task{task_id}" if task_id is not None else datetime.now().strftime('%f')
+            result_file = RESULTS_PATH / f"result_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{suffix}.json"
         with open(result_file, 'w') as f:
             json.dump(result, f, indent=2)
+        result["result_file"] = str(result_file)
 
         # Log execution
         self.execution_log.append({
@@ -109,6 +145,21 @@ class AutonomousRunner:
 
         return result
 
+    @staticmethod
+    def _stored_result(task_id: Optional[int]) -> Optional[dict]:
+        """Result an earlier attempt of a queued task already saved, if any."""
+        if task_id is None:
+            return None
+        for result_file in RESULTS_PATH.glob(f"result_*_task{task_id}.json"):
+            try:
+                with open(result_file) as f:
+                    previous = json.load(f)
+            except (OSError, ValueError):
+                continue
+            previous["result_file"] = str(result_file)
+            return previous
+        return None
+
     def _print_summary(self, result: dict):
         """Print execution summary."""
         print("\n" + "=" * 60)
@@ -138,18 +189,17 @@ class AutonomousRunner:
             syn = result['context']['synthesis']
             print(f"\nSynthesis: {syn.get('summary', 'N/A')}")
 
-    def run_batch(self, tasks: List[str], mode: str = "advanced") -> List[dict]:
-        """Run multiple tasks."""
-        results = []
+    def run_batch(self, tasks: List[str], mode: str = "advanced",
+                  workers: Optional[int] = None) -> List[dict]:
+        """Run multiple tasks, up to `workers` at a time; results keep task order."""
+        workers = min(workers or self.workers, max(1, len(tasks)))
 
         print("\n" + "=" * 60)
-        print(f"BATCH EXECUTION: {len(tasks)} tasks")
+        print(f"BATCH EXECUTION: {len(tasks)} tasks ({workers} workers)")
         print("=" * 60)
 
-        for i, task in enumerate(tasks, 1):
-            print(f"\n[{i}/{len(tasks)}] Running task...")
-            result = self.run_task(task, mode)
-            results.append(result)
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="batch") as pool:
+            results = list(pool.map(lambda task: self.run_task(task, mode), tasks))
 
         # Batch summary
         print("\n" + "=" * 60)
@@ -160,72 +210,78 @@ class AutonomousRunner:
 
         return results
 
-    def queue_task(self, task: str, priority: str = "normal", mode: str = "advanced"):
-        """Add task to queue for later execution."""
-        task_data = {
-            "task": task,
-            "priority": priority,
-            "mode": mode,
-            "queued_at": datetime.now().isoformat(),
-            "status": "pending"
-        }
-
-        task_file = TASKS_PATH / f"task_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        with open(task_file, 'w') as f:
-            json.dump(task_data, f, indent=2)
-
-        print(f"Queued task: {task[:50]}...")
-        return task_file
-
-    def process_queue(self) -> List[dict]:
-        """Process all queued tasks."""
-        results = []
-
-        # Get pending tasks
-        task_files = sorted(TASKS_PATH.glob("*.json"))
-
-        pending = []
-        for tf in task_files:
-            with open(tf) as f:
-                task_data = json.load(f)
-            if task_data.get("status") == "pending":
-                pending.append((tf, task_data))
-
-        if not pending:
-            print("No pending tasks in queue")
-            return results
-
-        # Sort by priority
-        priority_order = {"urgent": 0, "high": 1, "normal": 2, "low": 3}
-        pending.sort(key=lambda x: priority_order.get(x[1].get("priority", "normal"), 2))
-
-        print(f"\nProcessing {len(pending)} queued tasks...")
-
-        for task_file, task_data in pending:
-            result = self.run_task(task_data["task"], task_data.get("mode", "advanced"))
-            results.append(result)
-
-            # Update task status
-            task_data["status"] = "completed"
-            task_data["completed_at"] = datetime.now().isoformat()
+    def queue_task(self, task: str, priority: str = "normal", mode: str = "advanced") -> int:
+        """Add task to the durable queue for later execution; returns its id."""
+        if priority not in PRIORITIES:
+            raise ValueError(f"Unknown priority: {priority} (use {', '.join(PRIORITIES)})")
+        task_id = self.queue.enqueue(task, priority=priority, mode=mode)
+        print(f"Queued task #{task_id} [{priority}]: {task[:50]}...")
+        return task_id
+
+    def _import_json_tasks(self) -> int:
+        """Move pending tasks from the old JSON-file queue into SQLite."""
+        imported = 0
+        for task_file in sorted(TASKS_PATH.glob("*.json")):
+            try:
+                with open(task_file) as f:
+                    task_data = json.load(f)
+            except (OSError, ValueError):
+                continue
+            if task_data.get("status") != "pending":
+                continue
+
+            # Keyed on the file name, so runners importing concurrently
+            # (or re-importing after a crash) add the task only once
+            task_data["queue_id"] = self.queue.enqueue(
+                task_data["task"],
+                priority=task_data.get("priority", "normal"),
+                mode=task_data.get("mode", "advanced"),
+                source_key=f"json:{task_file.name}"
+            )
+            task_data["status"] = "migrated"
             with open(task_file, 'w') as f:
                 json.dump(task_data, f, indent=2)
+            imported += 1
+
+        if imported:
+            print(f"Imported {imported} pending JSON tasks into the task queue")
+        return imported
+
+    def _handle_queued(self, task: dict) -> str:
+        """QueueWorkerPool handler: run one leased task, return its result file."""
+        if task["attempts"] > 1:
+            print(f"Retrying task #{task['id']} (attempt {task['attempts']}/{task['max_attempts']})")
+        result = self.run_task(task["task"], task["mode"], task_id=task["id"])
+        if result["status"] != "complete":
+            raise RuntimeError(f"pipeline finished with status {result['status']}")
+        return result["result_file"]
+
+    def process_queue(self, workers: Optional[int] = None, follow: bool = False) -> List[dict]:
+        """
+        Drain the task queue with a worker pool. Safe to run from several
+        processes at once. follow=True keeps polling for new tasks until
+        interrupted.
+        """
+        pending = self.queue.pending_count()
+        if not pending and not follow:
+            print("No pending tasks in queue")
+            return []
 
-        return results
+        pool = QueueWorkerPool(self.queue, self._handle_queued, workers=workers or self.workers)
+        print(f"\nProcessing {pending} queued tasks with {pool.workers} workers...")
+        outcomes = pool.run(drain=not follow)
+
+        completed = sum(1 for o in outcomes if o["outcome"] == "completed")
+        print(f"\nQueue pass done: {completed}/{len(outcomes)} completed")
+        for o in outcomes:
+            if o["outcome"] != "completed":
+                print(f"  #{o['id']} {o['outcome']}: {o['error']}")
+        return outcomes
 
     def get_status(self) -> dict:
         """Get runner status."""
         # Count tasks
-        pending = 0
-        completed = 0
-
-        for tf in TASKS_PATH.glob("*.json"):
-            with open(tf) as f:
-                data = json.load(f)
-            if data.get("status") == "pending":
-                pending += 1
-            else:
-                completed += 1
+        depth = self.queue.get_stats()["depth"]
 
         # Count results
         results = len(list(RESULTS_PATH.glob("*.json")))
@@ -234,8 +290,10 @@ class AutonomousRunner:
         cyclotron_status = self.cyclotron.get_status()
 
         return {
-            "pending_tasks": pending,
-            "completed_tasks": completed,
+            "pending_tasks": depth["pending"],
+            "running_tasks": depth["leased"],
+            "completed_tasks": depth["completed"],
+            "failed_tasks": depth["failed"],
             "total_results": results,
             "executions_this_session": len(self.execution_log),
             "cyclotron_atoms": cyclotron_status["total_atoms"],
@@ -283,7 +341,10 @@ def main():
         print("  quick <task>         - Run task in quick mode")
         print("  research <task>      - Run task in research mode")
         print("  queue <task>         - Queue task for later")
-        print("  process              - Process queued tasks")
+        print("  queue-high <task>    - Queue task with high priority")
+        print("  process [workers]    - Process queued tasks")
+        print("  worker [workers]     - Keep processing the queue until Ctrl+C")
+        print("  stats                - Queue latency and throughput")
         print("  status               - Show runner status")
         print("  demo                 - Run demo")
 
@@ -314,8 +375,21 @@ def main():
         task = " ".join(sys.argv[2:])
         runner.queue_task(task)
 
+    elif command == "queue-high" and len(sys.argv) >= 3:
+        task = " ".join(sys.argv[2:])
+        runner.queue_task(task, priority="high")
+
     elif command == "process":
-        runner.process_queue()
+        workers = int(sys.argv[2]) if len(sys.argv) >= 3 else None
+        runner.process_queue(workers)
+
+    elif command == "worker":
+        workers = int(sys.argv[2]) if len(sys.argv) >= 3 else None
+        runner.process_queue(workers, follow=True)
+
+    elif command == "stats":
+        print("\nTask Queue Stats:")
+        print(json.dumps(runner.queue.get_stats(), indent=2))
 
     elif command == "status":
         status = runner.get_status()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+BENCH STATS - Shared timing + reporting helpers for the benchmark suites.
+Latency percentiles, throughput and a stable JSON envelope so runs can be
+diffed against each other.
+"""
+
+import json
+import math
+import platform
+import sqlite3
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, List
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile over an already-sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, math.ceil(pct / 100 * len(sorted_values)) - 1))
+    return sorted_values[rank]
+
+
+def summarize(samples_ms: List[float], ops_per_sample: int = 1) -> dict:
+    """Reduce raw latency samples (ms) to p50/p95/p99 + throughput."""
+    ordered = sorted(samples_ms)
+    total_ms = sum(ordered)
+    return {
+        'n': len(ordered),
+        'p50_ms': round(percentile(ordered, 50), 4),
+        'p95_ms': round(percentile(ordered, 95), 4),
+        'p99_ms': round(percentile(ordered, 99), 4),
+        'mean_ms': round(total_ms / len(ordered), 4) if ordered else 0.0,
+        'max_ms': round(ordered[-1], 4) if ordered else 0.0,
+        'throughput_ops_s': round(len(ordered) * ops_per_sample / (total_ms / 1000), 1) if total_ms else 0.0
+    }
+
+
+def measure(fn: Callable, iterations: int, warmup: int = 3,
+            ops_per_call: int = 1, args_fn: Callable = None) -> dict:
+    """Time `fn` over `iterations` calls.
+
+    args_fn(i) supplies per-iteration arguments so lookups don't all hit the
+    same key. Warmup calls are excluded from the samples.
+    """
+    for i in range(warmup):
+        fn(*(args_fn(i) if args_fn else ()))
+
+    samples = []
+    for i in range(iterations):
+        args = args_fn(i) if args_fn else ()
+        start = time.perf_counter()
+        fn(*args)
+        samples.append((time.perf_counter() - start) * 1000)
+
+    return summarize(samples, ops_per_call)
+
+
+def environment() -> dict:
+    """Host details recorded with every run for apples-to-apples comparison."""
+    return {
+        'python': sys.version.split()[0],
+        'sqlite': sqlite3.sqlite_version,
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'processor': platform.processor()
+    }
+
+
+def write_report(suite: str, config: dict, results: dict, out_path: Path = None) -> dict:
+    """Wrap results in the standard envelope and optionally save to disk."""
+    report = {
+        'suite': suite,
+        'timestamp': datetime.now().isoformat(),
+        'environment': environment(),
+        'config': config,
+        'results': results
+    }
+    if out_path:
+        out_path = Path(out_path)
+        out_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(out_path, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"[BENCH] Results saved to: {out_path}")
+    return report
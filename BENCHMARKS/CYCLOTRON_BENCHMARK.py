@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+"""
+CYCLOTRON BENCHMARK - Measured (not assumed) numbers for the atoms stack
+Runs the real query paths against deterministic synthetic databases.
+
+Suites:
+- cache:     AtomCache.get (cold / hot / Zipf mix), batch_get, search
+- optimizer: DatabaseOptimizer.SAMPLE_QUERIES before and after create_indices,
+             get_database_stats with and without ATOM_AGGREGATES
+- search:    CYCLOTRON_SEARCH_V2 endpoint functions (search, ask, stats, recent, file)
+
+Usage:
+    python BENCHMARKS/CYCLOTRON_BENCHMARK.py [10k] [100k] [1m]
+        [--out results.json] [--seed 42] [--iterations 200] [--workdir DIR]
+        [--suites cache,optimizer,search]
+
+Output: JSON with p50/p95/p99 latency and throughput per operation.
+"""
+
+import random
+import shutil
+import sqlite3
+import sys
+import tempfile
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).resolve().parent
+ROOT_DIR = BENCH_DIR.parent
+sys.path.insert(0, str(ROOT_DIR))
+sys.path.insert(0, str(BENCH_DIR))
+
+from BENCH_STATS import measure, write_report
+from SYNTHETIC_ATOMS import (
+    VOCABULARY, atom_ids, build_atoms_db, build_knowledge_db, parse_scale
+)
+
+DEFAULT_SCALES = ['10k']
+DEFAULT_ITERATIONS = 200
+DEFAULT_SUITES = ['cache', 'optimizer', 'search']
+DEFAULT_WORKDIR = Path(tempfile.gettempdir()) / "cyclotron_bench"
+
+# Documents in the FTS index relative to atoms (1M atoms -> 100k files)
+DOCS_PER_ATOM = 0.1
+
+
+def _zipf_ids(rng: random.Random, ids: list, n: int, s: float = 1.1) -> list:
+    """Draw n ids with a Zipf-like popularity skew (few hot atoms, long tail)."""
+    weights = [1 / (rank + 1) ** s for rank in range(len(ids))]
+    shuffled = list(ids)
+    rng.shuffle(shuffled)
+    return rng.choices(shuffled, weights=weights, k=n)
+
+
+# ============================================================================
+# SUITES
+# ============================================================================
+
+def bench_cache(atoms_db: Path, count: int, workdir: Path, iterations: int, seed: int) -> dict:
+    """AtomCache over the synthetic atoms.db."""
+    import CACHING_LAYER
+
+    cache_dir = workdir / "cache"
+    shutil.rmtree(cache_dir, ignore_errors=True)
+    cache_dir.mkdir(parents=True)
+    CACHING_LAYER.DB_PATH = str(atoms_db)
+    CACHING_LAYER.CACHE_DIR = cache_dir
+
+    cache = CACHING_LAYER.AtomCache()
+    rng = random.Random(seed)
+    ids = atom_ids(count)
+    results = {}
+
+    # Cold: every id is new -> database + filesystem write
+    cold_ids = rng.sample(ids, min(iterations, count))
+    results['get_cold'] = measure(cache.get, len(cold_ids), warmup=0,
+                                  args_fn=lambda i: (cold_ids[i],))
+
+    # Hot: a handful of ids already promoted to memory
+    hot_ids = cold_ids[:16]
+    results['get_hot'] = measure(cache.get, iterations,
+                                 args_fn=lambda i: (hot_ids[i % len(hot_ids)],))
+
+    # Zipf mix from a clean cache - checks the "60% memory hits" assumption
+    cache.clear_cache()
+    mix = _zipf_ids(rng, ids, iterations * 10)
+    results['get_zipf'] = measure(cache.get, len(mix), warmup=0, args_fn=lambda i: (mix[i],))
+    stats = cache.get_stats()
+    total = stats['total_requests'] or 1
+    results['get_zipf']['hit_rates'] = {
+        'memory': round(stats['memory_hits'] / total * 100, 1),
+        'filesystem': round(stats['filesystem_hits'] / total * 100, 1),
+        'database': round(stats['database_hits'] / total * 100, 1),
+    }
+
+    batches = [rng.sample(ids, min(100, count)) for _ in range(max(1, iterations // 10))]
+    results['batch_get_100'] = measure(cache.batch_get, len(batches), warmup=0,
+                                       ops_per_call=100, args_fn=lambda i: (batches[i],))
+
+    terms = [f"{rng.choice(VOCABULARY)}" for _ in range(max(1, iterations // 10))]
+    results['search_cold'] = measure(cache.search, len(terms), warmup=0,
+                                     args_fn=lambda i: (f"{terms[i]} {i}",))
+    results['search_cached'] = measure(cache.search, iterations,
+                                       args_fn=lambda i: (terms[i % len(terms)],))
+
+    cache.clear_cache()
+    return results
+
+
+def bench_optimizer(atoms_db: Path, workdir: Path, iterations: int) -> dict:
+    """DatabaseOptimizer sample queries, unindexed vs indexed."""
+    import DATABASE_OPTIMIZATION
+    import ATOM_AGGREGATES
+
+    # Work on a copy - indices/aggregates must not leak into the cached base db
+    work_db = workdir / "optimizer_atoms.db"
+    shutil.copy(atoms_db, work_db)
+    DATABASE_OPTIMIZATION.DB_PATH = work_db
+
+    optimizer = DATABASE_OPTIMIZATION.DatabaseOptimizer()
+    query_iterations = max(3, iterations // 20)
+    results = {}
+
+    def run_queries(label: str):
+        for query, name in optimizer.SAMPLE_QUERIES:
+            results[f"{label}.{name}"] = measure(
+                lambda q=query: optimizer.conn.execute(q).fetchall(), query_iterations, warmup=1
+            )
+
+    run_queries('unindexed')
+    results['get_database_stats.scan'] = measure(optimizer.get_database_stats, query_iterations, warmup=1)
+
+    optimizer.create_indices()
+    optimizer.conn.execute("ANALYZE")
+    run_queries('indexed')
+
+    ATOM_AGGREGATES.install(optimizer.conn)
+    results['get_database_stats.aggregates'] = measure(optimizer.get_database_stats, iterations)
+
+    optimizer.close()
+    for suffix in ('', '-wal', '-shm'):
+        Path(str(work_db) + suffix).unlink(missing_ok=True)
+    return results
+
+
+def bench_search(knowledge_db: Path, iterations: int, seed: int, doc_count: int) -> dict:
+    """CYCLOTRON_SEARCH_V2 endpoint functions inside a request context."""
+    import CYCLOTRON_SEARCH_V2 as search_api
+
+    search_api.DB_PATH = knowledge_db
+    app = search_api.app
+    rng = random.Random(seed)
+    results = {}
+
+    def call(view, url):
+        with app.test_request_context(url):
+            response = view()
+            if isinstance(response, tuple):
+                response = response[0]
+            return response.get_data()
+
+    words = [rng.choice(VOCABULARY) for _ in range(iterations)]
+    pairs = [f"{rng.choice(VOCABULARY)}+{rng.choice(VOCABULARY)}" for _ in range(iterations)]
+    paths = []
+    conn = sqlite3.connect(str(knowledge_db))
+    for rowid in rng.sample(range(1, doc_count + 1), min(iterations, doc_count)):
+        row = conn.execute("SELECT path FROM knowledge WHERE rowid = ?", (rowid,)).fetchone()
+        if row:
+            paths.append(row[0])
+    conn.close()
+
+    results['api_search'] = measure(
+        lambda u: call(search_api.api_search, u), iterations,
+        args_fn=lambda i: (f"/api/search?q={words[i]}",))
+    results['api_search_two_terms'] = measure(
+        lambda u: call(search_api.api_search, u), iterations,
+        args_fn=lambda i: (f"/api/search?q={pairs[i]}",))
+    results['api_ask'] = measure(
+        lambda u: call(search_api.api_ask, u), iterations,
+        args_fn=lambda i: (f"/api/ask?q=what+do+i+know+about+{words[i]}",))
+    results['api_stats'] = measure(
+        lambda: call(search_api.api_stats, "/api/stats"), max(3, iterations // 10))
+    results['api_recent'] = measure(
+        lambda: call(search_api.api_recent, "/api/recent?limit=20"), max(3, iterations // 10))
+    if paths:
+        results['api_file'] = measure(
+            lambda u: call(search_api.api_file, u), len(paths),
+            args_fn=lambda i: (f"/api/file?path={paths[i % len(paths)]}",))
+    return results
+
+
+# ============================================================================
+# RUNNER
+# ============================================================================
+
+def run(scales: list = None, suites: list = None, iterations: int = DEFAULT_ITERATIONS,
+        seed: int = 42, workdir: Path = DEFAULT_WORKDIR, out_path: Path = None) -> dict:
+    """Run the selected suites at each scale and return the JSON report."""
+    scales = scales or DEFAULT_SCALES
+    suites = suites or DEFAULT_SUITES
+    workdir = Path(workdir)
+    workdir.mkdir(parents=True, exist_ok=True)
+
+    results = {}
+    for scale in scales:
+        count = parse_scale(scale)
+        doc_count = max(1000, int(count * DOCS_PER_ATOM))
+        print(f"\n[BENCH] Scale {scale}: {count:,} atoms, {doc_count:,} documents")
+
+        atoms_db = build_atoms_db(workdir / f"atoms_{count}_{seed}.db", count, seed)
+        knowledge_db = None
+        if 'search' in suites:
+            knowledge_db = build_knowledge_db(workdir / f"cyclotron_{doc_count}_{seed}.db", doc_count, seed)
+
+        scale_results = {'atoms': count, 'documents': doc_count}
+        for suite in suites:
+            print(f"[BENCH]   {suite}...")
+            try:
+                if suite == 'cache':
+                    scale_results[suite] = bench_cache(atoms_db, count, workdir, iterations, seed)
+                elif suite == 'optimizer':
+                    scale_results[suite] = bench_optimizer(atoms_db, workdir, iterations)
+                elif suite == 'search':
+                    scale_results[suite] = bench_search(knowledge_db, iterations, seed, doc_count)
+                else:
+                    scale_results[suite] = {'skipped': f"unknown suite '{suite}'"}
+            except ImportError as e:
+                # Suite depends on an optional package (e.g. flask) - record and move on
+                scale_results[suite] = {'skipped': str(e)}
+                print(f"[BENCH]   {suite} skipped: {e}")
+
+        results[str(scale)] = scale_results
+
+    config = {'scales': [str(s) for s in scales], 'suites': suites,
+              'iterations': iterations, 'seed': seed}
+    return write_report('cyclotron', config, results, out_path)
+
+
+def _print_summary(report: dict):
+    for scale, suites in report['results'].items():
+        print(f"\n=== {scale} ===")
+        for suite, ops in suites.items():
+            if not isinstance(ops, dict):
+                continue
+            if 'skipped' in ops:
+                print(f"  {suite}: skipped ({ops['skipped']})")
+                continue
+            print(f"  {suite}:")
+            for name, stats in ops.items():
+                print(f"    {name:40} p50={stats['p50_ms']:>9.3f}ms  p95={stats['p95_ms']:>9.3f}ms  "
+                      f"p99={stats['p99_ms']:>9.3f}ms  {stats['throughput_ops_s']:>10,.0f} ops/s")
+
+
+def main():
+    args = sys.argv[1:]
+    options = {'--out': None, '--seed': '42', '--iterations': str(DEFAULT_ITERATIONS),
+               '--workdir': str(DEFAULT_WORKDIR), '--suites': ','.join(DEFAULT_SUITES)}
+    scales = []
+
+    i = 0
+    while i < len(args):
+        if args[i] in options:
+            options[args[i]] = args[i + 1]
+            i += 2
+        elif args[i] in ('-h', '--help'):
+            print(__doc__)
+            return
+        else:
+            scales.append(args[i])
+            i += 1
+
+    report = run(
+        scales=scales or DEFAULT_SCALES,
+        suites=options['--suites'].split(','),
+        iterations=int(options['--iterations']),
+        seed=int(options['--seed']),
+        workdir=Path(options['--workdir']),
+        out_path=Path(options['--out']) if options['--out'] else None
+    )
+    _print_summary(report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+PATTERN DETECTOR BENCHMARK - Combined-regex scan vs per-indicator findall
+Times PATTERN_DETECTOR.PatternDetector.analyze against the original
+one-re.findall-per-indicator loop on synthetic texts from 1KB to 1MB.
+
+What it shows:
+- analyze() output is identical to the legacy loop (verified every size)
+- one combined scan scales with text size, not text size x indicators
+
+Usage:
+    python BENCHMARKS/PATTERN_DETECTOR_BENCHMARK.py [1k 10k 100k 1m]
+        [--iterations 20] [--out results.json]
+"""
+
+import random
+import re
+import sys
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).resolve().parent
+ROOT_DIR = BENCH_DIR.parent
+sys.path.insert(0, str(ROOT_DIR))
+sys.path.insert(0, str(BENCH_DIR))
+
+from BENCH_STATS import measure, write_report
+from PATTERN_DETECTOR import MANIPULATION_PATTERNS, PatternDetector
+
+SIZES = {'1k': 1_000, '10k': 10_000, '100k': 100_000, '1m': 1_000_000}
+
+FILLER = (
+    "the meeting moved to thursday and we still need the budget numbers "
+    "she said the garden looks great this year and the kids loved the trip "
+    "please send the notes from the call when you get a chance thanks "
+).split()
+
+PHRASES = [
+    "you're overreacting", "that never happened", "you owe me", "act now",
+    "only 3 left", "limited time", "experts say", "poor me", "just wait",
+    "whatever", "everyone agrees", "i talked to mom and they said", "next year",
+    "we're soulmates", "before it's too late", "you're so selfish",
+]
+
+
+def synthetic_text(size: int, seed: int = 42, density: float = 0.02) -> str:
+    """Mostly neutral words with manipulation phrases mixed in at `density`."""
+    rng = random.Random(seed)
+    words, length = [], 0
+    while length < size:
+        word = rng.choice(PHRASES) if rng.random() < density else rng.choice(FILLER)
+        words.append(word)
+        length += len(word) + 1
+    return " ".join(words)[:size]
+
+
+def legacy_detections(text: str) -> list:
+    """The original per-indicator re.findall loop (reference output)."""
+    text_lower = text.lower()
+    detections = []
+    for pattern_name, pattern_data in MANIPULATION_PATTERNS.items():
+        matches = []
+        for indicator in pattern_data["indicators"]:
+            found = re.findall(indicator, text_lower, re.IGNORECASE)
+            if found:
+                matches.extend(found)
+        if matches:
+            severity_scores = {"low": 1, "medium": 2, "high": 3}
+            detections.append({
+                "pattern": pattern_name,
+                "domain": pattern_data["domain"],
+                "severity": pattern_data["severity"],
+                "matches": len(matches),
+                "examples": matches[:3],
+                "description": pattern_data["description"],
+                "score": severity_scores.get(pattern_data["severity"], 1) * len(matches)
+            })
+    return sorted(detections, key=lambda x: x["score"], reverse=True)
+
+
+def verify(detector: PatternDetector, text: str) -> bool:
+    """analyze() detections must match the legacy loop exactly."""
+    return detector.analyze(text)["detections"] == legacy_detections(text)
+
+
+def run(sizes=('1k', '10k', '100k', '1m'), iterations: int = 20,
+        seed: int = 42, out_path: Path = None) -> dict:
+    detector = PatternDetector()
+    results = {}
+
+    for label in sizes:
+        text = synthetic_text(SIZES[label], seed)
+        n = max(3, iterations * 1000 // SIZES[label]) if SIZES[label] > 1000 else iterations
+
+        # Regression check first - a fast wrong answer is not a result
+        identical = verify(detector, text)
+        detector.detection_history.clear()
+
+        legacy = measure(legacy_detections, n, warmup=1, args_fn=lambda i: (text,))
+        combined = measure(detector.analyze, n, warmup=1, args_fn=lambda i: (text,))
+        detector.detection_history.clear()
+
+        results[label] = {
+            'chars': len(text),
+            'identical': identical,
+            'matches': len(detector.find_matches(text)),
+            'legacy': legacy,
+            'combined': combined,
+            'speedup': round(legacy['p50_ms'] / combined['p50_ms'], 2) if combined['p50_ms'] else 0.0
+        }
+
+    config = {'sizes': list(sizes), 'iterations': iterations, 'seed': seed,
+              'indicators': sum(len(p["indicators"]) for p in MANIPULATION_PATTERNS.values())}
+    return write_report('pattern_detector', config, results, out_path)
+
+
+def main():
+    args = sys.argv[1:]
+    sizes = [a for a in args if a in SIZES] or list(SIZES)
+    options = {'--iterations': '20', '--out': None}
+    for flag, value in zip(args, args[1:]):
+        if flag in options:
+            options[flag] = value
+
+    report = run(
+        sizes=sizes,
+        iterations=int(options['--iterations']),
+        out_path=Path(options['--out']) if options['--out'] else None
+    )
+    print(f"\n[PATTERN DETECTOR] {report['config']['indicators']} indicators")
+    for label, r in report['results'].items():
+        print(f"  {label:>5}: legacy p50 {r['legacy']['p50_ms']:.2f}ms  "
+              f"combined p50 {r['combined']['p50_ms']:.2f}ms  "
+              f"x{r['speedup']}  matches {r['matches']:,}  "
+              f"{'identical' if r['identical'] else 'MISMATCH'}")
+
+    if not all(r['identical'] for r in report['results'].values()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+PATTERN SCORING BENCHMARK - Per-item vs NumPy batch scoring
+Compares ConsciousnessScorer.score / SevenDomainsAnalyzer.analyze called
+once per item with score_batch / analyze_batch over the same cohort.
+
+What it shows:
+- batch columns match the per-item results (verified before timing)
+- consciousness scoring: per-item dataclasses vs one array pass
+- seven domains: per-text analyze() vs marker_counts() + analyze_batch(),
+  and analyze_batch() alone on a precomputed count matrix
+
+Usage:
+    python BENCHMARKS/PATTERN_SCORING_BENCHMARK.py [--items 100000]
+        [--out results.json]
+"""
+
+import random
+import sys
+import time
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).resolve().parent
+ROOT_DIR = BENCH_DIR.parent
+ENGINE_DIR = ROOT_DIR / "PATTERN_THEORY_ENGINE"
+sys.path.insert(0, str(ENGINE_DIR / "core"))
+sys.path.insert(0, str(ENGINE_DIR / "projection"))
+sys.path.insert(0, str(BENCH_DIR))
+
+from BENCH_STATS import write_report
+import CONSCIOUSNESS_SCORER
+from CONSCIOUSNESS_SCORER import ConsciousnessScorer
+from SEVEN_DOMAINS_ANALYZER import SevenDomainsAnalyzer
+
+FILLER = "we talked about the plan for next week and what comes after".split()
+
+
+def cohort(n: int, seed: int) -> list:
+    rng = random.Random(seed)
+    return [(rng.uniform(0, 100), rng.uniform(0, 100), rng.uniform(0, 100)) for _ in range(n)]
+
+
+def corpus(n: int, seed: int) -> list:
+    """Short texts mixing filler with a few random domain markers."""
+    rng = random.Random(seed)
+    markers = [m for info in SevenDomainsAnalyzer.DOMAINS.values() for m in info["markers"]]
+    return [" ".join(rng.sample(FILLER, 6) + rng.sample(markers, rng.randint(0, 8)))
+            for _ in range(n)]
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, (time.perf_counter() - start) * 1000
+
+
+def verify_consciousness(scorer, values, columns) -> bool:
+    for i, (pr, pa, ns) in enumerate(values):
+        r = scorer.score(pr, pa, ns)
+        if str(columns["level_name"][i]) != r.level_name:
+            return False
+        # np.round and round() may disagree by one unit in the last place
+        for key in ("consciousness_level", "manipulation_immunity"):
+            if abs(float(columns[key][i]) - getattr(r, key)) > 0.0100001:
+                return False
+    return True
+
+
+def verify_domains(analyzer, texts, columns) -> bool:
+    for i, text in enumerate(texts):
+        r = analyzer.analyze(text)
+        if (r.balance_score != float(columns["balance_score"][i])
+                or r.weakest_domain != str(columns["weakest_domain"][i])
+                or r.strongest_domain != str(columns["strongest_domain"][i])
+                or any(r.domains[k].score != int(columns["domain_scores"][k][i]) for k in analyzer.DOMAINS)):
+            return False
+    return True
+
+
+def run(items: int = 100_000, seed: int = 42, verify_sample: int = 2000, out_path: Path = None) -> dict:
+    scorer = ConsciousnessScorer()
+    analyzer = SevenDomainsAnalyzer()
+    values = cohort(items, seed)
+    texts = corpus(items, seed)
+    pr, pa, ns = (list(col) for col in zip(*values))
+
+    # Consciousness: per-item dataclasses vs columns
+    def per_item_scores():
+        results = [scorer.score(*v) for v in values]
+        scorer.history.clear()
+        return results
+
+    _, consciousness_item_ms = timed(per_item_scores)
+    columns, consciousness_batch_ms = timed(scorer.score_batch, pr, pa, ns)
+    consciousness_ok = verify_consciousness(scorer, values[:verify_sample], columns)
+    scorer.history.clear()
+
+    # Seven domains: per-text analyze vs count matrix + batch
+    _, domains_item_ms = timed(lambda: [analyzer.analyze(t) for t in texts])
+    counts, counts_ms = timed(analyzer.marker_counts, texts)
+    domain_columns, domains_batch_ms = timed(analyzer.analyze_batch, counts)
+    domains_ok = verify_domains(analyzer, texts[:verify_sample], domain_columns)
+
+    results = {
+        'numpy': CONSCIOUSNESS_SCORER.np is not None,
+        'consciousness': {
+            'per_item_ms': round(consciousness_item_ms, 2),
+            'batch_ms': round(consciousness_batch_ms, 2),
+            'speedup': round(consciousness_item_ms / consciousness_batch_ms, 1) if consciousness_batch_ms else 0.0,
+            'identical': consciousness_ok
+        },
+        'seven_domains': {
+            'per_item_ms': round(domains_item_ms, 2),
+            'marker_counts_ms': round(counts_ms, 2),
+            'batch_ms': round(domains_batch_ms, 2),
+            'speedup_end_to_end': round(domains_item_ms / (counts_ms + domains_batch_ms), 1),
+            'speedup_scoring_only': round((domains_item_ms - counts_ms) / domains_batch_ms, 1) if domains_batch_ms else 0.0,
+            'identical': domains_ok
+        }
+    }
+    config = {'items': items, 'seed': seed, 'verify_sample': verify_sample}
+    return write_report('pattern_scoring', config, results, out_path)
+
+
+def main():
+    args = sys.argv[1:]
+    options = {'--items': '100000', '--out': None}
+    for flag, value in zip(args[::2], args[1::2]):
+        if flag in options:
+            options[flag] = value
+
+    report = run(
+        items=int(options['--items']),
+        out_path=Path(options['--out']) if options['--out'] else None
+    )
+    r = report['results']
+    c, d = r['consciousness'], r['seven_domains']
+    print(f"\n[PATTERN SCORING] {report['config']['items']:,} items (numpy: {r['numpy']})")
+    print(f"  Consciousness: per-item {c['per_item_ms']:.0f}ms  batch {c['batch_ms']:.1f}ms  "
+          f"x{c['speedup']}  {'identical' if c['identical'] else 'MISMATCH'}")
+    print(f"  Seven domains: per-item {d['per_item_ms']:.0f}ms  counts {d['marker_counts_ms']:.0f}ms  "
+          f"batch {d['batch_ms']:.1f}ms  x{d['speedup_end_to_end']} end-to-end, "
+          f"x{d['speedup_scoring_only']} scoring  {'identical' if d['identical'] else 'MISMATCH'}")
+
+    if not (c['identical'] and d['identical']):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
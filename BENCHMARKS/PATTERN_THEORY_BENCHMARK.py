@@ -0,0 +1,365 @@
+#!/usr/bin/env python3
+"""
+PATTERN THEORY BENCHMARK - Throughput and allocations across the engine family
+Runs every Pattern Theory analyzer, the PatternTheoryAPI wrapper and the
+Flask endpoints (test client) over two corpora:
+
+- synthetic: seeded generator; marker density and log-normal length
+             distribution are configurable
+- voice:     the repo's VOICE_LOGS transcripts and session STT texts
+
+Per target: texts/sec with latency percentiles, then a separate traced
+pass for allocations (tracemalloc peak, blocks still allocated after the
+pass, gen-0 GC collections as the container allocation rate).
+
+Compare mode diffs against a saved report and exits 1 when any target's
+p50 latency or peak memory grows by more than --threshold % (p50 rather
+than mean texts/sec: one GC pause moves the mean, not the median).
+
+Usage:
+    python BENCHMARKS/PATTERN_THEORY_BENCHMARK.py [--texts 2000] [--seed 42]
+        [--density 0.05] [--words 40] [--sigma 0.8] [--corpora synthetic,voice]
+        [--targets analyzers,api,flask] [--out results.json]
+        [--compare baseline.json] [--threshold 10]
+"""
+
+import gc
+import json
+import random
+import re
+import sys
+import tracemalloc
+from importlib import util as importlib_util
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).resolve().parent
+ROOT_DIR = BENCH_DIR.parent
+ENGINE_DIR = ROOT_DIR / "PATTERN_THEORY_ENGINE"
+sys.path.insert(0, str(ROOT_DIR))
+sys.path.insert(0, str(ENGINE_DIR / "core"))
+sys.path.insert(0, str(ENGINE_DIR / "projection"))
+sys.path.insert(0, str(ENGINE_DIR / "api"))
+sys.path.insert(0, str(BENCH_DIR))
+
+from BENCH_STATS import measure, write_report
+from PATTERN_DETECTOR import PatternDetector
+from PATTERN_THEORY_ENGINE import PatternTheoryEngine
+from CONSCIOUSNESS_SCORER import ConsciousnessScorer
+from MANIPULATION_DETECTOR import ManipulationDetector
+from SEVEN_DOMAINS_ANALYZER import SevenDomainsAnalyzer
+from TIMELINE_PROJECTOR import TimelineProjector
+from PATTERN_THEORY_API import PatternTheoryAPI
+from RESULT_CACHE import ResultCache
+from STREAM_ANALYZER import iter_session_texts
+
+VOICE_LOGS = ROOT_DIR / "VOICE_LOGS"
+DEFAULT_CORPORA = ['synthetic', 'voice']
+DEFAULT_TARGETS = ['analyzers', 'api', 'flask']
+DEFAULT_THRESHOLD = 10.0
+
+FILLER = (
+    "the meeting moved to thursday and we still need the budget numbers "
+    "she said the garden looks great this year and the kids loved the trip "
+    "please send the notes from the call when you get a chance thanks "
+    "i think we should look at the plan again before we decide anything"
+).split()
+
+TRANSCRIPT_LINE = re.compile(r"^\[[^\]]*\]\s*(?:\[[^\]]*\]\s*)?")
+
+
+def marker_vocabulary() -> list:
+    """Marker phrases from every analyzer's tables, plus literal detector phrases."""
+    markers = set()
+    for cls in (PatternTheoryEngine, ConsciousnessScorer):
+        for name, value in vars(cls).items():
+            if name.endswith(("_MARKERS", "_WORDS")) and isinstance(value, list):
+                markers.update(value)
+    for info in ManipulationDetector.FIFTEEN_DEGREE_TURNS.values():
+        markers.update(info["markers"])
+    for info in SevenDomainsAnalyzer.DOMAINS.values():
+        markers.update(info["markers"])
+    markers.update(TimelineProjector.FORCE_MARKERS + TimelineProjector.PIVOT_MARKERS
+                   + TimelineProjector.TRANSCEND_MARKERS)
+    markers.update([
+        "you're overreacting", "that never happened", "act now", "only 3 left",
+        "limited time", "experts say", "poor me", "everyone agrees", "we're soulmates"
+    ])
+    return sorted(m for m in markers if isinstance(m, str))
+
+
+def synthetic_corpus(count: int, seed: int = 42, density: float = 0.05,
+                     median_words: int = 40, sigma: float = 0.8) -> list:
+    """
+    Seeded texts: word counts ~ log-normal(median_words, sigma), each slot a
+    marker phrase with probability `density`, sentences of 5-20 words.
+    """
+    rng = random.Random(seed)
+    markers = marker_vocabulary()
+    texts = []
+    for _ in range(count):
+        length = max(3, int(rng.lognormvariate(0, sigma) * median_words))
+        sentences, sentence = [], []
+        sentence_length = rng.randint(5, 20)
+        for _ in range(length):
+            sentence.append(rng.choice(markers) if rng.random() < density else rng.choice(FILLER))
+            if len(sentence) >= sentence_length:
+                sentences.append(" ".join(sentence).capitalize() + rng.choice([".", ".", "?", "!"]))
+                sentence, sentence_length = [], rng.randint(5, 20)
+        if sentence:
+            sentences.append(" ".join(sentence).capitalize() + ".")
+        texts.append(" ".join(sentences))
+    return texts
+
+
+def voice_corpus(limit: int = None) -> list:
+    """Utterances from VOICE_LOGS transcripts (timestamp prefix stripped) and sessions."""
+    texts = []
+    for path in sorted(VOICE_LOGS.glob("transcript_*.txt")):
+        with open(path, encoding="utf-8", errors="replace") as f:
+            texts.extend(TRANSCRIPT_LINE.sub("", line).strip() for line in f)
+    for path in sorted(VOICE_LOGS.glob("session_*.json")):
+        texts.extend(text.strip() for text in iter_session_texts(str(path)))
+    texts = [t for t in texts if t]
+    return texts[:limit] if limit else texts
+
+
+# ============================================================================
+# TARGETS
+# ============================================================================
+
+def analyzer_targets() -> dict:
+    engine = PatternTheoryEngine()
+    scorer = ConsciousnessScorer()
+    manipulation = ManipulationDetector()
+    domains = SevenDomainsAnalyzer()
+    projector = TimelineProjector()
+    detector = PatternDetector()
+    return {
+        'pattern_engine': engine.analyze,
+        'consciousness': scorer.score_from_text,
+        'manipulation': manipulation.detect,
+        'seven_domains': domains.analyze,
+        'timeline': projector.project,
+        'pattern_detector': detector.analyze
+    }
+
+
+def api_targets() -> dict:
+    # max_entries=0: every call computes, so the numbers are engine cost
+    uncached = PatternTheoryAPI(cache=ResultCache(max_entries=0, db_path=None))
+    cached = PatternTheoryAPI(cache=ResultCache(db_path=None))
+    return {
+        'api_analyze': uncached.analyze,
+        'api_analyze_all': uncached.analyze_all,
+        'api_analyze_item': uncached.analyze_item,
+        'api_analyze_all_cached': cached.analyze_all
+    }
+
+
+def flask_targets() -> dict:
+    """Endpoints through the Flask test client (ImportError without flask)."""
+    spec = importlib_util.spec_from_file_location("pattern_theory_server", ENGINE_DIR / "server.py")
+    server = importlib_util.module_from_spec(spec)
+    spec.loader.exec_module(server)
+    server.api = PatternTheoryAPI(cache=ResultCache(max_entries=0, db_path=None))
+    client = server.app.test_client()
+
+    def post(url):
+        def call(text):
+            response = client.post(url, json={"text": text})
+            if response.status_code != 200:
+                raise RuntimeError(f"{url} returned {response.status_code}")
+            return response.get_data()
+        return call
+
+    return {
+        'http_analyze': post('/analyze'),
+        'http_analyze_all': post('/analyze/all'),
+        'http_quick': post('/quick')
+    }
+
+
+TARGET_GROUPS = {'analyzers': analyzer_targets, 'api': api_targets, 'flask': flask_targets}
+
+# Targets measured on a second pass, after one pass has filled their cache
+PRIMED = {'api_analyze_all_cached'}
+
+
+# ============================================================================
+# MEASUREMENT
+# ============================================================================
+
+def allocations(fn, texts: list) -> dict:
+    """Traced pass: peak bytes, blocks left allocated, gen-0 collections."""
+    gc.collect()
+    gen0_before = gc.get_stats()[0]['collections']
+    blocks_before = sys.getallocatedblocks()
+    tracemalloc.start()
+    for text in texts:
+        fn(text)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    gen0 = gc.get_stats()[0]['collections'] - gen0_before
+    gc.collect()
+    return {
+        'peak_kb': round(peak / 1024, 1),
+        'retained_blocks': sys.getallocatedblocks() - blocks_before,
+        'gc_gen0_per_1k_texts': round(gen0 * 1000 / len(texts), 2)
+    }
+
+
+def bench_target(fn, texts: list, alloc_sample: int) -> dict:
+    timing = measure(fn, len(texts), warmup=min(20, len(texts)), args_fn=lambda i: (texts[i],))
+    result = {'texts': len(texts), 'texts_per_s': timing['throughput_ops_s']}
+    result.update({k: timing[k] for k in ('p50_ms', 'p95_ms', 'p99_ms', 'max_ms')})
+    result.update(allocations(fn, texts[:alloc_sample]))
+    return result
+
+
+def run(texts: int = 2000, seed: int = 42, density: float = 0.05, median_words: int = 40,
+        sigma: float = 0.8, corpora: list = None, targets: list = None,
+        alloc_sample: int = 200, out_path: Path = None) -> dict:
+    corpora = corpora or DEFAULT_CORPORA
+    targets = targets or DEFAULT_TARGETS
+
+    corpus_texts = {}
+    if 'synthetic' in corpora:
+        corpus_texts['synthetic'] = synthetic_corpus(texts, seed, density, median_words, sigma)
+    if 'voice' in corpora:
+        corpus_texts['voice'] = voice_corpus(texts)
+
+    results = {}
+    for corpus, items in corpus_texts.items():
+        if not items:
+            results[corpus] = {'skipped': 'empty corpus'}
+            continue
+        lengths = sorted(len(t) for t in items)
+        corpus_results = {'corpus': {'texts': len(items), 'median_chars': lengths[len(lengths) // 2],
+                                     'max_chars': lengths[-1]}}
+        print(f"\n[BENCH] {corpus}: {len(items):,} texts")
+
+        for group in targets:
+            try:
+                fns = TARGET_GROUPS[group]()
+            except KeyError:
+                corpus_results[group] = {'skipped': f"unknown target group '{group}'"}
+                continue
+            except ImportError as e:
+                # Group depends on an optional package (e.g. flask) - record and move on
+                corpus_results[group] = {'skipped': str(e)}
+                print(f"[BENCH]   {group} skipped: {e}")
+                continue
+            corpus_results[group] = {}
+            for name, fn in fns.items():
+                print(f"[BENCH]   {name}...")
+                if name in PRIMED:
+                    for text in items:
+                        fn(text)
+                corpus_results[group][name] = bench_target(fn, items, alloc_sample)
+        results[corpus] = corpus_results
+
+    config = {'texts': texts, 'seed': seed, 'density': density, 'median_words': median_words,
+              'sigma': sigma, 'corpora': corpora, 'targets': targets, 'alloc_sample': alloc_sample}
+    return write_report('pattern_theory', config, results, out_path)
+
+
+# ============================================================================
+# COMPARISON
+# ============================================================================
+
+def _targets(report: dict):
+    for corpus, groups in report['results'].items():
+        for group, entries in groups.items():
+            if group == 'corpus' or not isinstance(entries, dict) or 'skipped' in entries:
+                continue
+            for name, stats in entries.items():
+                yield (corpus, group, name), stats
+
+
+def compare(report: dict, baseline: dict, threshold: float = DEFAULT_THRESHOLD) -> dict:
+    """Per-target change vs baseline; regressions beyond threshold % are flagged."""
+    base = dict(_targets(baseline))
+    rows, regressions = [], []
+    for key, stats in _targets(report):
+        if key not in base:
+            continue
+        old = base[key]
+        latency = (stats['p50_ms'] / old['p50_ms'] - 1) * 100 if old['p50_ms'] else 0.0
+        speed = (stats['texts_per_s'] / old['texts_per_s'] - 1) * 100 if old['texts_per_s'] else 0.0
+        memory = (stats['peak_kb'] / old['peak_kb'] - 1) * 100 if old['peak_kb'] else 0.0
+        row = {'target': '/'.join(key), 'p50_change_pct': round(latency, 1),
+               'texts_per_s_change_pct': round(speed, 1), 'peak_kb_change_pct': round(memory, 1)}
+        row['regression'] = latency > threshold or memory > threshold
+        rows.append(row)
+        if row['regression']:
+            regressions.append(row['target'])
+    return {'threshold_pct': threshold, 'baseline': baseline.get('timestamp'),
+            'targets': rows, 'regressions': regressions}
+
+
+def _print_summary(report: dict):
+    for corpus, groups in report['results'].items():
+        print(f"\n=== {corpus} ===")
+        for group, entries in groups.items():
+            if group == 'corpus':
+                print(f"  {entries['texts']:,} texts, median {entries['median_chars']} chars")
+                continue
+            if 'skipped' in entries:
+                print(f"  {group}: skipped ({entries['skipped']})")
+                continue
+            for name, s in entries.items():
+                print(f"  {name:24} {s['texts_per_s']:>10,.0f} texts/s  p50={s['p50_ms']:>8.3f}ms  "
+                      f"p99={s['p99_ms']:>8.3f}ms  peak={s['peak_kb']:>8.1f}KB  "
+                      f"retained={s['retained_blocks']:>6}  gc0/1k={s['gc_gen0_per_1k_texts']}")
+
+
+def main():
+    args = sys.argv[1:]
+    if '-h' in args or '--help' in args:
+        print(__doc__)
+        return
+    options = {'--texts': '2000', '--seed': '42', '--density': '0.05', '--words': '40',
+               '--sigma': '0.8', '--corpora': ','.join(DEFAULT_CORPORA),
+               '--targets': ','.join(DEFAULT_TARGETS), '--out': None, '--compare': None,
+               '--threshold': str(DEFAULT_THRESHOLD)}
+    for flag, value in zip(args, args[1:]):
+        if flag in options:
+            options[flag] = value
+
+    report = run(
+        texts=int(options['--texts']),
+        seed=int(options['--seed']),
+        density=float(options['--density']),
+        median_words=int(options['--words']),
+        sigma=float(options['--sigma']),
+        corpora=options['--corpora'].split(','),
+        targets=options['--targets'].split(',')
+    )
+
+    if options['--compare']:
+        with open(options['--compare']) as f:
+            report['comparison'] = compare(report, json.load(f), float(options['--threshold']))
+
+    if options['--out']:
+        out_path = Path(options['--out'])
+        out_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(out_path, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"[BENCH] Results saved to: {out_path}")
+
+    _print_summary(report)
+
+    comparison = report.get('comparison')
+    if comparison:
+        print(f"\n=== vs {options['--compare']} (threshold {comparison['threshold_pct']}%) ===")
+        for row in comparison['targets']:
+            flag = "REGRESSION" if row['regression'] else ""
+            print(f"  {row['target']:48} {row['p50_change_pct']:>+7.1f}% p50  "
+                  f"{row['texts_per_s_change_pct']:>+7.1f}% texts/s  "
+                  f"{row['peak_kb_change_pct']:>+7.1f}% peak  {flag}")
+        if comparison['regressions']:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
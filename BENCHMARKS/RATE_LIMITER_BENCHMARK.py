@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+RATE LIMITER BENCHMARK - Per-check cost and memory under scanning traffic
+Drives API_INFRASTRUCTURE.RateLimiter with a simulated clock at a fixed
+request rate across many distinct IPs.
+
+What it shows:
+- per-check cost stays flat as distinct IPs grow (O(1) state per client)
+- tracked clients stay bounded by rate x idle window, not total IPs seen
+
+Usage:
+    python BENCHMARKS/RATE_LIMITER_BENCHMARK.py [--rate 10000] [--ips 100000]
+        [--seconds 300] [--out results.json]
+"""
+
+import random
+import sys
+import time
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).resolve().parent
+ROOT_DIR = BENCH_DIR.parent
+sys.path.insert(0, str(ROOT_DIR))
+sys.path.insert(0, str(BENCH_DIR))
+
+from BENCH_STATS import summarize, write_report
+from API_INFRASTRUCTURE import RateLimiter
+
+
+class SimulatedClock:
+    """Monotonic clock advanced by the benchmark, not the wall."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def run(rate: int = 10_000, distinct_ips: int = 100_000, seconds: int = 300,
+        seed: int = 42, sample_every: int = 1000, out_path: Path = None) -> dict:
+    """Replay `rate` checks/s for `seconds` simulated seconds."""
+    clock = SimulatedClock()
+    limiter = RateLimiter(max_requests=100, window_seconds=60, clock=clock)
+    rng = random.Random(seed)
+    ips = [f"10.{i >> 16 & 255}.{i >> 8 & 255}.{i & 255}" for i in range(distinct_ips)]
+
+    total = rate * seconds
+    step = 1.0 / rate
+    per_second = []   # (simulated second, per-check µs, tracked clients)
+    batch_samples = []
+    allowed = 0
+
+    batch_start = time.perf_counter()
+    for n in range(total):
+        clock.now += step
+        ok, _ = limiter.is_allowed(ips[rng.randrange(distinct_ips)])
+        allowed += ok
+
+        if (n + 1) % sample_every == 0:
+            elapsed = time.perf_counter() - batch_start
+            batch_samples.append(elapsed * 1000 / sample_every)
+            batch_start = time.perf_counter()
+
+        if (n + 1) % rate == 0:
+            recent = batch_samples[-(rate // sample_every):]
+            per_second.append({
+                'second': (n + 1) // rate,
+                'check_us': round(sum(recent) / len(recent) * 1000, 3),
+                'tracked_clients': len(limiter.buckets)
+            })
+
+    # Per-check cost in the first vs last tenth of the run - should match
+    tenth = max(1, len(per_second) // 10)
+    early = sum(p['check_us'] for p in per_second[:tenth]) / tenth
+    late = sum(p['check_us'] for p in per_second[-tenth:]) / tenth
+
+    results = {
+        'checks': total,
+        'allowed': allowed,
+        'per_check_ms': summarize(batch_samples, sample_every),
+        'early_check_us': round(early, 3),
+        'late_check_us': round(late, 3),
+        'cost_drift_pct': round((late - early) / early * 100, 1) if early else 0.0,
+        'max_tracked_clients': max(p['tracked_clients'] for p in per_second),
+        'final_tracked_clients': len(limiter.buckets),
+        'evicted': limiter.evicted,
+        'timeline': per_second
+    }
+    config = {'rate': rate, 'distinct_ips': distinct_ips, 'seconds': seconds, 'seed': seed}
+    return write_report('rate_limiter', config, results, out_path)
+
+
+def main():
+    args = sys.argv[1:]
+    options = {'--rate': '10000', '--ips': '100000', '--seconds': '300', '--out': None}
+    for flag, value in zip(args[::2], args[1::2]):
+        if flag in options:
+            options[flag] = value
+
+    report = run(
+        rate=int(options['--rate']),
+        distinct_ips=int(options['--ips']),
+        seconds=int(options['--seconds']),
+        out_path=Path(options['--out']) if options['--out'] else None
+    )
+    r = report['results']
+    print(f"\n[RATE LIMITER] {r['checks']:,} checks across {report['config']['distinct_ips']:,} IPs")
+    print(f"  Per-check p50: {r['per_check_ms']['p50_ms'] * 1000:.3f}µs  "
+          f"p99: {r['per_check_ms']['p99_ms'] * 1000:.3f}µs")
+    print(f"  Early vs late cost: {r['early_check_us']}µs -> {r['late_check_us']}µs "
+          f"({r['cost_drift_pct']:+}%)")
+    print(f"  Tracked clients: max {r['max_tracked_clients']:,}, evicted {r['evicted']:,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+SYNTHETIC ATOMS - Deterministic atoms.db / cyclotron.db generator
+Builds benchmark databases at any scale with realistic distributions.
+
+Same seed + same scale = byte-for-byte identical rows, so results from
+different runs (or different machines) measure the code, not the data.
+
+Distributions:
+- type:        skewed toward concept/fact (like the live graph)
+- source:      Zipf-like over ~40 sources (brain_issues, scheduler, ...)
+- confidence:  beta-ish, clustered around 0.75
+- tags:        0-5 tags from a 200-word vocabulary
+- content:     log-normal length, 40 chars to ~8KB
+"""
+
+import hashlib
+import random
+import sqlite3
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+SCALES = {
+    '10k': 10_000,
+    '100k': 100_000,
+    '1m': 1_000_000,
+}
+
+ATOM_TYPES = ['concept', 'fact', 'decision', 'insight', 'pattern', 'action']
+TYPE_WEIGHTS = [30, 25, 10, 15, 12, 8]
+
+SOURCES = (
+    ['brain_issues', 'scheduler', 'session_capture', 'pattern_scan', 'knowledge_consolidation',
+     'cyclotron_rake', 'voice_log', 'trinity_broadcast', 'recursive_engine', 'manual']
+    + [f'import_{i:02d}' for i in range(30)]
+)
+
+FILE_TYPES = ['.md', '.txt', '.py', '.js', '.html', '.json']
+FILE_TYPE_WEIGHTS = [35, 20, 20, 10, 10, 5]
+
+# Small fixed vocabulary - FTS queries in the benchmark draw from the same words
+VOCABULARY = [
+    'consciousness', 'pattern', 'manipulation', 'immunity', 'trinity', 'cyclotron',
+    'truth', 'deceit', 'domain', 'timeline', 'builder', 'revolution', 'agent', 'brain',
+    'knowledge', 'atom', 'index', 'search', 'query', 'cache', 'database', 'sync',
+    'scheduler', 'health', 'report', 'session', 'memory', 'insight', 'decision', 'action',
+    'golden', 'ratio', 'turn', 'force', 'pivot', 'transcend', 'marker', 'score', 'level',
+    'analysis', 'detector', 'engine', 'protocol', 'boot', 'deploy', 'server', 'api',
+    'route', 'stream', 'batch', 'queue', 'task', 'worker', 'pool', 'lock', 'latency',
+] + [f'term{i:03d}' for i in range(150)]
+
+ATOMS_SCHEMA = """
+CREATE TABLE IF NOT EXISTS atoms (
+    id TEXT PRIMARY KEY,
+    type TEXT,
+    content TEXT,
+    source TEXT,
+    confidence REAL,
+    created TEXT,
+    tags TEXT,
+    access_count INTEGER DEFAULT 0
+)
+"""
+
+KNOWLEDGE_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS knowledge USING fts5(
+    path, name, type, content, preview, modified, hash,
+    tokenize='porter unicode61'
+)
+"""
+
+EPOCH = datetime(2025, 1, 1)
+
+
+def parse_scale(scale) -> int:
+    """Accept '10k', '1m', or an int."""
+    if isinstance(scale, int):
+        return scale
+    key = str(scale).lower()
+    if key in SCALES:
+        return SCALES[key]
+    return int(key)
+
+
+def _text(rng: random.Random, length: int) -> str:
+    words = []
+    size = 0
+    while size < length:
+        word = rng.choice(VOCABULARY)
+        words.append(word)
+        size += len(word) + 1
+    return ' '.join(words)[:length]
+
+
+def _content_length(rng: random.Random, max_len: int = 8192) -> int:
+    return max(40, min(max_len, int(rng.lognormvariate(5.5, 1.0))))
+
+
+def atom_ids(count: int) -> list:
+    """IDs the generator produces for a given scale (for lookups)."""
+    return [f"atom_{i:07d}" for i in range(count)]
+
+
+def generate_atoms(count: int, seed: int = 42):
+    """Yield atom rows deterministically."""
+    rng = random.Random(seed)
+    for i in range(count):
+        tags = rng.sample(VOCABULARY[:200], rng.randint(0, 5))
+        yield (
+            f"atom_{i:07d}",
+            rng.choices(ATOM_TYPES, TYPE_WEIGHTS)[0],
+            _text(rng, _content_length(rng)),
+            SOURCES[min(len(SOURCES) - 1, int(rng.paretovariate(1.2)) - 1)],
+            round(min(1.0, max(0.0, rng.betavariate(6, 2))), 3),
+            (EPOCH + timedelta(seconds=rng.randint(0, 365 * 86400))).isoformat(),
+            ','.join(tags),
+            int(rng.expovariate(0.05))
+        )
+
+
+def generate_documents(count: int, seed: int = 42):
+    """Yield FTS `knowledge` rows deterministically."""
+    rng = random.Random(seed + 1)
+    for i in range(count):
+        ext = rng.choices(FILE_TYPES, FILE_TYPE_WEIGHTS)[0]
+        name = f"doc_{i:07d}{ext}"
+        content = _text(rng, _content_length(rng, max_len=64 * 1024))
+        yield (
+            f"C:/Users/dwrek/100X_DEPLOYMENT/synthetic/{i % 97:02d}/{name}",
+            name,
+            ext,
+            content,
+            content[:500],
+            (EPOCH + timedelta(seconds=rng.randint(0, 365 * 86400))).isoformat(),
+            hashlib.md5(content.encode()).hexdigest()
+        )
+
+
+def build_atoms_db(db_path: Path, count: int, seed: int = 42, batch: int = 10_000) -> Path:
+    """Create a synthetic atoms.db (skips work if an identical one exists)."""
+    db_path = Path(db_path)
+    marker = db_path.with_suffix('.meta')
+    signature = f"atoms:{count}:{seed}"
+    if db_path.exists() and marker.exists() and marker.read_text() == signature:
+        return db_path
+
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    if db_path.exists():
+        db_path.unlink()
+
+    start = time.time()
+    conn = sqlite3.connect(str(db_path))
+    conn.execute("PRAGMA journal_mode = WAL")
+    conn.execute("PRAGMA synchronous = OFF")
+    conn.execute(ATOMS_SCHEMA)
+
+    rows = []
+    for row in generate_atoms(count, seed):
+        rows.append(row)
+        if len(rows) >= batch:
+            conn.executemany("INSERT INTO atoms VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows)
+            rows = []
+    if rows:
+        conn.executemany("INSERT INTO atoms VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows)
+    conn.commit()
+    conn.close()
+
+    marker.write_text(signature)
+    print(f"[SYNTH] atoms.db: {count:,} atoms in {time.time() - start:.1f}s -> {db_path}")
+    return db_path
+
+
+def build_knowledge_db(db_path: Path, count: int, seed: int = 42, batch: int = 2_000) -> Path:
+    """Create a synthetic cyclotron.db with the FTS5 `knowledge` table."""
+    db_path = Path(db_path)
+    marker = db_path.with_suffix('.meta')
+    signature = f"knowledge:{count}:{seed}"
+    if db_path.exists() and marker.exists() and marker.read_text() == signature:
+        return db_path
+
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    if db_path.exists():
+        db_path.unlink()
+
+    start = time.time()
+    conn = sqlite3.connect(str(db_path))
+    conn.execute("PRAGMA synchronous = OFF")
+    conn.execute(KNOWLEDGE_SCHEMA)
+    conn.execute("CREATE TABLE IF NOT EXISTS index_meta (key TEXT PRIMARY KEY, value TEXT)")
+
+    rows = []
+    total_chars = 0
+    for row in generate_documents(count, seed):
+        rows.append(row)
+        total_chars += len(row[3])
+        if len(rows) >= batch:
+            conn.executemany("INSERT INTO knowledge VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+            rows = []
+    if rows:
+        conn.executemany("INSERT INTO knowledge VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+
+    conn.execute("INSERT INTO knowledge(knowledge) VALUES ('optimize')")
+    conn.executemany("INSERT OR REPLACE INTO index_meta VALUES (?, ?)", [
+        ('last_indexed', EPOCH.isoformat()),
+        ('total_files', str(count)),
+        ('total_chars', str(total_chars)),
+    ])
+    conn.commit()
+    conn.close()
+
+    marker.write_text(signature)
+    print(f"[SYNTH] cyclotron.db: {count:,} documents in {time.time() - start:.1f}s -> {db_path}")
+    return db_path
+
+
+if __name__ == "__main__":
+    import sys
+
+    if len(sys.argv) < 3:
+        print("Usage: python SYNTHETIC_ATOMS.py <10k|100k|1m|N> <output_dir> [seed]")
+        sys.exit(1)
+
+    n = parse_scale(sys.argv[1])
+    out = Path(sys.argv[2])
+    seed = int(sys.argv[3]) if len(sys.argv) > 3 else 42
+
+    build_atoms_db(out / f"atoms_{sys.argv[1]}.db", n, seed)
+    build_knowledge_db(out / f"cyclotron_{sys.argv[1]}.db", max(1000, n // 10), seed)
@@ -0,0 +1,17 @@
+"""
+BENCHMARKS
+==========
+Reproducible performance measurements for the Cyclotron stack.
+
+- BENCH_STATS:          timing, percentiles, JSON report envelope
+- SYNTHETIC_ATOMS:      deterministic atoms.db / cyclotron.db generator
+- CYCLOTRON_BENCHMARK:  AtomCache, DatabaseOptimizer, CYCLOTRON_SEARCH_V2
+- RATE_LIMITER_BENCHMARK: API_INFRASTRUCTURE.RateLimiter under scanning traffic
+- PATTERN_DETECTOR_BENCHMARK: combined-regex PatternDetector vs per-indicator findall
+- PATTERN_SCORING_BENCHMARK: per-item vs NumPy batch consciousness / seven domains scoring
+- PATTERN_THEORY_BENCHMARK: texts/sec + allocations for every Pattern Theory analyzer,
+  the API wrapper and Flask endpoints; --compare flags regressions
+
+Usage:
+    python BENCHMARKS/CYCLOTRON_BENCHMARK.py 10k 100k 1m --out results.json
+"""
@@ -3,15 +3,27 @@
 BRAIN AGENT FRAMEWORK
 Foundation for specialized AI agents that reason, plan, and execute.
 Integrates with Cyclotron, GraphRAG, and EOS systems.
+
+Agents declare what they read and write on AgentState; the orchestrator
+builds a dependency DAG from those declarations and runs independent
+agents concurrently, merging their changes back in sequence order.
+
+With tracing on (BRAIN_TRACE=1 or trace=True) every agent call and the
+I/O inside it is recorded as a Chrome trace per run (BRAIN_TRACING.py).
 """
 
 import json
 import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextlib import nullcontext
 from pathlib import Path
 from datetime import datetime
 from typing import Optional, Callable
 from abc import ABC, abstractmethod
 
+from BRAIN_TRACING import TRACE_ENABLED, trace_run
+
 # Paths
 HOME = Path.home()
 CONSCIOUSNESS = HOME / ".consciousness"
@@ -20,6 +32,14 @@ AGENTS_PATH = CONSCIOUSNESS / "agents"
 
 AGENTS_PATH.mkdir(parents=True, exist_ok=True)
 
+# Orchestrator defaults
+MAX_PARALLEL_AGENTS = int(os.environ.get("BRAIN_MAX_PARALLEL_AGENTS", 8))
+AGENT_TIMEOUT = float(os.environ.get("BRAIN_AGENT_TIMEOUT", 30))
+
+# Append-only AgentState lists: concurrent writers don't conflict, entries
+# are merged in sequence order
+LOG_FIELDS = ("memory", "outputs", "decisions")
+
 class AgentState:
     """Shared state for agent execution."""
 
@@ -31,6 +51,7 @@ class AgentState:
         self.decisions = []
         self.started = datetime.now()
         self.status = "initialized"
+        self.trace = None  # {"file", "agents"} when the run was traced
 
     def add_memory(self, item: str, category: str = "observation"):
         """Add to agent memory."""
@@ -64,11 +85,23 @@ class AgentState:
             "outputs": self.outputs,
             "decisions": self.decisions,
             "started": self.started.isoformat(),
-            "status": self.status
+            "status": self.status,
+            "trace": self.trace
         }
 
 class BrainAgent(ABC):
-    """Base class for all brain agents."""
+    """
+    Base class for all brain agents.
+
+    reads / writes name what process() touches on AgentState: "task",
+    "status", the logs ("memory", "outputs", "decisions") and context keys
+    as "context.<key>". None (the default) means unknown - the agent runs
+    alone, after everything before it and before everything after it.
+    """
+
+    reads: Optional[frozenset] = None
+    writes: Optional[frozenset] = None
+    timeout: Optional[float] = None  # seconds; None = orchestrator default
 
     def __init__(self, name: str, description: str):
         self.name = name
@@ -86,6 +119,9 @@ class BrainAgent(ABC):
 class ReasoningAgent(BrainAgent):
     """Agent that reasons about problems and generates insights."""
 
+    reads = frozenset({"task"})
+    writes = frozenset({"memory", "outputs"})
+
     def __init__(self):
         super().__init__(
             name="Reasoner",
@@ -141,6 +177,9 @@ class ReasoningAgent(BrainAgent):
 class PlanningAgent(BrainAgent):
     """Agent that creates execution plans."""
 
+    reads = frozenset({"task"})
+    writes = frozenset({"context.plan", "memory", "outputs"})
+
     def __init__(self):
         super().__init__(
             name="Planner",
@@ -219,6 +258,9 @@ class PlanningAgent(BrainAgent):
 class ExecutionAgent(BrainAgent):
     """Agent that executes planned steps."""
 
+    reads = frozenset({"context.plan"})
+    writes = frozenset({"context.plan", "memory", "outputs"})
+
     def __init__(self):
         super().__init__(
             name="Executor",
@@ -261,6 +303,9 @@ class ExecutionAgent(BrainAgent):
 class SynthesisAgent(BrainAgent):
     """Agent that synthesizes outputs from other agents."""
 
+    reads = frozenset({"task", "memory", "outputs", "decisions"})
+    writes = frozenset({"context.synthesis", "status", "outputs"})
+
     def __init__(self):
         super().__init__(
             name="Synthesizer",
@@ -309,10 +354,44 @@ class SynthesisAgent(BrainAgent):
 
         return state
 
+def depends_on(later: BrainAgent, earlier: BrainAgent) -> bool:
+    """
+    Must `later` wait for `earlier`? True when one writes what the other
+    reads, both write the same non-log field, or either is undeclared.
+    """
+    if None in (later.reads, later.writes, earlier.reads, earlier.writes):
+        return True
+    return bool(
+        later.reads & earlier.writes
+        or later.writes & earlier.reads
+        or (later.writes & earlier.writes) - set(LOG_FIELDS)
+    )
+
+
+def build_dag(agents: list) -> list:
+    """Dependencies of each agent (indexes into `agents`, in sequence order)."""
+    return [
+        {j for j in range(i) if depends_on(agent, agents[j])}
+        for i, agent in enumerate(agents)
+    ]
+
+
+def dag_stages(deps: list) -> list:
+    """Group agent indexes by depth: each stage only needs earlier stages."""
+    depth = []
+    for d in deps:
+        depth.append(1 + max((depth[j] for j in d), default=-1))
+    stages = [[] for _ in range(max(depth, default=-1) + 1)]
+    for i, level in enumerate(depth):
+        stages[level].append(i)
+    return stages
+
+
 class AgentOrchestrator:
     """Orchestrates multiple agents to complete tasks."""
 
-    def __init__(self):
+    def __init__(self, parallel: bool = True, max_workers: int = MAX_PARALLEL_AGENTS,
+                 agent_timeout: float = AGENT_TIMEOUT, trace: bool = TRACE_ENABLED):
         self.agents = {
             "reasoner": ReasoningAgent(),
             "planner": PlanningAgent(),
@@ -320,14 +399,20 @@ class AgentOrchestrator:
             "synthesizer": SynthesisAgent()
         }
         self.execution_log = []
+        self.parallel = parallel
+        self.max_workers = max(1, max_workers)
+        self.agent_timeout = agent_timeout
+        self.trace = trace
 
-    def run(self, task: str, agent_sequence: list = None) -> AgentState:
+    def run(self, task: str, agent_sequence: list = None, parallel: Optional[bool] = None) -> AgentState:
         """
         Run agents on a task.
 
         Args:
             task: The task to complete
             agent_sequence: List of agent names to run (default: all in order)
+            parallel: Run independent agents concurrently (default: self.parallel);
+                      the result is the same as running the sequence in order
 
         Returns:
             Final agent state
@@ -335,6 +420,8 @@ class AgentOrchestrator:
         # Default sequence
         if agent_sequence is None:
             agent_sequence = ["reasoner", "planner", "executor", "synthesizer"]
+        if parallel is None:
+            parallel = self.parallel
 
         # Initialize state
         state = AgentState(task)
@@ -344,23 +431,39 @@ class AgentOrchestrator:
         print(f"{'='*50}")
         print(f"Task: {task[:100]}...")
         print(f"Agents: {' → '.join(agent_sequence)}")
-        print()
 
-        # Run each agent
+        selected = []
         for agent_name in agent_sequence:
             agent = self.agents.get(agent_name)
             if not agent:
                 print(f"⚠️  Unknown agent: {agent_name}")
                 continue
-
-            print(f"Running {agent.name}...")
-            state = agent.process(state)
-
-            # Log execution
-            self.execution_log.append({
-                "agent": agent_name,
-                "timestamp": datetime.now().isoformat()
-            })
+            selected.append((agent_name, agent))
+
+        start = time.perf_counter()
+        tracing = trace_run(task, {"agents": [name for name, _ in selected], "parallel": parallel}) \
+            if self.trace else nullcontext()
+        with tracing as tracer:
+            if parallel and self.max_workers > 1 and len(selected) > 1:
+                self._run_dag(state, selected, tracer)
+            else:
+                print()
+                # Run each agent
+                for agent_name, agent in selected:
+                    print(f"Running {agent.name}...")
+                    agent_start = time.perf_counter()
+                    state = self._process(agent, state, tracer)
+
+                    # Log execution
+                    self.execution_log.append({
+                        "agent": agent_name,
+                        "status": "complete",
+                        "duration_ms": round((time.perf_counter() - agent_start) * 1000, 2),
+                        "timestamp": datetime.now().isoformat()
+                    })
+        wall_ms = (time.perf_counter() - start) * 1000
+        if tracer is not None:
+            state.trace = {"file": str(tracer.trace_file), "agents": tracer.agent_summary()}
 
         # Save state
         self._save_state(state)
@@ -371,12 +474,168 @@ class AgentOrchestrator:
         print(f"Status: {state.status}")
         print(f"Memory items: {len(state.memory)}")
         print(f"Outputs: {len(state.outputs)}")
+        print(f"Wall clock: {wall_ms:.1f}ms")
+        if state.trace:
+            print(f"Trace: {state.trace['file']}")
 
         return state
 
+    # === DAG EXECUTION ===
+
+    @staticmethod
+    def _process(agent: "BrainAgent", state: AgentState, tracer=None) -> AgentState:
+        """agent.process, inside an agent span when tracing."""
+        if tracer is None:
+            return agent.process(state)
+        with tracer.span(agent.name, "agent", agent_class=type(agent).__name__):
+            return agent.process(state)
+
+    def _run_dag(self, state: AgentState, selected: list, tracer=None):
+        """
+        Run agents as soon as their dependencies finish, up to max_workers
+        at once. Each agent works on its own view of the state; its changes
+        (context keys, status, new log entries) are captured as a delta.
+        Dependents see the merged deltas of everything they depend on, and
+        the final state applies all deltas in sequence order, so the result
+        does not depend on which thread finished first.
+        """
+        agents = [agent for _, agent in selected]
+        deps = build_dag(agents)
+        stages = dag_stages(deps)
+        print("Stages: " + " → ".join(
+            " | ".join(selected[i][0] for i in stage) for stage in stages))
+        print()
+
+        base_context = dict(state.context)
+        base_logs = {field: list(getattr(state, field)) for field in LOG_FIELDS}
+        base_status = state.status
+        live_context = dict(base_context)
+        live_status = base_status
+        deltas = {}
+        pending = set(range(len(agents)))
+        running = {}  # future -> (index, view, snapshot, deadline, started)
+
+        def make_view() -> AgentState:
+            view = AgentState(state.task)
+            view.started = state.started
+            view.context = dict(live_context)
+            view.status = live_status
+            for field in LOG_FIELDS:
+                entries = list(base_logs[field])
+                for j in sorted(deltas):
+                    entries.extend(deltas[j]["logs"][field])
+                setattr(view, field, entries)
+            return view
+
+        def capture(view: AgentState, result: AgentState, snapshot: dict) -> dict:
+            """What the agent changed relative to the view it was given."""
+            result = result if isinstance(result, AgentState) else view
+            context = snapshot["context"]
+            return {
+                "context": {k: v for k, v in result.context.items()
+                            if k not in context or context[k] is not v},
+                "removed": [k for k in context if k not in result.context],
+                "status": result.status if result.status != snapshot["status"] else None,
+                "logs": {field: getattr(result, field)[snapshot["logs"][field]:] for field in LOG_FIELDS}
+            }
+
+        def failed(message: str, category: str) -> dict:
+            entry = {"content": message, "category": category,
+                     "timestamp": datetime.now().isoformat()}
+            return {"context": {}, "removed": [], "status": None,
+                    "logs": {"memory": [entry], "outputs": [], "decisions": []}}
+
+        pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="brain-agent")
+        try:
+            while pending or running:
+                done_indexes = set(deltas)
+                for index in sorted(pending):
+                    if len(running) >= self.max_workers:
+                        break
+                    if deps[index] <= done_indexes:
+                        pending.discard(index)
+                        name, agent = selected[index]
+                        view = make_view()
+                        snapshot = {
+                            "context": dict(view.context),
+                            "status": view.status,
+                            "logs": {field: len(getattr(view, field)) for field in LOG_FIELDS}
+                        }
+                        timeout = agent.timeout if agent.timeout is not None else self.agent_timeout
+                        print(f"Running {agent.name}...")
+                        future = pool.submit(self._process, agent, view, tracer)
+                        now = time.perf_counter()
+                        running[future] = (index, view, snapshot, now + timeout, now)
+
+                if not running:
+                    break  # unreachable: deps only point backwards
+
+                next_deadline = min(info[3] for info in running.values())
+                finished, _ = wait(running, timeout=max(0.0, next_deadline - time.perf_counter()),
+                                   return_when=FIRST_COMPLETED)
+
+                for future in finished:
+                    index, view, snapshot, _, started = running.pop(future)
+                    name, agent = selected[index]
+                    try:
+                        delta = capture(view, future.result(), snapshot)
+                        status = "complete"
+                    except Exception as e:
+                        delta = failed(f"{agent.name} failed: {e}", "error")
+                        status = "error"
+                    self._merge_live(delta, live_context)
+                    if delta["status"] is not None:
+                        live_status = delta["status"]
+                    deltas[index] = delta
+                    self._log_agent(name, status, started, self._stage_of(index, stages))
+
+                now = time.perf_counter()
+                for future, (index, view, snapshot, deadline, started) in list(running.items()):
+                    if now >= deadline:
+                        # Threads can't be killed: drop the result whenever it arrives
+                        running.pop(future)
+                        future.cancel()
+                        name, agent = selected[index]
+                        deltas[index] = failed(
+                            f"{agent.name} timed out after {deadline - started:.1f}s", "warning")
+                        self._log_agent(name, "timeout", started, self._stage_of(index, stages))
+        finally:
+            pool.shutdown(wait=False)
+
+        # Deterministic merge: every delta, in sequence order
+        state.context = dict(base_context)
+        for field in LOG_FIELDS:
+            setattr(state, field, list(base_logs[field]))
+        for index in sorted(deltas):
+            delta = deltas[index]
+            self._merge_live(delta, state.context)
+            for field in LOG_FIELDS:
+                getattr(state, field).extend(delta["logs"][field])
+            if delta["status"] is not None:
+                state.status = delta["status"]
+
+    @staticmethod
+    def _merge_live(delta: dict, context: dict):
+        for key in delta["removed"]:
+            context.pop(key, None)
+        context.update(delta["context"])
+
+    @staticmethod
+    def _stage_of(index: int, stages: list) -> int:
+        return next(n for n, stage in enumerate(stages) if index in stage)
+
+    def _log_agent(self, agent_name: str, status: str, started: float, stage: int):
+        self.execution_log.append({
+            "agent": agent_name,
+            "status": status,
+            "stage": stage,
+            "duration_ms": round((time.perf_counter() - started) * 1000, 2),
+            "timestamp": datetime.now().isoformat()
+        })
+
     def _save_state(self, state: AgentState):
         """Save state to disk."""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")  # unique under concurrent runs
         state_file = AGENTS_PATH / f"state_{timestamp}.json"
 
         with open(state_file, 'w') as f:
@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""
+BRAIN INDEX REGISTRY
+Process-wide cache of the JSON sources brain agents read (Cyclotron
+INDEX.json, GraphRAG entity files, task memories).
+
+- each file is parsed once and kept until its (mtime, size) changes
+- directories are re-listed on access; only new or changed files are parsed
+- derived structures (inverted indexes) are rebuilt only when their
+  sources' signatures change
+
+Cached data is shared between agents and threads: treat it as read-only.
+
+    registry = get_index_registry()
+    index = registry.load_json(path)             # cached parse
+    atoms, atom_index = cyclotron_atoms(path)    # atoms + InvertedIndex
+    atom_index.search("pattern")                 # positions, substring semantics
+"""
+
+import json
+import os
+import re
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+class InvertedIndex:
+    """
+    Substring search over a list of texts without scanning the texts.
+
+    search(term) returns the sorted positions of texts where `term in
+    text.lower()` - the same answer as the linear scan it replaces. Terms
+    made of [a-z0-9] can only match inside a token, so they are answered
+    from the postings of vocabulary tokens containing them (found through a
+    trigram index over the vocabulary). Other terms fall back to a scan.
+    """
+
+    def __init__(self, texts: List[str]):
+        self.texts = [text.lower() for text in texts]
+        self.postings: Dict[str, List[int]] = {}
+        for position, text in enumerate(self.texts):
+            for token in set(TOKEN_RE.findall(text)):
+                self.postings.setdefault(token, []).append(position)
+
+        self.trigrams: Dict[str, set] = {}
+        for token in self.postings:
+            for i in range(len(token) - 2):
+                self.trigrams.setdefault(token[i:i + 3], set()).add(token)
+        self._cache: Dict[str, List[int]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+    def _tokens_containing(self, term: str) -> List[str]:
+        if len(term) < 3:
+            return [token for token in self.postings if term in token]
+        candidates = None
+        for i in range(len(term) - 2):
+            tokens = self.trigrams.get(term[i:i + 3])
+            if not tokens:
+                return []
+            candidates = set(tokens) if candidates is None else candidates & tokens
+        return [token for token in candidates if term in token]
+
+    def search(self, term: str) -> List[int]:
+        """Positions of texts containing `term` (case-insensitive)."""
+        term = term.lower()
+        with self._lock:
+            cached = self._cache.get(term)
+        if cached is not None:
+            return cached
+
+        if not term:
+            positions = list(range(len(self.texts)))
+        elif TOKEN_RE.fullmatch(term):
+            hits = set()
+            for token in self._tokens_containing(term):
+                hits.update(self.postings[token])
+            positions = sorted(hits)
+        else:
+            positions = [i for i, text in enumerate(self.texts) if term in text]
+
+        with self._lock:
+            if len(self._cache) > 10000:
+                self._cache.clear()
+            self._cache[term] = positions
+        return positions
+
+    def search_any(self, terms: List[str]) -> List[int]:
+        """Positions of texts containing at least one term."""
+        hits = set()
+        for term in terms:
+            hits.update(self.search(term))
+        return sorted(hits)
+
+
+class IndexRegistry:
+    """Parsed JSON files and derived indexes, reloaded on (mtime, size) change."""
+
+    def __init__(self):
+        self._files: Dict[str, Tuple[Tuple[int, int], Any]] = {}
+        self._derived: Dict[Any, Tuple[Any, Any]] = {}
+        self._lock = threading.Lock()
+        self.stats = {"loads": 0, "hits": 0, "builds": 0}
+
+    @staticmethod
+    def signature(path) -> Optional[Tuple[int, int]]:
+        """(mtime_ns, size) of a file, or None if it doesn't exist."""
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
+    def load_json(self, path, default: Any = None) -> Any:
+        """Parsed JSON for path, reparsed only when the file changed."""
+        key = str(path)
+        sig = self.signature(key)
+        if sig is None:
+            return default
+
+        with self._lock:
+            cached = self._files.get(key)
+            if cached and cached[0] == sig:
+                self.stats["hits"] += 1
+                return cached[1]
+
+        try:
+            with open(key) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return default
+
+        with self._lock:
+            self._files[key] = (sig, data)
+            self.stats["loads"] += 1
+        return data
+
+    def json_dir_signature(self, directory, pattern: str = "*.json") -> tuple:
+        """Signature of every matching file in a directory (sorted by name)."""
+        directory = Path(directory)
+        if not directory.exists():
+            return ()
+        return tuple(
+            (str(path), self.signature(path))
+            for path in sorted(directory.glob(pattern))
+        )
+
+    def load_json_dir(self, directory, pattern: str = "*.json") -> List[Tuple[Path, Any]]:
+        """(path, data) for every parseable matching file; unchanged files come from cache."""
+        loaded = []
+        for path, _ in self.json_dir_signature(directory, pattern):
+            data = self.load_json(path)
+            if data is not None:
+                loaded.append((Path(path), data))
+        return loaded
+
+    def derived(self, key: Any, signature: Any, build: Callable[[], Any]) -> Any:
+        """Value built from sources, rebuilt only when `signature` changes."""
+        with self._lock:
+            cached = self._derived.get(key)
+            if cached and cached[0] == signature:
+                return cached[1]
+
+        value = build()
+        with self._lock:
+            self._derived[key] = (signature, value)
+            self.stats["builds"] += 1
+        return value
+
+    def invalidate(self, path=None):
+        """Forget one file (or everything); next access reloads."""
+        with self._lock:
+            if path is None:
+                self._files.clear()
+                self._derived.clear()
+            else:
+                self._files.pop(str(path), None)
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            return dict(self.stats, files=len(self._files), derived=len(self._derived))
+
+
+# === SOURCES USED BY THE BRAIN AGENTS ===
+
+def cyclotron_atoms(index_path) -> Tuple[List[dict], Optional[InvertedIndex]]:
+    """Atoms from a Cyclotron INDEX.json plus an index over content + tags."""
+    registry = get_index_registry()
+    sig = registry.signature(index_path)
+    if sig is None:
+        return [], None
+
+    def build():
+        index = registry.load_json(index_path, {})
+        atoms = index.get("atoms", [])
+        texts = [f"{atom.get('content', '')} {' '.join(atom.get('tags', []))}" for atom in atoms]
+        return atoms, InvertedIndex(texts)
+
+    return registry.derived(("cyclotron", str(index_path)), sig, build)
+
+
+def graph_entities(entities_dir) -> Tuple[List[dict], InvertedIndex]:
+    """All entities from a GraphRAG entities directory plus an index over names."""
+    registry = get_index_registry()
+
+    def build():
+        entities = []
+        for _, data in registry.load_json_dir(entities_dir):
+            entities.extend(data.get("entities", []))
+        return entities, InvertedIndex([entity.get("name", "") for entity in entities])
+
+    return registry.derived(("entities", str(entities_dir)),
+                            registry.json_dir_signature(entities_dir), build)
+
+
+def task_memories(memory_dir) -> Tuple[List[dict], InvertedIndex]:
+    """Stored task memories, newest first, plus an index over their tasks."""
+    registry = get_index_registry()
+
+    def build():
+        memories = [data for _, data in registry.load_json_dir(memory_dir)]
+        memories.sort(key=lambda x: x.get("timestamp", ""), reverse=True)
+        return memories, InvertedIndex([memory.get("task", "") for memory in memories])
+
+    return registry.derived(("memories", str(memory_dir)),
+                            registry.json_dir_signature(memory_dir), build)
+
+
+# Singleton instance
+_registry_instance = None
+_registry_lock = threading.Lock()
+
+
+def get_index_registry() -> IndexRegistry:
+    """Get or create the process-wide index registry."""
+    global _registry_instance
+    with _registry_lock:
+        if _registry_instance is None:
+            _registry_instance = IndexRegistry()
+        return _registry_instance
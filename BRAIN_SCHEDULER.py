@@ -16,6 +16,8 @@ from typing import Callable, List
 from AUTONOMOUS_TASK_RUNNER import AutonomousRunner
 from CYCLOTRON_BRAIN_BRIDGE import CyclotronBridge
 from BRAIN_INTEGRATION_HOOKS import BrainIntegration
+from DATABASE_OPTIMIZATION import OnlineMaintenance
+from CYCLOTRON_PATTERN_SCAN import PatternScanJob
 
 # Paths
 HOME = Path.home()
@@ -131,6 +133,29 @@ class BrainScheduler:
             self.log_execution("pattern_scan", f"Error: {str(e)}")
             print(f"  Error: {e}")
 
+    def run_corpus_scan(self):
+        """Incremental manipulation scan of the indexed knowledge corpus."""
+        print(f"\n[{datetime.now().strftime('%H:%M:%S')}] Scanning knowledge corpus...")
+
+        try:
+            summary = PatternScanJob().run()
+            if "error" in summary:
+                self.log_execution("corpus_scan", f"Skipped: {summary['error']}")
+                print(f"  {summary['error']}")
+                return
+
+            self.log_execution(
+                "corpus_scan",
+                f"Success: {summary['scanned']} scanned, {summary['skipped']} unchanged, "
+                f"{summary['removed']} removed"
+            )
+            print(f"  Scanned {summary['scanned']} documents ({summary['skipped']} unchanged) "
+                  f"in {summary['seconds']}s")
+
+        except Exception as e:
+            self.log_execution("corpus_scan", f"Error: {str(e)}")
+            print(f"  Error: {e}")
+
     def process_task_queue(self):
         """Process pending tasks."""
         print(f"\n[{datetime.now().strftime('%H:%M:%S')}] Processing task queue...")
@@ -199,6 +224,34 @@ class BrainScheduler:
             self.log_execution("eos_sync", f"Error: {str(e)}")
             print(f"  Error: {e}")
 
+    def run_db_maintenance(self):
+        """Run time-boxed online maintenance on atoms.db (idle window only)."""
+        print(f"\n[{datetime.now().strftime('%H:%M:%S')}] Database maintenance...")
+
+        try:
+            maintenance = OnlineMaintenance()
+            summary = maintenance.run(max_seconds=30)
+            maintenance.close()
+
+            if summary["skipped"]:
+                self.log_execution("db_maintenance", "Skipped: outside idle window")
+            elif summary["auto_vacuum"] != "incremental":
+                self.log_execution(
+                    "db_maintenance",
+                    f"Success: max lock {summary['max_lock_ms']}ms; no pages freed - "
+                    f"auto_vacuum is {summary['auto_vacuum']}, run DATABASE_OPTIMIZATION.py once to convert"
+                )
+            else:
+                self.log_execution(
+                    "db_maintenance",
+                    f"Success: {summary['pages_freed']} pages freed, "
+                    f"max lock {summary['max_lock_ms']}ms"
+                )
+
+        except Exception as e:
+            self.log_execution("db_maintenance", f"Error: {str(e)}")
+            print(f"  Error: {e}")
+
     # === SCHEDULER CONTROL ===
 
     def setup_schedule(self):
@@ -215,6 +268,10 @@ class BrainScheduler:
 
         # Every 4 hours
         schedule.every(4).hours.do(self.run_pattern_scan)
+        schedule.every(4).hours.do(self.run_corpus_scan)
+
+        # Every 15 minutes (only does work inside the idle window)
+        schedule.every(15).minutes.do(self.run_db_maintenance)
 
         # Daily at 6 AM
         schedule.every().day.at("06:00").do(self.run_eos_sync)
@@ -223,7 +280,8 @@ class BrainScheduler:
         print("  • Every 30 min: Brain-Cyclotron sync")
         print("  • Every hour: Health check, Process queue")
         print("  • Every 2 hours: Knowledge consolidation")
-        print("  • Every 4 hours: Pattern scan")
+        print("  • Every 4 hours: Pattern scan, Corpus scan")
+        print("  • Every 15 min (idle window): DB maintenance")
         print("  • Daily 6 AM: EOS sync")
 
     def run_once(self):
@@ -293,6 +351,7 @@ def main():
         print("  sync     - Sync brain-cyclotron")
         print("  health   - Run health check")
         print("  eos      - Sync EOS data")
+        print("  scan     - Scan knowledge corpus for patterns")
         print("  status   - Show status")
         return
 
@@ -313,6 +372,9 @@ def main():
     elif command == "eos":
         scheduler.run_eos_sync()
 
+    elif command == "scan":
+        scheduler.run_corpus_scan()
+
     elif command == "status":
         cyclotron_status = scheduler.cyclotron.get_status()
         runner_status = scheduler.runner.get_status()
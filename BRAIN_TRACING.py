@@ -0,0 +1,444 @@
+#!/usr/bin/env python3
+"""
+BRAIN TRACING
+Per-agent spans for brain pipelines, exported as Chrome trace-event JSON
+(open in chrome://tracing or https://ui.perfetto.dev as a flame graph).
+
+- every BrainAgent.process call is a span: wall time, thread CPU time,
+  bytes read, and time spent in file / SQLite I/O inside it
+- file opens (open / Path.open) and SQLite execute calls made while a
+  span is active on the current thread become child spans; other threads
+  and untraced code pass straight through
+- one trace file per orchestrator run in ~/.consciousness/traces
+- summarize() aggregates per-agent p50/p95 over the last N runs
+
+    tracer = Tracer("my task")
+    with tracer.span("Reasoner", "agent"):
+        ...
+    tracer.save()
+
+    python BRAIN_TRACING.py summary [N]
+"""
+
+import builtins
+import io
+import json
+import os
+import sqlite3
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+HOME = Path.home()
+CONSCIOUSNESS = HOME / ".consciousness"
+TRACES_PATH = Path(os.environ.get("BRAIN_TRACE_DIR", CONSCIOUSNESS / "traces"))
+
+# Configuration (environment overridable)
+TRACE_ENABLED = os.environ.get("BRAIN_TRACE", "0").lower() in ("1", "true", "yes")
+TRACE_KEEP = int(os.environ.get("BRAIN_TRACE_KEEP", 200))  # trace files kept on disk
+SUMMARY_RUNS = int(os.environ.get("BRAIN_TRACE_SUMMARY_RUNS", 50))
+
+# /proc/thread-self/io counts every byte the thread read (files, SQLite pages)
+PROC_IO = Path("/proc/thread-self/io")
+
+_local = threading.local()  # .stack: open spans of the bound tracer on this thread
+
+
+def _rchar() -> Optional[int]:
+    """Bytes read by this thread so far (Linux), or None."""
+    try:
+        with _real_open(PROC_IO, "rb") as f:
+            for line in f:
+                if line.startswith(b"rchar:"):
+                    return int(line.split()[1])
+    except OSError:
+        return None
+    return None
+
+
+def _percentile(sorted_values: List[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, int(round(pct / 100 * len(sorted_values) + 0.5)) - 1))
+    return sorted_values[rank]
+
+
+class _Frame:
+    """An open span."""
+    __slots__ = ("tracer", "name", "cat", "args", "start", "cpu", "rchar", "io_ms", "io_calls", "bytes_read")
+
+    def __init__(self, tracer, name, cat, args):
+        self.tracer = tracer
+        self.name = name
+        self.cat = cat
+        self.args = args
+        self.io_ms = 0.0
+        self.io_calls = 0
+        self.bytes_read = 0
+        self.rchar = _rchar() if cat == "agent" else None
+        self.cpu = time.thread_time()
+        self.start = time.perf_counter()
+
+
+class Tracer:
+    """Collects spans for one run; spans from any thread land in one trace."""
+
+    def __init__(self, name: str = "run", metadata: Optional[dict] = None):
+        self.name = name
+        self.metadata = dict(metadata or {})
+        self.origin = time.perf_counter()
+        self.started = datetime.now()
+        self.events: List[dict] = []
+        self.trace_file: Optional[Path] = None
+        self._lock = threading.Lock()
+        self._threads: Dict[int, str] = {}
+
+    @contextmanager
+    def span(self, name: str, cat: str = "function", **args):
+        """
+        Time a block. The current thread is bound to this tracer for the
+        duration, so I/O inside it (on this thread) is traced as children.
+        """
+        stack = getattr(_local, "stack", None)
+        if stack is None:
+            stack = _local.stack = []
+        frame = _Frame(self, name, cat, args)
+        stack.append(frame)
+        try:
+            yield frame
+        finally:
+            stack.pop()
+            self._close(frame)
+
+    def _close(self, frame: _Frame):
+        end = time.perf_counter()
+        wall_ms = (end - frame.start) * 1000
+        args = dict(frame.args)
+        args["wall_ms"] = round(wall_ms, 3)
+        args["cpu_ms"] = round((time.thread_time() - frame.cpu) * 1000, 3)
+        if frame.cat == "io":
+            # Roll I/O up into every enclosing span of this tracer
+            for outer in getattr(_local, "stack", ()):
+                if outer.tracer is self:
+                    outer.io_ms += wall_ms
+                    outer.io_calls += 1
+                    outer.bytes_read += args.get("bytes_read", 0)
+        else:
+            args["io_ms"] = round(frame.io_ms, 3)
+            args["io_calls"] = frame.io_calls
+            args["bytes_read"] = frame.bytes_read
+            if frame.rchar is not None:
+                rchar = _rchar()
+                if rchar is not None:
+                    args["rchar"] = rchar - frame.rchar
+        self._record(frame.name, frame.cat, frame.start, end, args)
+
+    def _record(self, name: str, cat: str, start: float, end: float, args: dict):
+        thread = threading.current_thread()
+        event = {
+            "name": name,
+            "cat": cat,
+            "ph": "X",
+            "ts": round((start - self.origin) * 1e6, 1),
+            "dur": round((end - start) * 1e6, 1),
+            "pid": os.getpid(),
+            "tid": thread.ident,
+            "args": args
+        }
+        with self._lock:
+            self.events.append(event)
+            self._threads.setdefault(thread.ident, thread.name)
+
+    # === EXPORT ===
+
+    def to_chrome(self) -> dict:
+        """Chrome trace-event format (JSON object form)."""
+        with self._lock:
+            events = sorted(self.events, key=lambda e: (e["ts"], -e["dur"]))
+            threads = dict(self._threads)
+        pid = os.getpid()
+        names = [{"name": "process_name", "ph": "M", "pid": pid, "tid": 0,
+                  "args": {"name": f"brain: {self.name[:60]}"}}]
+        names += [{"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": tname}}
+                  for tid, tname in threads.items()]
+        return {
+            "traceEvents": names + events,
+            "displayTimeUnit": "ms",
+            "otherData": dict(self.metadata, run=self.name, started=self.started.isoformat())
+        }
+
+    def agent_summary(self) -> Dict[str, dict]:
+        """Per-agent totals for this run."""
+        summary = {}
+        with self._lock:
+            events = [e for e in self.events if e["cat"] == "agent"]
+        for event in events:
+            entry = summary.setdefault(event["name"], {"calls": 0, "wall_ms": 0.0, "cpu_ms": 0.0,
+                                                       "io_ms": 0.0, "bytes_read": 0})
+            entry["calls"] += 1
+            for key in ("wall_ms", "cpu_ms", "io_ms", "bytes_read"):
+                entry[key] = round(entry[key] + event["args"].get(key, 0), 3)
+        return summary
+
+    def save(self, directory: Path = None) -> Path:
+        """Write the trace file and prune old ones beyond TRACE_KEEP."""
+        directory = Path(directory or TRACES_PATH)
+        directory.mkdir(parents=True, exist_ok=True)
+        self.trace_file = directory / f"trace_{self.started.strftime('%Y%m%d_%H%M%S_%f')}.json"
+        with _real_open(self.trace_file, "w") as f:
+            json.dump(self.to_chrome(), f)
+
+        traces = sorted(directory.glob("trace_*.json"))
+        for old in traces[:max(0, len(traces) - TRACE_KEEP)]:
+            try:
+                old.unlink()
+            except OSError:
+                pass
+        return self.trace_file
+
+
+def current_tracer() -> Optional[Tracer]:
+    """Tracer bound to the current thread, if a span is open."""
+    stack = getattr(_local, "stack", None)
+    return stack[-1].tracer if stack else None
+
+
+# === I/O INSTRUMENTATION ===
+
+_real_open = io.open
+_real_connect = sqlite3.connect
+_install_lock = threading.Lock()
+_installed = 0
+
+
+class _TracedFile:
+    """File proxy: the span covers open() to close(), counting bytes read/written."""
+
+    def __init__(self, f, tracer: Tracer, name: str, mode: str):
+        self._f = f
+        self._tracer = tracer
+        self._stack = _local.stack
+        self._frame = _Frame(tracer, name, "io", {"op": "file", "mode": mode})
+        self._frame.start = time.perf_counter()
+        self._read = 0
+        self._written = 0
+        self._closed = False
+
+    def read(self, *args):
+        data = self._f.read(*args)
+        self._read += len(data)
+        return data
+
+    def readline(self, *args):
+        data = self._f.readline(*args)
+        self._read += len(data)
+        return data
+
+    def readlines(self, *args):
+        lines = self._f.readlines(*args)
+        self._read += sum(len(line) for line in lines)
+        return lines
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        line = next(self._f)
+        self._read += len(line)
+        return line
+
+    def write(self, data):
+        self._written += len(data)
+        return self._f.write(data)
+
+    def close(self):
+        self._f.close()
+        if not self._closed:
+            self._closed = True
+            self._frame.args.update(bytes_read=self._read, bytes_written=self._written)
+            if _local.__dict__.get("stack") is self._stack:
+                self._tracer._close(self._frame)
+            else:  # closed on another thread: record without roll-up
+                self._tracer._record(self._frame.name, "io", self._frame.start,
+                                     time.perf_counter(), self._frame.args)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+    def __getattr__(self, name):
+        return getattr(self._f, name)
+
+
+def _traced_open(file, mode="r", *args, **kwargs):
+    f = _real_open(file, mode, *args, **kwargs)
+    tracer = current_tracer()
+    if tracer is None or isinstance(file, int):
+        return f
+    return _TracedFile(f, tracer, f"open {Path(file).name}", mode)
+
+
+@contextmanager
+def _sql_span(sql: str):
+    tracer = current_tracer()
+    if tracer is None:
+        yield
+        return
+    with tracer.span(f"sql {sql.split(None, 1)[0].upper() if sql.strip() else '?'}", "io",
+                     op="sqlite", sql=" ".join(sql.split())[:120]):
+        yield
+
+
+class TracedCursor(sqlite3.Cursor):
+    def execute(self, sql, *args):
+        with _sql_span(sql):
+            return super().execute(sql, *args)
+
+    def executemany(self, sql, *args):
+        with _sql_span(sql):
+            return super().executemany(sql, *args)
+
+
+class TracedConnection(sqlite3.Connection):
+    """Connection whose execute calls (direct or via cursor()) are io spans.
+    The span covers statement execution, not rows fetched afterwards."""
+
+    def cursor(self, factory=TracedCursor):
+        return super().cursor(factory)
+
+    def execute(self, sql, *args):
+        with _sql_span(sql):
+            return super().execute(sql, *args)
+
+    def executemany(self, sql, *args):
+        with _sql_span(sql):
+            return super().executemany(sql, *args)
+
+    def executescript(self, script):
+        with _sql_span(script):
+            return super().executescript(script)
+
+
+def _traced_connect(*args, **kwargs):
+    if current_tracer() is None or "factory" in kwargs:
+        return _real_connect(*args, **kwargs)
+    return _real_connect(*args, factory=TracedConnection, **kwargs)
+
+
+def install_io_hooks():
+    """Route open / Path.open / sqlite3.connect through the tracer (refcounted)."""
+    global _installed
+    with _install_lock:
+        if _installed == 0:
+            builtins.open = _traced_open
+            io.open = _traced_open
+            sqlite3.connect = _traced_connect
+        _installed += 1
+
+
+def uninstall_io_hooks():
+    global _installed
+    with _install_lock:
+        _installed = max(0, _installed - 1)
+        if _installed == 0:
+            builtins.open = _real_open
+            io.open = _real_open
+            sqlite3.connect = _real_connect
+
+
+@contextmanager
+def trace_run(name: str, metadata: Optional[dict] = None, save: bool = True):
+    """Trace one pipeline run: root span on this thread, I/O hooks installed, file saved."""
+    tracer = Tracer(name, metadata)
+    install_io_hooks()
+    try:
+        with tracer.span(name[:80], "run"):
+            yield tracer
+    finally:
+        uninstall_io_hooks()
+        if save:
+            tracer.save()
+
+
+# === SUMMARY ===
+
+def summarize(runs: int = SUMMARY_RUNS, directory: Path = None) -> Dict[str, Any]:
+    """Per-agent wall / CPU / I/O p50 and p95 over the last `runs` trace files."""
+    directory = Path(directory or TRACES_PATH)
+    files = sorted(directory.glob("trace_*.json"))[-runs:] if directory.exists() else []
+
+    samples: Dict[str, Dict[str, List[float]]] = {}
+    run_wall = []
+    for path in files:
+        try:
+            with _real_open(path) as f:
+                trace = json.load(f)
+        except (OSError, ValueError):
+            continue
+        for event in trace.get("traceEvents", []):
+            if event.get("ph") != "X":
+                continue
+            if event.get("cat") == "run":
+                run_wall.append(event["dur"] / 1000)
+            elif event.get("cat") == "agent":
+                args = event.get("args", {})
+                agent = samples.setdefault(event["name"], {"wall_ms": [], "cpu_ms": [], "io_ms": [],
+                                                            "bytes_read": []})
+                for key in agent:
+                    agent[key].append(float(args.get(key, 0)))
+
+    agents = {}
+    for name, metrics in samples.items():
+        entry = {"calls": len(metrics["wall_ms"])}
+        for key, values in metrics.items():
+            values.sort()
+            entry[key] = {"p50": round(_percentile(values, 50), 3), "p95": round(_percentile(values, 95), 3)}
+        agents[name] = entry
+
+    run_wall.sort()
+    return {
+        "runs": len(files),
+        "run_wall_ms": {"p50": round(_percentile(run_wall, 50), 3), "p95": round(_percentile(run_wall, 95), 3)},
+        "agents": dict(sorted(agents.items(), key=lambda kv: -kv[1]["wall_ms"]["p95"]))
+    }
+
+
+def print_summary(summary: Dict[str, Any]):
+    print(f"\nTrace summary over {summary['runs']} runs "
+          f"(run p50 {summary['run_wall_ms']['p50']:.1f}ms, p95 {summary['run_wall_ms']['p95']:.1f}ms)")
+    print(f"  {'agent':<24}{'calls':>6}{'wall p50':>10}{'wall p95':>10}{'cpu p95':>9}{'io p95':>9}{'read p95':>10}")
+    for name, entry in summary["agents"].items():
+        print(f"  {name:<24}{entry['calls']:>6}{entry['wall_ms']['p50']:>10.2f}{entry['wall_ms']['p95']:>10.2f}"
+              f"{entry['cpu_ms']['p95']:>9.2f}{entry['io_ms']['p95']:>9.2f}{int(entry['bytes_read']['p95']):>10}")
+
+
+def main():
+    if len(sys.argv) < 2:
+        print("Brain Tracing")
+        print("=" * 40)
+        print("\nCommands:")
+        print("  summary [runs]       - Per-agent p50/p95 over recent traces")
+        print("  latest               - Path of the newest trace file")
+        print("\nEnable tracing with BRAIN_TRACE=1 (or AgentOrchestrator(trace=True)).")
+        return
+
+    command = sys.argv[1]
+    if command == "summary":
+        runs = int(sys.argv[2]) if len(sys.argv) >= 3 else SUMMARY_RUNS
+        print_summary(summarize(runs))
+    elif command == "latest":
+        traces = sorted(TRACES_PATH.glob("trace_*.json")) if TRACES_PATH.exists() else []
+        print(traces[-1] if traces else "No traces yet")
+    else:
+        print(f"Unknown command: {command}")
+
+
+if __name__ == "__main__":
+    main()
@@ -12,6 +12,8 @@ Expected Performance:
 - Hit rates: Memory 60% → Filesystem 25% → Database 15%
 - Response time: 500ms → 50ms average (10x speedup)
 - Database load: 100% → 15% (85% reduction)
+
+Measured numbers: python BENCHMARKS/CYCLOTRON_BENCHMARK.py --suites cache
 """
 
 import json
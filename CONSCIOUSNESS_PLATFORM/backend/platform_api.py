@@ -29,6 +29,7 @@ try:
     from MANIPULATION_DETECTOR import ManipulationDetector
     from TIMELINE_PROJECTOR import TimelineProjector
     from SEVEN_DOMAINS_ANALYZER import SevenDomainsAnalyzer
+    from TEXT_FEATURES import TextFeatures
     ENGINES_AVAILABLE = True
 except ImportError as e:
     print(f"Warning: Pattern Theory Engine not available: {e}")
@@ -170,6 +171,78 @@ def analyze_pattern():
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
+@app.route('/api/analyze/all', methods=['POST'])
+def analyze_all():
+    """
+    Every analysis from one preprocessing pass.
+
+    Request body:
+    {
+        "text": "Text to analyze",
+        "context": "Optional context",
+        "consciousness": 0-100 (optional, for timeline projection)
+    }
+    """
+    if not ENGINES_AVAILABLE:
+        return jsonify({"error": "Pattern Theory Engine not available"}), 503
+
+    try:
+        data = request.get_json()
+        text = data.get("text", "")
+        context = data.get("context")
+
+        # Lowercasing, tokens, sentences and marker scan shared by all five
+        features = TextFeatures(text)
+        pattern = pattern_engine.analyze(text, context, features)
+        consciousness = consciousness_scorer.score_from_text(text, features)
+        manipulation = manipulation_detector.detect(text, context, features)
+        domains = domains_analyzer.analyze(text, context, features)
+        level = data.get("consciousness", min(100.0, consciousness.consciousness_level))
+        projection = timeline_projector.project(text, context, level, features)
+        stats["analyses_run"] += 1
+        stats["detections_performed"] += 1
+
+        return jsonify({
+            "success": True,
+            "result": {
+                "pattern": {
+                    "truth_score": pattern.truth_score,
+                    "deceit_score": pattern.deceit_score,
+                    "algorithm": pattern.algorithm,
+                    "pattern_type": pattern.pattern_type,
+                    "confidence": pattern.confidence,
+                    "recommendation": pattern.recommended_action
+                },
+                "consciousness": {
+                    "level": consciousness.consciousness_level,
+                    "level_name": consciousness.level_name,
+                    "manipulation_immunity": consciousness.manipulation_immunity
+                },
+                "manipulation": {
+                    "m_score": manipulation.m_score,
+                    "risk_level": manipulation.risk_level,
+                    "red_flags": manipulation.red_flags,
+                    "counter_strategy": manipulation.counter_strategy
+                },
+                "domains": {
+                    "balance_score": domains.balance_score,
+                    "domain_scores": {k: v.score for k, v in domains.domains.items()},
+                    "strongest": domains.strongest_domain,
+                    "weakest": domains.weakest_domain
+                },
+                "timeline": {
+                    "timelines": [
+                        {"name": t.name, "probability": t.success_probability}
+                        for t in [projection.timeline_a, projection.timeline_b, projection.timeline_c]
+                    ],
+                    "recommended": projection.recommended
+                }
+            }
+        })
+
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
 # ============= Manipulation Detection =============
 
 @app.route('/api/detect', methods=['POST'])
@@ -300,6 +373,7 @@ if __name__ == "__main__":
     print("  GET  /api/bridge/questions - Get assessment questions")
     print("  POST /api/bridge/assess - Run consciousness assessment")
     print("  POST /api/analyze - Pattern Theory analysis")
+    print("  POST /api/analyze/all - Every analysis, one preprocessing pass")
     print("  POST /api/detect - Manipulation detection")
     print("  POST /api/project - Timeline projection")
     print("  POST /api/domains - Seven Domains analysis")
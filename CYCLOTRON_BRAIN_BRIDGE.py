@@ -7,11 +7,19 @@ Creates, queries, and manages knowledge atoms with agent intelligence.
 
 import json
 import hashlib
+import os
+import tempfile
+from contextlib import contextmanager
 from pathlib import Path
 from datetime import datetime
 from typing import Optional, List, Dict
 import re
 
+try:
+    import fcntl  # inter-process lock for INDEX.json (POSIX)
+except ImportError:
+    fcntl = None
+
 # Paths
 HOME = Path.home()
 CONSCIOUSNESS = HOME / ".consciousness"
@@ -89,8 +97,12 @@ class CyclotronBridge:
 
     def __init__(self):
         self.index_path = CYCLOTRON / "INDEX.json"
+        self.lock_path = CYCLOTRON / "INDEX.json.lock"
         self.atoms_path = CYCLOTRON / "atoms"
         self.atoms_path.mkdir(exist_ok=True)
+        self._batch_depth = 0
+        self._index_dirty = False
+        self._unsaved = []  # (index entry, source) not yet merged into INDEX.json
         self._load_index()
 
     def _load_index(self):
@@ -111,11 +123,73 @@ class CyclotronBridge:
                 "updated": datetime.now().isoformat()
             }
 
+    @contextmanager
+    def _index_lock(self):
+        """Exclusive lock on INDEX.json across processes (released on close)."""
+        with open(self.lock_path, 'a') as lock:
+            if fcntl:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+            yield
+
     def _save_index(self):
-        """Save index."""
-        self.index["updated"] = datetime.now().isoformat()
-        with open(self.index_path, 'w') as f:
-            json.dump(self.index, f, indent=2)
+        """
+        Save index (deferred to the end of an open batch).
+
+        Several processes (e.g. runners draining one queue) write INDEX.json,
+        so under the lock the file is re-read, this bridge's new atoms are
+        merged in, and the result atomically replaces the file.
+        """
+        if self._batch_depth:
+            self._index_dirty = True
+            return
+        with self._index_lock():
+            self._load_index()
+            for entry, source in self._unsaved:
+                self._apply_atom(self.index, entry, source)
+            self._unsaved = []
+            self.index["updated"] = datetime.now().isoformat()
+
+            fd, tmp_path = tempfile.mkstemp(dir=CYCLOTRON, prefix=".INDEX.", suffix=".tmp")
+            try:
+                with os.fdopen(fd, 'w') as f:
+                    json.dump(self.index, f, indent=2)
+                os.replace(tmp_path, self.index_path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+
+    @staticmethod
+    def _apply_atom(index: dict, entry: dict, source: str):
+        """Add one atom's entry to the atom list, tag/type maps and stats."""
+        index["atoms"].append(entry)
+
+        # Update tag index
+        for tag in entry["tags"]:
+            index["tags"].setdefault(tag, []).append(entry["id"])
+
+        # Update type index
+        atom_type = entry["type"]
+        index["types"].setdefault(atom_type, []).append(entry["id"])
+
+        # Update stats
+        index["stats"]["total"] += 1
+        index["stats"]["by_type"][atom_type] = index["stats"]["by_type"].get(atom_type, 0) + 1
+        index["stats"]["by_source"][source] = index["stats"]["by_source"].get(source, 0) + 1
+
+    @contextmanager
+    def batch(self):
+        """
+        Group atom writes: atom files are written as usual, but INDEX.json
+        is rewritten once when the outermost batch exits.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._index_dirty:
+                self._index_dirty = False
+                self._save_index()
 
     # === ATOM OPERATIONS ===
 
@@ -139,29 +213,15 @@ class CyclotronBridge:
         with open(atom_file, 'w') as f:
             json.dump(atom.to_dict(), f, indent=2)
 
-        # Update index
-        self.index["atoms"].append({
+        # Update index (in memory now, merged into INDEX.json on save)
+        entry = {
             "id": atom.id,
             "preview": content[:100],
             "type": atom_type,
-            "tags": atom.tags
-        })
-
-        # Update tag index
-        for tag in atom.tags:
-            if tag not in self.index["tags"]:
-                self.index["tags"][tag] = []
-            self.index["tags"][tag].append(atom.id)
-
-        # Update type index
-        if atom_type not in self.index["types"]:
-            self.index["types"][atom_type] = []
-        self.index["types"][atom_type].append(atom.id)
-
-        # Update stats
-        self.index["stats"]["total"] += 1
-        self.index["stats"]["by_type"][atom_type] = self.index["stats"]["by_type"].get(atom_type, 0) + 1
-        self.index["stats"]["by_source"][source] = self.index["stats"]["by_source"].get(source, 0) + 1
+            "tags": list(atom.tags)
+        }
+        self._apply_atom(self.index, entry, source)
+        self._unsaved.append((entry, source))
 
         self._save_index()
 
@@ -347,37 +407,39 @@ class CyclotronBridge:
         """Store agent execution results as atoms."""
         created = []
 
-        # Store task as action
-        task_atom = self.create_atom(
-            f"Task: {task}",
-            atom_type="action",
-            source=f"agent_{agent_name}",
-            tags=["task", "agent"]
-        )
-        created.append(task_atom)
-
-        # Store decisions
-        for decision in decisions:
-            dec_atom = self.create_atom(
-                f"Decision: {decision.get('decision', '')} - Rationale: {decision.get('rationale', '')}",
-                atom_type="decision",
+        # One INDEX.json write for the whole output
+        with self.batch():
+            # Store task as action
+            task_atom = self.create_atom(
+                f"Task: {task}",
+                atom_type="action",
                 source=f"agent_{agent_name}",
-                tags=["decision", "agent"]
+                tags=["task", "agent"]
             )
-            created.append(dec_atom)
-            self.link_atoms(task_atom.id, dec_atom.id)
-
-        # Store insights from memory
-        for mem in memory:
-            if mem.get("category") in ["insight", "pattern", "learning"]:
-                insight_atom = self.create_atom(
-                    mem.get("content", ""),
-                    atom_type="insight",
+            created.append(task_atom)
+
+            # Store decisions
+            for decision in decisions:
+                dec_atom = self.create_atom(
+                    f"Decision: {decision.get('decision', '')} - Rationale: {decision.get('rationale', '')}",
+                    atom_type="decision",
                     source=f"agent_{agent_name}",
-                    tags=[mem.get("category", "insight"), "agent"]
+                    tags=["decision", "agent"]
                 )
-                created.append(insight_atom)
-                self.link_atoms(task_atom.id, insight_atom.id)
+                created.append(dec_atom)
+                self.link_atoms(task_atom.id, dec_atom.id)
+
+            # Store insights from memory
+            for mem in memory:
+                if mem.get("category") in ["insight", "pattern", "learning"]:
+                    insight_atom = self.create_atom(
+                        mem.get("content", ""),
+                        atom_type="insight",
+                        source=f"agent_{agent_name}",
+                        tags=[mem.get("category", "insight"), "agent"]
+                    )
+                    created.append(insight_atom)
+                    self.link_atoms(task_atom.id, insight_atom.id)
 
         print(f"Stored {len(created)} atoms from agent {agent_name}")
         return created
@@ -0,0 +1,355 @@
+#!/usr/bin/env python3
+"""
+CYCLOTRON PATTERN SCAN - Manipulation Scan of the Indexed Corpus
+================================================================
+
+Runs PatternDetector and ManipulationDetector over every document in the
+Cyclotron FTS `knowledge` table and stores compact results in
+`pattern_scan` (keyed by path + content hash) so reruns only touch
+documents that changed.
+
+    knowledge (rowid, path, hash) --stream--> changed? --shard--> process pool
+                                                                     |
+    pattern_scan / pattern_scan_domain  <--- one transaction per chunk
+
+Workers read document content themselves by rowid (the parent only ships
+rowids), and at most two chunks per worker are in flight.
+
+Usage:
+    python CYCLOTRON_PATTERN_SCAN.py scan [--force] [--workers N]
+    python CYCLOTRON_PATTERN_SCAN.py top <domain> [--by domain|m_score] [--limit N]
+    python CYCLOTRON_PATTERN_SCAN.py stats
+
+Created: 2025-11-22
+Trinity Build: C1 × C2 × C3
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from datetime import datetime
+from itertools import islice
+from pathlib import Path
+from typing import Any, Dict, Iterator, List
+
+ROOT_DIR = Path(__file__).parent
+sys.path.insert(0, str(ROOT_DIR))
+sys.path.insert(0, str(ROOT_DIR / "PATTERN_THEORY_ENGINE" / "core"))
+
+from PATTERN_DETECTOR import DOMAINS, PatternDetector
+from MANIPULATION_DETECTOR import ManipulationDetector
+
+DB_PATH = Path.home() / '100X_DEPLOYMENT' / '.cyclotron_atoms' / 'cyclotron.db'
+
+# Configuration (environment overridable)
+SCAN_WORKERS = int(os.environ.get("PATTERN_SCAN_WORKERS", os.cpu_count() or 1))
+SCAN_CHUNK_SIZE = int(os.environ.get("PATTERN_SCAN_CHUNK_SIZE", 32))
+
+SORT_COLUMNS = {
+    "domain": "d.score DESC, s.m_score DESC",
+    "m_score": "s.m_score DESC, d.score DESC"
+}
+
+
+def init_scan_tables(conn: sqlite3.Connection):
+    """Create pattern_scan tables (idempotent)."""
+    conn.executescript('''
+        CREATE TABLE IF NOT EXISTS pattern_scan (
+            path TEXT PRIMARY KEY,
+            hash TEXT NOT NULL,
+            name TEXT,
+            type TEXT,
+            text_length INTEGER,
+            threat_level TEXT,
+            total_score INTEGER,
+            patterns_detected INTEGER,
+            m_score REAL,
+            risk_level TEXT,
+            manipulation_type TEXT,
+            top_patterns TEXT,
+            scanned_at TEXT
+        );
+        CREATE INDEX IF NOT EXISTS idx_pattern_scan_m_score ON pattern_scan(m_score DESC);
+
+        -- Sparse: one row per document per domain with a non-zero score
+        CREATE TABLE IF NOT EXISTS pattern_scan_domain (
+            domain TEXT NOT NULL,
+            path TEXT NOT NULL,
+            score INTEGER NOT NULL,
+            PRIMARY KEY (domain, path)
+        );
+        CREATE INDEX IF NOT EXISTS idx_pattern_scan_domain_score
+            ON pattern_scan_domain(domain, score DESC);
+    ''')
+    conn.commit()
+
+
+# === WORKER SIDE ===
+
+_worker = {}
+
+
+def _init_worker(db_path: str):
+    """Per-process state: read-only connection and detectors."""
+    _worker["conn"] = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True, timeout=30)
+    _worker["patterns"] = PatternDetector(history_size=1, log_path=None)
+    _worker["manipulation"] = ManipulationDetector()
+
+
+def scan_document(text: str, patterns: PatternDetector,
+                  manipulation: ManipulationDetector) -> Dict[str, Any]:
+    """Compact scan result for one document."""
+    result = patterns.analyze(text)
+    detection = manipulation.detect(text)
+    return {
+        "text_length": len(text),
+        "threat_level": result["threat_level"],
+        "total_score": result["total_score"],
+        "patterns_detected": result["patterns_detected"],
+        "domain_scores": {d: s for d, s in result["domain_scores"].items() if s},
+        "top_patterns": [{"pattern": d["pattern"], "score": d["score"]} for d in result["detections"][:5]],
+        "m_score": detection.m_score,
+        "risk_level": detection.risk_level,
+        "manipulation_type": detection.manipulation_type
+    }
+
+
+def _scan_chunk(docs: List[tuple]) -> List[Dict[str, Any]]:
+    """Scan (rowid, path, name, type, hash) docs, reading content by rowid."""
+    if not _worker:
+        _init_worker(str(DB_PATH))
+    conn = _worker["conn"]
+    results = []
+    for rowid, path, name, file_type, content_hash in docs:
+        row = conn.execute("SELECT content FROM knowledge WHERE rowid = ?", (rowid,)).fetchone()
+        text = row[0] if row and row[0] else ""
+        try:
+            scan = scan_document(text, _worker["patterns"], _worker["manipulation"])
+        except Exception as e:
+            results.append({"path": path, "error": str(e)})
+            continue
+        scan.update(path=path, name=name, type=file_type,
+                    hash=content_hash or hashlib.md5(text.encode()).hexdigest())
+        results.append(scan)
+    return results
+
+
+# === PARENT SIDE ===
+
+class PatternScanJob:
+    """Incremental corpus scan writing to pattern_scan."""
+
+    def __init__(self, db_path: Path = DB_PATH, workers: int = SCAN_WORKERS,
+                 chunk_size: int = SCAN_CHUNK_SIZE):
+        self.db_path = Path(db_path)
+        self.workers = max(1, workers)
+        self.chunk_size = max(1, chunk_size)
+
+    def _changed_docs(self, reader: sqlite3.Connection, known: Dict[str, str],
+                      seen: set, stats: Dict[str, int], force: bool) -> Iterator[tuple]:
+        """Stream knowledge rows, yielding only new or changed documents."""
+        cursor = reader.execute("SELECT rowid, path, name, type, hash FROM knowledge")
+        for doc in cursor:
+            path, content_hash = doc[1], doc[4]
+            if path in seen:
+                continue  # indexed twice via overlapping vacuum dirs
+            seen.add(path)
+            if not force and content_hash and known.get(path) == content_hash:
+                stats["skipped"] += 1
+                continue
+            yield doc
+
+    def _chunks(self, docs: Iterator[tuple]) -> Iterator[List[tuple]]:
+        while True:
+            chunk = list(islice(docs, self.chunk_size))
+            if not chunk:
+                return
+            yield chunk
+
+    def _results(self, chunks: Iterator[List[tuple]]) -> Iterator[List[Dict[str, Any]]]:
+        """Chunk results as they complete; bounded in-flight window."""
+        if self.workers <= 1:
+            _init_worker(str(self.db_path))
+            for chunk in chunks:
+                yield _scan_chunk(chunk)
+            return
+
+        with ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                 initargs=(str(self.db_path),)) as pool:
+            pending = set()
+            while True:
+                while len(pending) < self.workers * 2:
+                    chunk = next(chunks, None)
+                    if chunk is None:
+                        break
+                    pending.add(pool.submit(_scan_chunk, chunk))
+                if not pending:
+                    return
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+
+    def _write(self, conn: sqlite3.Connection, results: List[Dict[str, Any]], stats: Dict[str, int]):
+        now = datetime.now().isoformat()
+        with conn:
+            for r in results:
+                if "error" in r:
+                    stats["errors"] += 1
+                    continue
+                conn.execute('''
+                    INSERT OR REPLACE INTO pattern_scan
+                    (path, hash, name, type, text_length, threat_level, total_score,
+                     patterns_detected, m_score, risk_level, manipulation_type, top_patterns, scanned_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ''', (r["path"], r["hash"], r["name"], r["type"], r["text_length"], r["threat_level"],
+                      r["total_score"], r["patterns_detected"], r["m_score"], r["risk_level"],
+                      r["manipulation_type"], json.dumps(r["top_patterns"]), now))
+                conn.execute("DELETE FROM pattern_scan_domain WHERE path = ?", (r["path"],))
+                conn.executemany(
+                    "INSERT INTO pattern_scan_domain (domain, path, score) VALUES (?, ?, ?)",
+                    [(domain, r["path"], score) for domain, score in r["domain_scores"].items()]
+                )
+                stats["scanned"] += 1
+
+    def _remove_stale(self, conn: sqlite3.Connection, known: Dict[str, str], seen: set) -> int:
+        stale = [(path,) for path in known if path not in seen]
+        with conn:
+            conn.executemany("DELETE FROM pattern_scan WHERE path = ?", stale)
+            conn.executemany("DELETE FROM pattern_scan_domain WHERE path = ?", stale)
+        return len(stale)
+
+    def run(self, force: bool = False) -> Dict[str, Any]:
+        """
+        Scan new and changed documents; drop results for removed ones.
+
+        Args:
+            force: Rescan everything, ignoring stored hashes
+
+        Returns:
+            Counts of scanned/skipped/removed/errored documents and timing
+        """
+        if not self.db_path.exists():
+            return {"error": f"Database not found: {self.db_path}"}
+
+        start = time.time()
+        conn = sqlite3.connect(str(self.db_path), timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")  # workers keep reading while we write
+        init_scan_tables(conn)
+        reader = sqlite3.connect(str(self.db_path), timeout=30)
+
+        stats = {"scanned": 0, "skipped": 0, "removed": 0, "errors": 0}
+        known = dict(conn.execute("SELECT path, hash FROM pattern_scan"))
+        seen = set()
+        try:
+            docs = self._changed_docs(reader, known, seen, stats, force)
+            for results in self._results(self._chunks(docs)):
+                self._write(conn, results, stats)
+            stats["removed"] = self._remove_stale(conn, known, seen)
+        finally:
+            reader.close()
+            conn.close()
+
+        stats["documents"] = len(seen)
+        stats["seconds"] = round(time.time() - start, 2)
+        stats["workers"] = self.workers
+        return stats
+
+
+# === QUERIES ===
+
+def top_documents(conn: sqlite3.Connection, domain: str, by: str = "domain",
+                  limit: int = 20) -> List[Dict[str, Any]]:
+    """
+    Highest-scoring documents in one manipulation domain.
+
+    Args:
+        domain: One of PATTERN_DETECTOR.DOMAINS
+        by: "domain" (PatternDetector domain score) or "m_score"
+            (ManipulationDetector score), the other breaks ties
+        limit: Max documents
+    """
+    if domain not in DOMAINS:
+        raise ValueError(f"Unknown domain '{domain}' (expected one of {', '.join(DOMAINS)})")
+    if by not in SORT_COLUMNS:
+        raise ValueError(f"Unknown sort '{by}' (expected one of {', '.join(SORT_COLUMNS)})")
+
+    rows = conn.execute(f'''
+        SELECT s.path, s.name, s.type, d.score, s.m_score, s.risk_level, s.threat_level,
+               s.manipulation_type, s.top_patterns, s.scanned_at
+        FROM pattern_scan_domain d
+        JOIN pattern_scan s ON s.path = d.path
+        WHERE d.domain = ?
+        ORDER BY {SORT_COLUMNS[by]}
+        LIMIT ?
+    ''', (domain, limit)).fetchall()
+
+    return [{
+        "path": row[0],
+        "name": row[1],
+        "type": row[2],
+        "domain_score": row[3],
+        "m_score": row[4],
+        "risk_level": row[5],
+        "threat_level": row[6],
+        "manipulation_type": row[7],
+        "top_patterns": json.loads(row[8] or "[]"),
+        "scanned_at": row[9]
+    } for row in rows]
+
+
+def scan_stats(conn: sqlite3.Connection) -> Dict[str, Any]:
+    """Document counts per threat level, risk level and domain."""
+    return {
+        "documents": conn.execute("SELECT COUNT(*) FROM pattern_scan").fetchone()[0],
+        "last_scanned": conn.execute("SELECT MAX(scanned_at) FROM pattern_scan").fetchone()[0],
+        "threat_levels": dict(conn.execute(
+            "SELECT threat_level, COUNT(*) FROM pattern_scan GROUP BY threat_level")),
+        "risk_levels": dict(conn.execute(
+            "SELECT risk_level, COUNT(*) FROM pattern_scan GROUP BY risk_level")),
+        "domains": dict(conn.execute(
+            "SELECT domain, COUNT(*) FROM pattern_scan_domain GROUP BY domain"))
+    }
+
+
+def main():
+    args = sys.argv[1:]
+    if not args or args[0] not in ("scan", "top", "stats"):
+        print(__doc__.split("Usage:")[1].split("Created:")[0].rstrip())
+        return
+
+    options = {"--workers": str(SCAN_WORKERS), "--by": "domain", "--limit": "20"}
+    for flag, value in zip(args, args[1:]):
+        if flag in options:
+            options[flag] = value
+
+    if args[0] == "scan":
+        job = PatternScanJob(workers=int(options["--workers"]))
+        print(f"Scanning {job.db_path} with {job.workers} workers...")
+        print(json.dumps(job.run(force="--force" in args), indent=2))
+        return
+
+    if not DB_PATH.exists():
+        print(f"Database not found: {DB_PATH}")
+        return
+    conn = sqlite3.connect(str(DB_PATH))
+    init_scan_tables(conn)
+    try:
+        if args[0] == "stats":
+            print(json.dumps(scan_stats(conn), indent=2))
+        elif len(args) < 2:
+            print(f"Domain required: {', '.join(DOMAINS)}")
+        else:
+            for doc in top_documents(conn, args[1], options["--by"], int(options["--limit"])):
+                print(f"  {doc['domain_score']:>4}  M={doc['m_score']:<5} {doc['risk_level']:<8} {doc['path']}")
+    except ValueError as e:
+        print(e)
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -7,13 +7,26 @@ Searches the actual CONTENT of files, not just filenames.
 Returns relevant passages with context.
 """
 
+import codecs
+import hashlib
+import io
+import mimetypes
+import os
 import sqlite3
+from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request, jsonify, send_file
 from flask_cors import CORS
 
+from API_INFRASTRUCTURE import (conditional_get, file_generation, init_request_timing,
+                                init_response_optimization, span)
+from CYCLOTRON_PATTERN_SCAN import init_scan_tables, scan_stats, top_documents
+
 app = Flask(__name__)
 CORS(app)
+init_request_timing(app, 'search')
+init_response_optimization(app)
 
 DB_PATH = Path.home() / '100X_DEPLOYMENT' / '.cyclotron_atoms' / 'cyclotron.db'
 
@@ -23,6 +36,10 @@ def get_db():
         return None
     return sqlite3.connect(str(DB_PATH))
 
+def index_version():
+    """ETag source: index generation (db + WAL stat) and the full request URL"""
+    return (file_generation(DB_PATH, f"{DB_PATH}-wal"), request.full_path)
+
 @app.route('/api/search', methods=['GET'])
 def api_search():
     """
@@ -47,38 +64,40 @@ def api_search():
     cursor = conn.cursor()
 
     try:
-        # Build query with optional type filter
-        if file_type:
-            cursor.execute('''
-                SELECT
-                    path,
-                    name,
-                    type,
-                    snippet(knowledge, 3, '**', '**', '...', 64) as snippet,
-                    modified,
-                    bm25(knowledge) as score
-                FROM knowledge
-                WHERE knowledge MATCH ? AND type = ?
-                ORDER BY score
-                LIMIT ?
-            ''', (query, file_type, limit))
-        else:
-            cursor.execute('''
-                SELECT
-                    path,
-                    name,
-                    type,
-                    snippet(knowledge, 3, '**', '**', '...', 64) as snippet,
-                    modified,
-                    bm25(knowledge) as score
-                FROM knowledge
-                WHERE knowledge MATCH ?
-                ORDER BY score
-                LIMIT ?
-            ''', (query, limit))
+        with span('db'):
+            # Build query with optional type filter
+            if file_type:
+                cursor.execute('''
+                    SELECT
+                        path,
+                        name,
+                        type,
+                        snippet(knowledge, 3, '**', '**', '...', 64) as snippet,
+                        modified,
+                        bm25(knowledge) as score
+                    FROM knowledge
+                    WHERE knowledge MATCH ? AND type = ?
+                    ORDER BY score
+                    LIMIT ?
+                ''', (query, file_type, limit))
+            else:
+                cursor.execute('''
+                    SELECT
+                        path,
+                        name,
+                        type,
+                        snippet(knowledge, 3, '**', '**', '...', 64) as snippet,
+                        modified,
+                        bm25(knowledge) as score
+                    FROM knowledge
+                    WHERE knowledge MATCH ?
+                    ORDER BY score
+                    LIMIT ?
+                ''', (query, limit))
+            rows = cursor.fetchall()
 
         results = []
-        for row in cursor.fetchall():
+        for row in rows:
             results.append({
                 'path': row[0],
                 'name': row[1],
@@ -88,11 +107,12 @@ def api_search():
                 'score': round(abs(row[5]), 3)
             })
 
-        return jsonify({
-            'query': query,
-            'count': len(results),
-            'results': results
-        })
+        with span('serialize'):
+            return jsonify({
+                'query': query,
+                'count': len(results),
+                'results': results
+            })
 
     except Exception as e:
         return jsonify({'error': str(e)}), 500
@@ -125,20 +145,22 @@ def api_ask():
         terms = [w for w in question.lower().split() if w not in stopwords and len(w) > 2]
         search_query = ' OR '.join(terms) if terms else question
 
-        cursor.execute('''
-            SELECT
-                path,
-                name,
-                snippet(knowledge, 3, '>>>', '<<<', '...', 100) as snippet,
-                bm25(knowledge) as score
-            FROM knowledge
-            WHERE knowledge MATCH ?
-            ORDER BY score
-            LIMIT ?
-        ''', (search_query, limit))
+        with span('db'):
+            cursor.execute('''
+                SELECT
+                    path,
+                    name,
+                    snippet(knowledge, 3, '>>>', '<<<', '...', 100) as snippet,
+                    bm25(knowledge) as score
+                FROM knowledge
+                WHERE knowledge MATCH ?
+                ORDER BY score
+                LIMIT ?
+            ''', (search_query, limit))
+            rows = cursor.fetchall()
 
         results = []
-        for row in cursor.fetchall():
+        for row in rows:
             results.append({
                 'source': row[1],
                 'path': row[0],
@@ -146,11 +168,12 @@ def api_ask():
                 'relevance': round(abs(row[3]), 3)
             })
 
-        return jsonify({
-            'question': question,
-            'search_terms': terms,
-            'answers': results
-        })
+        with span('serialize'):
+            return jsonify({
+                'question': question,
+                'search_terms': terms,
+                'answers': results
+            })
 
     except Exception as e:
         return jsonify({'error': str(e)}), 500
@@ -158,6 +181,7 @@ def api_ask():
         conn.close()
 
 @app.route('/api/stats', methods=['GET'])
+@conditional_get(index_version)
 def api_stats():
     """Get index statistics"""
     conn = get_db()
@@ -194,6 +218,7 @@ def api_stats():
         conn.close()
 
 @app.route('/api/recent', methods=['GET'])
+@conditional_get(index_version)
 def api_recent():
     """Get most recently modified files"""
     limit = int(request.args.get('limit', 20))
@@ -233,8 +258,9 @@ def api_recent():
         conn.close()
 
 @app.route('/api/file', methods=['GET'])
+@conditional_get(index_version)
 def api_file():
-    """Get full content of a specific file"""
+    """Get full content of a specific file (prefer /api/file/raw + /api/file/meta)"""
     filepath = request.args.get('path', '')
 
     if not filepath:
@@ -269,6 +295,191 @@ def api_file():
     finally:
         conn.close()
 
+HASH_CHUNK_BYTES = 1024 * 1024
+
+@lru_cache(maxsize=1024)
+def _disk_hashes(filepath, mtime_ns, size):
+    """
+    md5 of the raw bytes and of the utf-8 text (both index conventions)
+
+    CYCLOTRON_DAEMON hashes raw bytes; CYCLOTRON_CONTENT_INDEXER hashes the
+    text read in text mode with errors='ignore', which also translates
+    CRLF / CR to LF - the same newline decoder is applied here. One
+    streaming pass computes both with flat memory, cached per (path,
+    mtime, size).
+    """
+    raw = hashlib.md5()
+    text = hashlib.md5()
+    decoder = io.IncrementalNewlineDecoder(
+        codecs.getincrementaldecoder('utf-8')(errors='ignore'), translate=True)
+    with open(filepath, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_BYTES), b''):
+            raw.update(chunk)
+            text.update(decoder.decode(chunk).encode())
+    text.update(decoder.decode(b'', final=True).encode())
+    return raw.hexdigest(), text.hexdigest()
+
+def file_status(filepath, stored_modified, stored_hash):
+    """Compare the file on disk with its index entry: fresh / stale / missing"""
+    try:
+        stat = os.stat(filepath)
+    except OSError:
+        return 'missing', None
+
+    # Fast path: unchanged mtime (indexer stores int seconds, daemon ISO text)
+    mtime = stat.st_mtime
+    if str(stored_modified) in (str(int(mtime)), datetime.fromtimestamp(mtime).isoformat()):
+        return 'fresh', stat
+
+    hashes = _disk_hashes(filepath, stat.st_mtime_ns, stat.st_size)
+    return ('fresh' if stored_hash in hashes else 'stale'), stat
+
+def get_index_entry(cursor, filepath):
+    """Metadata for an indexed path - never pulls the content column"""
+    cursor.execute('''
+        SELECT name, type, modified, hash
+        FROM knowledge
+        WHERE path = ?
+    ''', (filepath,))
+    return cursor.fetchone()
+
+def file_meta_version():
+    """ETag source for /api/file/meta: the index version plus the file's own
+    mtime/size (or missing), since status and size_bytes come from disk"""
+    return (index_version(), file_generation(request.args.get('path', '')))
+
+@app.route('/api/file/meta', methods=['GET'])
+@conditional_get(file_meta_version)
+def api_file_meta():
+    """Lightweight file metadata (no content) plus on-disk freshness"""
+    filepath = request.args.get('path', '')
+
+    if not filepath:
+        return jsonify({'error': 'Path required'}), 400
+
+    conn = get_db()
+    if not conn:
+        return jsonify({'error': 'Database not found'}), 404
+
+    try:
+        row = get_index_entry(conn.cursor(), filepath)
+        if not row:
+            return jsonify({'error': 'File not found in index'}), 404
+
+        status, stat = file_status(filepath, row[2], row[3])
+        return jsonify({
+            'path': filepath,
+            'name': row[0],
+            'type': row[1],
+            'modified': row[2],
+            'hash': row[3],
+            'status': status,
+            'size_bytes': stat.st_size if stat else None
+        })
+
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+    finally:
+        conn.close()
+
+@app.route('/api/file/raw', methods=['GET'])
+def api_file_raw():
+    """
+    Stream the original file bytes from disk (sendfile + Range support)
+
+    Only indexed paths are served. X-Cyclotron-Status reports fresh/stale
+    against the stored hash; if the file is gone the indexed content is
+    returned instead with X-Cyclotron-Source: index.
+    """
+    filepath = request.args.get('path', '')
+
+    if not filepath:
+        return jsonify({'error': 'Path required'}), 400
+
+    conn = get_db()
+    if not conn:
+        return jsonify({'error': 'Database not found'}), 404
+
+    try:
+        cursor = conn.cursor()
+        row = get_index_entry(cursor, filepath)
+        if not row:
+            return jsonify({'error': 'File not found in index'}), 404
+
+        status, _ = file_status(filepath, row[2], row[3])
+
+        if status != 'missing':
+            mimetype = mimetypes.guess_type(filepath)[0] or 'text/plain'
+            response = send_file(filepath, mimetype=mimetype, conditional=True)
+            response.headers['X-Cyclotron-Source'] = 'disk'
+        else:
+            cursor.execute('SELECT content FROM knowledge WHERE path = ?', (filepath,))
+            response = Response(cursor.fetchone()[0], mimetype='text/plain')
+            response.headers['X-Cyclotron-Source'] = 'index'
+
+        response.headers['X-Cyclotron-Status'] = status
+        response.headers['X-Cyclotron-Hash'] = row[3] or ''
+        return response
+
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+    finally:
+        conn.close()
+
+@app.route('/api/patterns/top', methods=['GET'])
+@conditional_get(index_version)
+def api_patterns_top():
+    """
+    Top documents by manipulation score in one domain (from the pattern scan)
+
+    Query params:
+      domain: media, relationships, finance, authority, self, groups, digital
+      by: domain (pattern score, default) or m_score
+      limit: max results (default 20, 1-500)
+    """
+    domain = request.args.get('domain', '')
+    by = request.args.get('by', 'domain')
+
+    conn = get_db()
+    if not conn:
+        return jsonify({'error': 'Database not found'}), 404
+
+    try:
+        # Bad input is a 400 (ValueError below), not a 500
+        limit = max(1, min(int(request.args.get('limit', 20)), 500))
+        init_scan_tables(conn)
+        documents = top_documents(conn, domain, by, limit)
+        return jsonify({
+            'domain': domain,
+            'by': by,
+            'count': len(documents),
+            'documents': documents
+        })
+
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+    finally:
+        conn.close()
+
+@app.route('/api/patterns/stats', methods=['GET'])
+@conditional_get(index_version)
+def api_patterns_stats():
+    """Pattern scan coverage: documents per threat level, risk level and domain"""
+    conn = get_db()
+    if not conn:
+        return jsonify({'error': 'Database not found'}), 404
+
+    try:
+        init_scan_tables(conn)
+        return jsonify(scan_stats(conn))
+
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+    finally:
+        conn.close()
+
 @app.route('/api/health', methods=['GET'])
 def api_health():
     """Health check"""
@@ -293,7 +504,11 @@ if __name__ == '__main__':
     print("  /api/ask?q=<question>     - Ask a question")
     print("  /api/stats                - Index statistics")
     print("  /api/recent               - Recently modified")
-    print("  /api/file?path=<path>     - Get file content")
+    print("  /api/file?path=<path>     - Get file content (JSON)")
+    print("  /api/file/raw?path=<path> - Stream original bytes (Range)")
+    print("  /api/file/meta?path=<path>- File metadata + freshness")
+    print("  /api/patterns/top?domain=<d> - Top manipulation scores in a domain")
+    print("  /api/patterns/stats       - Pattern scan coverage")
     print("  /api/health               - Health check")
     print()
     print("Examples:")
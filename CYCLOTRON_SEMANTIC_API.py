@@ -24,10 +24,14 @@ import os
 # Add parent to path
 sys.path.insert(0, os.path.dirname(__file__))
 
-from SEMANTIC_VECTOR_ENGINE import SemanticVectorEngine
+from SEMANTIC_VECTOR_ENGINE import CHROMA_DIR, SemanticVectorEngine
+from API_INFRASTRUCTURE import (conditional_get, file_generation, init_request_timing,
+                                init_response_optimization, span)
 
 app = Flask(__name__)
 CORS(app)
+init_request_timing(app, 'semantic')
+init_response_optimization(app)
 
 # Initialize engine on startup
 print("Initializing Semantic API...")
@@ -66,7 +70,8 @@ def semantic_search():
 
     try:
         eng = get_engine()
-        results = eng.search(query, n_results=limit)
+        with span('model'):
+            results = eng.search(query, n_results=limit)
 
         return jsonify({
             'query': query,
@@ -88,7 +93,8 @@ def find_similar():
 
     try:
         eng = get_engine()
-        results = eng.find_similar(path, n_results=limit)
+        with span('model'):
+            results = eng.find_similar(path, n_results=limit)
 
         return jsonify({
             'source_file': path,
@@ -99,14 +105,31 @@ def find_similar():
         return jsonify({'error': str(e)}), 500
 
 
+def clusters_version():
+    """ETag source: clusters only change when the vector store does.
+
+    The chunk count alone misses re-embeds and upserts that keep the count,
+    so the generation (mtime + size) of Chroma's SQLite store is included:
+    every add/update/delete commits to it.
+    """
+    try:
+        count = get_engine().get_stats()['vector_chunks']
+    except Exception:
+        return None
+    store = CHROMA_DIR / 'chroma.sqlite3'
+    return (count, file_generation(store, f"{store}-wal"), request.full_path)
+
+
 @app.route('/api/clusters', methods=['GET'])
+@conditional_get(clusters_version)
 def get_clusters():
     """Get concept clusters (maps to Seven Domains)"""
     n = int(request.args.get('n', 7))
 
     try:
         eng = get_engine()
-        clusters = eng.cluster_concepts(n_clusters=n)
+        with span('model'):
+            clusters = eng.cluster_concepts(n_clusters=n)
 
         # Format for API response
         formatted = {}
@@ -147,7 +170,8 @@ def ask_semantic():
 
     try:
         eng = get_engine()
-        results = eng.search(question, n_results=limit)
+        with span('model'):
+            results = eng.search(question, n_results=limit)
 
         # Format as answers
         answers = []
@@ -6,15 +6,19 @@ Aggregates all system data into readable format.
 """
 
 import json
+import sqlite3
 from pathlib import Path
 from datetime import datetime, timedelta
 
+from ATOM_AGGREGATES import read_aggregates
+
 # Paths
 HOME = Path.home()
 CONSCIOUSNESS = HOME / ".consciousness"
 DEPLOYMENT = HOME / "100X_DEPLOYMENT"
 REPORTS_PATH = CONSCIOUSNESS / "daily_reports"
 REPORTS_PATH.mkdir(parents=True, exist_ok=True)
+ATOMS_DB = CONSCIOUSNESS / "cyclotron_core" / "atoms.db"
 
 
 class DailyReportGenerator:
@@ -88,15 +92,23 @@ class DailyReportGenerator:
         """Cyclotron section."""
         lines = ["", "🔄 CYCLOTRON KNOWLEDGE BASE", "-" * 40]
 
+        aggregates = self._atom_aggregates()
+
         index = CONSCIOUSNESS / "cyclotron_core" / "INDEX.json"
         if index.exists():
             with open(index) as f:
                 data = json.load(f)
 
             stats = data.get("stats", {})
-            lines.append(f"Total Atoms: {stats.get('total', 0)}")
-
             by_type = stats.get("by_type", {})
+            if aggregates:
+                today = datetime.now().strftime("%Y-%m-%d")
+                lines.append(f"Total Atoms: {aggregates['total_atoms']}")
+                lines.append(f"Created Today: {aggregates['by_day'].get(today, 0)}")
+                by_type = aggregates['by_type']
+            else:
+                lines.append(f"Total Atoms: {stats.get('total', 0)}")
+
             if by_type:
                 lines.append("By Type:")
                 for t, count in sorted(by_type.items(), key=lambda x: x[1], reverse=True)[:5]:
@@ -113,6 +125,18 @@ class DailyReportGenerator:
 
         return "\n".join(lines)
 
+    def _atom_aggregates(self) -> dict:
+        """Read trigger-maintained atom counts from atoms.db, if installed."""
+        if not ATOMS_DB.exists():
+            return None
+        try:
+            conn = sqlite3.connect(str(ATOMS_DB), timeout=5)
+            aggregates = read_aggregates(conn)
+            conn.close()
+            return aggregates
+        except sqlite3.Error:
+            return None
+
     def _section_activity(self) -> str:
         """Activity section."""
         lines = ["", "📈 ACTIVITY SUMMARY", "-" * 40]
@@ -5,21 +5,53 @@ Creates 7 strategic indices for 100-1000x query speedup.
 
 Before: Full-table scans on complex queries (500ms)
 After: Index-backed queries (10-100ms)
+(Measured numbers: python BENCHMARKS/CYCLOTRON_BENCHMARK.py --suites optimizer)
+
+Online maintenance (OnlineMaintenance) replaces the blocking VACUUM with
+small time-boxed steps: PRAGMA optimize, incremental_vacuum, FTS5 merge
+and WAL checkpoints, each reporting pages freed and lock time held.
+
+incremental_vacuum only frees pages once auto_vacuum is INCREMENTAL. An
+existing atoms.db is converted once (a full VACUUM) by running this
+script directly; scheduled maintenance never converts, it only reports
+'auto_vacuum': 'none' until that has been done.
 """
 
+import os
 import sqlite3
 import time
 from pathlib import Path
 from datetime import datetime
+from typing import Callable, List, Optional
+
+from ATOM_AGGREGATES import install as install_aggregates, read_aggregates
 
 DB_PATH = Path("C:/Users/dwrek/.consciousness/cyclotron_core/atoms.db")
 
+# Online maintenance budgets
+STEP_BUDGET_MS = 50              # Max time a single step may hold the write lock
+INCREMENTAL_VACUUM_PAGES = 256   # Pages released per incremental_vacuum step
+FTS_MERGE_PAGES = 64             # Pages merged per FTS5 'merge' step
+WAL_CHECKPOINT_MB = 16           # Passive checkpoint once the WAL exceeds this
+WAL_TRUNCATE_MB = 128            # Truncating checkpoint once the WAL exceeds this
+IDLE_HOURS = (2, 5)              # Default idle window (local time, [start, end))
+
 
 class DatabaseOptimizer:
     """Optimize SQLite database for knowledge graph queries."""
 
+    # Representative query patterns (also replayed by BENCHMARKS/CYCLOTRON_BENCHMARK.py)
+    SAMPLE_QUERIES = [
+        ("SELECT * FROM atoms WHERE type = 'concept'", "type_lookup"),
+        ("SELECT * FROM atoms WHERE confidence > 0.8", "confidence_filter"),
+        ("SELECT * FROM atoms WHERE type = 'pattern' AND confidence > 0.75", "compound"),
+        ("SELECT * FROM atoms WHERE source = 'brain_issues'", "source_lookup"),
+        ("SELECT * FROM atoms ORDER BY access_count DESC LIMIT 10", "hottest"),
+    ]
+
     def __init__(self):
-        self.conn = sqlite3.connect(str(DB_PATH))
+        self.db_path = DB_PATH
+        self.conn = sqlite3.connect(str(self.db_path))
 
         # Enable performance optimizations
         self.conn.execute("PRAGMA journal_mode = WAL")      # Write-ahead logging
@@ -108,17 +140,8 @@ class DatabaseOptimizer:
         cursor = self.conn.cursor()
         query_plans = {}
 
-        # Sample queries and their plans
-        sample_queries = [
-            ("SELECT * FROM atoms WHERE type = 'concept'", "type_lookup"),
-            ("SELECT * FROM atoms WHERE confidence > 0.8", "confidence_filter"),
-            ("SELECT * FROM atoms WHERE type = 'pattern' AND confidence > 0.75", "compound"),
-            ("SELECT * FROM atoms WHERE source = 'brain_issues'", "source_lookup"),
-            ("SELECT * FROM atoms ORDER BY access_count DESC LIMIT 10", "hottest"),
-        ]
-
         print("\n[OPTIMIZER] Query Execution Plans:")
-        for query, name in sample_queries:
+        for query, name in self.SAMPLE_QUERIES:
             cursor.execute(f"EXPLAIN QUERY PLAN {query}")
             plan = cursor.fetchall()
             query_plans[name] = plan
@@ -145,22 +168,43 @@ class DatabaseOptimizer:
 
         self.conn.commit()
 
+    def optimize_online(self, max_seconds: float = 30.0, force: bool = False,
+                        migrate: bool = False) -> dict:
+        """Run time-boxed online maintenance instead of a blocking VACUUM.
+
+        migrate=True first converts the database to auto_vacuum=INCREMENTAL
+        if needed (one-time full VACUUM - planned runs only).
+        """
+        maintenance = OnlineMaintenance(self.conn, db_path=self.db_path)
+        if migrate:
+            result = maintenance.enable_incremental_vacuum()
+            if result.get('changed'):
+                print(f"  Converted to auto_vacuum=INCREMENTAL in {result['lock_ms']}ms")
+        return maintenance.run(max_seconds=max_seconds, force=force)
+
     def get_database_stats(self) -> dict:
         """Get database statistics."""
 
         cursor = self.conn.cursor()
 
-        # Total atoms
-        cursor.execute("SELECT COUNT(*) FROM atoms")
-        total_atoms = cursor.fetchone()[0]
-
-        # Breakdown by type
-        cursor.execute("SELECT type, COUNT(*) as count FROM atoms GROUP BY type")
-        by_type = {row[0]: row[1] for row in cursor.fetchall()}
-
-        # Breakdown by source
-        cursor.execute("SELECT source, COUNT(*) as count FROM atoms GROUP BY source")
-        by_source = {row[0]: row[1] for row in cursor.fetchall()}
+        aggregates = read_aggregates(self.conn)
+        if aggregates is not None:
+            # Trigger-maintained summary tables (see ATOM_AGGREGATES.py)
+            total_atoms = aggregates['total_atoms']
+            by_type = aggregates['by_type']
+            by_source = aggregates['by_source']
+        else:
+            # Total atoms
+            cursor.execute("SELECT COUNT(*) FROM atoms")
+            total_atoms = cursor.fetchone()[0]
+
+            # Breakdown by type
+            cursor.execute("SELECT type, COUNT(*) as count FROM atoms GROUP BY type")
+            by_type = {row[0]: row[1] for row in cursor.fetchall()}
+
+            # Breakdown by source
+            cursor.execute("SELECT source, COUNT(*) as count FROM atoms GROUP BY source")
+            by_source = {row[0]: row[1] for row in cursor.fetchall()}
 
         # Index count
         cursor.execute("""
@@ -243,7 +287,7 @@ RECOMMENDATIONS
 1. Run ANALYZE after bulk data changes
 2. Monitor slow query log (queries > 100ms)
 3. Add indices for new query patterns as they emerge
-4. Re-run VACUUM monthly
+4. Schedule OnlineMaintenance.run() in the idle window (no full VACUUM)
 
 NEXT STEPS
 ──────────
@@ -261,6 +305,239 @@ NEXT STEPS
         self.conn.close()
 
 
+class OnlineMaintenance:
+    """Incremental, time-boxed database maintenance for idle windows.
+
+    Every step is a short statement that holds the write lock for at most a
+    few milliseconds, so WAL readers never see a latency spike. Each step
+    returns a record with pages freed and the time the lock was held.
+    """
+
+    def __init__(self, conn: sqlite3.Connection = None, db_path: Path = DB_PATH,
+                 step_budget_ms: int = STEP_BUDGET_MS,
+                 idle_hours: tuple = IDLE_HOURS,
+                 is_idle: Optional[Callable[[], bool]] = None):
+        self.db_path = Path(db_path)
+        self.owns_conn = conn is None
+        if conn is None:
+            conn = sqlite3.connect(str(self.db_path), timeout=0.1)
+            conn.execute("PRAGMA journal_mode = WAL")
+        self.conn = conn
+        # Back off quickly instead of queueing behind API writers
+        self.conn.execute("PRAGMA busy_timeout = 100")
+
+        self.step_budget_ms = step_budget_ms
+        self.idle_hours = idle_hours
+        self.is_idle = is_idle or self._in_idle_window
+        self.steps: List[dict] = []
+
+    def _in_idle_window(self) -> bool:
+        """Check whether the current local hour falls in the idle window."""
+        start, end = self.idle_hours
+        hour = datetime.now().hour
+        if start <= end:
+            return start <= hour < end
+        return hour >= start or hour < end
+
+    def _pragma(self, name: str) -> int:
+        return self.conn.execute(f"PRAGMA {name}").fetchone()[0]
+
+    def _timed(self, step: str, fn: Callable[[], dict]) -> dict:
+        """Run one step, measuring the time spent holding locks."""
+        start = time.perf_counter()
+        try:
+            result = fn()
+            status = 'ok'
+        except sqlite3.OperationalError as e:
+            # SQLITE_BUSY/LOCKED: another writer is active, skip this round
+            result = {'error': str(e)}
+            status = 'busy' if 'locked' in str(e) or 'busy' in str(e) else 'error'
+        lock_ms = round((time.perf_counter() - start) * 1000, 2)
+
+        record = {
+            'step': step,
+            'status': status,
+            'pages_freed': 0,
+            'lock_ms': lock_ms,
+            'over_budget': lock_ms > self.step_budget_ms,
+            'timestamp': datetime.now().isoformat()
+        }
+        record.update(result)
+        self.steps.append(record)
+        return record
+
+    # ------------------------------------------------------------------
+    # Individual steps
+    # ------------------------------------------------------------------
+
+    def enable_incremental_vacuum(self) -> dict:
+        """Switch auto_vacuum to INCREMENTAL (one-time, needs a full VACUUM).
+
+        Only run this once during a planned window; afterwards free pages are
+        reclaimed in small steps by step_incremental_vacuum().
+        """
+        mode = self._pragma("auto_vacuum")
+        if mode == 2:
+            return {'auto_vacuum': 'incremental', 'changed': False}
+        if self.conn.in_transaction:
+            self.conn.commit()  # VACUUM cannot run inside a transaction
+
+        def convert():
+            self.conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+            self.conn.execute("VACUUM")
+            return {'auto_vacuum': 'incremental', 'changed': True}
+
+        return self._timed('enable_incremental_vacuum', convert)
+
+    def step_optimize(self) -> dict:
+        """PRAGMA optimize - refreshes only the statistics that are stale."""
+        def run():
+            self.conn.execute("PRAGMA analysis_limit = 400")
+            self.conn.execute("PRAGMA optimize")
+            return {}
+        return self._timed('optimize', run)
+
+    def step_incremental_vacuum(self, pages: int = INCREMENTAL_VACUUM_PAGES) -> dict:
+        """Release up to `pages` free pages back to the filesystem."""
+        def run():
+            if self._pragma("auto_vacuum") != 2:
+                return {'skipped': 'auto_vacuum is not INCREMENTAL'}
+            before = self._pragma("freelist_count")
+            # executescript() steps the pragma to completion; execute() frees one page
+            self.conn.executescript(f"PRAGMA incremental_vacuum({int(pages)});")
+            after = self._pragma("freelist_count")
+            return {'pages_freed': before - after, 'freelist_remaining': after}
+        return self._timed('incremental_vacuum', run)
+
+    def fts_tables(self) -> List[str]:
+        """List FTS5 virtual tables in the database."""
+        rows = self.conn.execute("""
+            SELECT name FROM sqlite_master
+            WHERE type='table' AND sql LIKE '%USING fts5%'
+        """).fetchall()
+        return [row[0] for row in rows]
+
+    def step_fts_merge(self, table: str, pages: int = FTS_MERGE_PAGES) -> dict:
+        """Merge FTS5 b-tree segments a few pages at a time.
+
+        total_changes() grows by 2 or more when the merge did any work, so a
+        smaller delta means the index is fully merged.
+        """
+        def run():
+            before = self.conn.total_changes
+            self.conn.execute(
+                f'INSERT INTO "{table}"("{table}", rank) VALUES (\'merge\', ?)',
+                (int(pages),)
+            )
+            self.conn.commit()
+            worked = self.conn.total_changes - before >= 2
+            return {'table': table, 'merged': worked}
+        return self._timed('fts_merge', run)
+
+    def wal_size_mb(self) -> float:
+        """Current size of the -wal file in MB."""
+        wal = Path(str(self.db_path) + "-wal")
+        if not wal.exists():
+            return 0.0
+        return round(os.path.getsize(wal) / (1024 * 1024), 2)
+
+    def step_wal_checkpoint(self, passive_mb: float = WAL_CHECKPOINT_MB,
+                            truncate_mb: float = WAL_TRUNCATE_MB) -> dict:
+        """Checkpoint the WAL once it crosses a size threshold.
+
+        PASSIVE never waits on readers; TRUNCATE is only used above the hard
+        threshold to stop the WAL from growing without bound.
+        """
+        size_mb = self.wal_size_mb()
+        if size_mb < passive_mb:
+            return {'step': 'wal_checkpoint', 'status': 'skipped',
+                    'wal_mb': size_mb, 'pages_freed': 0, 'lock_ms': 0.0}
+
+        mode = "TRUNCATE" if size_mb >= truncate_mb else "PASSIVE"
+
+        def run():
+            busy, log_pages, checkpointed = self.conn.execute(
+                f"PRAGMA wal_checkpoint({mode})"
+            ).fetchone()
+            return {
+                'mode': mode,
+                'wal_mb': size_mb,
+                'busy': bool(busy),
+                'wal_pages': log_pages,
+                'pages_checkpointed': checkpointed
+            }
+        return self._timed('wal_checkpoint', run)
+
+    # ------------------------------------------------------------------
+    # Scheduler
+    # ------------------------------------------------------------------
+
+    def run(self, max_seconds: float = 30.0, force: bool = False) -> dict:
+        """Interleave maintenance steps until done, out of time, or not idle."""
+        if not force and not self.is_idle():
+            print("[MAINTENANCE] Not in idle window - skipping")
+            return self.summary(skipped=True)
+
+        deadline = time.monotonic() + max_seconds
+        print(f"[MAINTENANCE] Online maintenance (budget {max_seconds}s)")
+
+        self.step_optimize()
+        pending_fts = self.fts_tables()
+        vacuum_done = False
+
+        while time.monotonic() < deadline:
+            if not force and not self.is_idle():
+                print("[MAINTENANCE] Idle window closed - stopping")
+                break
+
+            worked = False
+
+            if not vacuum_done:
+                step = self.step_incremental_vacuum()
+                vacuum_done = step['pages_freed'] == 0 or step['status'] != 'ok'
+                worked = worked or not vacuum_done
+
+            for table in list(pending_fts):
+                step = self.step_fts_merge(table)
+                if step['status'] != 'ok' or not step.get('merged'):
+                    pending_fts.remove(table)
+                else:
+                    worked = True
+
+            self.step_wal_checkpoint()
+
+            if not worked:
+                break
+
+            # Yield between steps so API writers can take the lock
+            time.sleep(self.step_budget_ms / 1000)
+
+        summary = self.summary()
+        print(f"  Steps: {summary['steps']}  Pages freed: {summary['pages_freed']}  "
+              f"Max lock: {summary['max_lock_ms']}ms")
+        return summary
+
+    def summary(self, skipped: bool = False) -> dict:
+        """Aggregate step records into a report."""
+        lock_times = [s['lock_ms'] for s in self.steps]
+        return {
+            'skipped': skipped,
+            'steps': len(self.steps),
+            'pages_freed': sum(s.get('pages_freed', 0) for s in self.steps),
+            'total_lock_ms': round(sum(lock_times), 2),
+            'max_lock_ms': max(lock_times) if lock_times else 0.0,
+            'over_budget_steps': sum(1 for s in self.steps if s.get('over_budget')),
+            'auto_vacuum': {0: 'none', 1: 'full', 2: 'incremental'}.get(self._pragma("auto_vacuum"), 'unknown'),
+            'wal_mb': self.wal_size_mb(),
+            'details': list(self.steps)
+        }
+
+    def close(self):
+        """Close the connection if this instance opened it."""
+        if self.owns_conn:
+            self.conn.close()
+
+
 if __name__ == "__main__":
     print("\n╔════════════════════════════════════════╗")
     print("║  DATABASE OPTIMIZATION SUITE          ║")
@@ -273,13 +550,17 @@ if __name__ == "__main__":
     print("\n[STEP 1] Creating Strategic Indices...")
     optimizer.create_indices()
 
+    # Step 1b: Trigger-maintained count tables for dashboards
+    print("\n[STEP 1b] Installing Atom Aggregates...")
+    install_aggregates(optimizer.conn)
+
     # Step 2: Analyze query plans
     print("\n[STEP 2] Analyzing Query Execution Plans...")
     optimizer.analyze_query_plans()
 
-    # Step 3: Optimize database
+    # Step 3: Optimize database (one-time auto_vacuum migration, then online steps)
     print("\n[STEP 3] Optimizing Database...")
-    optimizer.optimize_vacuume()
+    optimizer.optimize_online(force=True, migrate=True)
 
     # Step 4: Generate report
     print("\n[STEP 4] Generating Report...")
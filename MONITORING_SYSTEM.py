@@ -16,10 +16,13 @@ import sqlite3
 import psutil
 import time
 import threading
+import urllib.request
 from pathlib import Path
 from datetime import datetime, timedelta
 from collections import deque
 
+from ATOM_AGGREGATES import read_aggregates
+
 MONITORING_DIR = Path("C:/Users/dwrek/.consciousness/monitoring")
 MONITORING_DIR.mkdir(exist_ok=True)
 
@@ -30,6 +33,61 @@ CACHE_STATS_FILE = MONITORING_DIR / "cache_stats.json"
 
 DB_PATH = "C:/Users/dwrek/.consciousness/cyclotron_core/atoms.db"
 
+# Prometheus endpoints from API_INFRASTRUCTURE.init_request_timing.
+# UNIFIED_API_HOST serves every service on one; add standalone ports here.
+METRICS_ENDPOINTS = ["http://127.0.0.1:8080/metrics"]
+API_ERROR_RATE_ALERT = 5.0      # percent of requests since last scrape
+API_P95_ALERT_MS = 2000
+
+
+def parse_prometheus(text: str) -> list:
+    """Parse Prometheus text format into (name, labels, value) samples."""
+    samples = []
+    for line in text.splitlines():
+        line = line.strip()
+        if not line or line.startswith('#'):
+            continue
+        try:
+            series, value = line.rsplit(' ', 1)
+            labels = {}
+            if '{' in series:
+                name, _, body = series.partition('{')
+                body = body.rstrip('}')
+                while body:
+                    key, _, rest = body.partition('="')
+                    i = 0
+                    while rest[i] != '"':
+                        i += 2 if rest[i] == '\\' else 1
+                    raw = rest[:i]
+                    labels[key.strip(',')] = (raw.replace('\\n', '\n')
+                                              .replace('\\"', '"').replace('\\\\', '\\'))
+                    body = rest[i + 1:].lstrip(',')
+            else:
+                name = series
+            samples.append((name, labels, float(value)))
+        except (ValueError, IndexError):
+            continue
+    return samples
+
+
+def histogram_quantile(q: float, buckets: list) -> float:
+    """Estimate a quantile from cumulative (upper_bound, count) buckets."""
+    buckets = sorted(buckets)
+    total = buckets[-1][1] if buckets else 0
+    if total <= 0:
+        return 0.0
+    rank = q * total
+    prev_bound, prev_count = 0.0, 0
+    for bound, count in buckets:
+        if count >= rank:
+            if bound == float('inf'):
+                return prev_bound
+            if count == prev_count:
+                return bound
+            return prev_bound + (bound - prev_bound) * (rank - prev_count) / (count - prev_count)
+        prev_bound, prev_count = bound, count
+    return prev_bound
+
 
 class SystemMetrics:
     """Collect system health metrics."""
@@ -37,6 +95,7 @@ class SystemMetrics:
     def __init__(self):
         self.metrics = deque(maxlen=1440)  # 24 hours at 1-min intervals
         self.alerts = deque(maxlen=100)
+        self._last_api_samples = {}        # series -> cumulative value at last scrape
 
     def collect_metrics(self) -> dict:
         """Collect all system metrics."""
@@ -44,7 +103,8 @@ class SystemMetrics:
             'timestamp': datetime.now().isoformat(),
             'database': self._collect_db_metrics(),
             'system': self._collect_system_metrics(),
-            'cache': self._collect_cache_metrics()
+            'cache': self._collect_cache_metrics(),
+            'api': self._collect_api_metrics()
         }
 
         self.metrics.append(metrics)
@@ -56,17 +116,23 @@ class SystemMetrics:
             conn = sqlite3.connect(DB_PATH, timeout=5)
             cursor = conn.cursor()
 
-            # Count atoms
-            cursor.execute("SELECT COUNT(*) FROM atoms")
-            atom_count = cursor.fetchone()[0]
-
-            # Get breakdown by type
-            cursor.execute("""
-                SELECT type, COUNT(*) as count
-                FROM atoms
-                GROUP BY type
-            """)
-            by_type = {row[0]: row[1] for row in cursor.fetchall()}
+            # Trigger-maintained summary tables: O(#types) instead of a scan
+            aggregates = read_aggregates(conn)
+            if aggregates is not None:
+                atom_count = aggregates['total_atoms']
+                by_type = aggregates['by_type']
+            else:
+                # Count atoms
+                cursor.execute("SELECT COUNT(*) FROM atoms")
+                atom_count = cursor.fetchone()[0]
+
+                # Get breakdown by type
+                cursor.execute("""
+                    SELECT type, COUNT(*) as count
+                    FROM atoms
+                    GROUP BY type
+                """)
+                by_type = {row[0]: row[1] for row in cursor.fetchall()}
 
             conn.close()
 
@@ -142,6 +208,77 @@ class SystemMetrics:
         except Exception as e:
             return {'error': str(e), 'status': 'error'}
 
+    def _collect_api_metrics(self) -> dict:
+        """Scrape service /metrics: per-route requests, error rate, p95 since last scrape."""
+        samples, reached = [], 0
+        for url in METRICS_ENDPOINTS:
+            try:
+                with urllib.request.urlopen(url, timeout=2) as response:
+                    samples += parse_prometheus(response.read().decode())
+                reached += 1
+            except Exception:
+                continue
+
+        if not reached:
+            return {'status': 'unreachable', 'endpoints': METRICS_ENDPOINTS}
+
+        # Counters are cumulative since service start - use the delta since
+        # the previous scrape (or the full value after a restart)
+        current = {}
+        for name, labels, value in samples:
+            current[(name, tuple(sorted(labels.items())))] = value
+        previous, self._last_api_samples = self._last_api_samples, current
+
+        def delta(key, value):
+            before = previous.get(key)
+            return value - before if before is not None and value >= before else value
+
+        routes, in_flight = {}, 0
+        for (name, labels), value in current.items():
+            labels = dict(labels)
+            if name.endswith('_http_requests_in_flight'):
+                in_flight += int(value)
+                continue
+            if 'route' not in labels:
+                continue
+            route = routes.setdefault(f"{labels['service']} {labels['route']}",
+                                      {'requests': 0, 'errors': 0, 'seconds': 0.0, 'buckets': {}})
+            change = delta((name, tuple(sorted(labels.items()))), value)
+            if name.endswith('_http_request_duration_seconds_count'):
+                route['requests'] += change
+            elif name.endswith('_http_request_duration_seconds_sum'):
+                route['seconds'] += change
+            elif name.endswith('_http_request_errors_total'):
+                route['errors'] += change
+            elif name.endswith('_http_request_duration_seconds_bucket'):
+                bound = float(labels['le'])
+                route['buckets'][bound] = route['buckets'].get(bound, 0) + change
+
+        summary, total_requests, total_errors, worst_p95 = {}, 0, 0, 0.0
+        for key, route in sorted(routes.items()):
+            if not route['requests']:
+                continue
+            p95_ms = histogram_quantile(0.95, list(route['buckets'].items())) * 1000
+            summary[key] = {
+                'requests': int(route['requests']),
+                'error_rate_percent': round(route['errors'] / route['requests'] * 100, 1),
+                'mean_ms': round(route['seconds'] / route['requests'] * 1000, 1),
+                'p95_ms': round(p95_ms, 1)
+            }
+            total_requests += route['requests']
+            total_errors += route['errors']
+            worst_p95 = max(worst_p95, p95_ms)
+
+        error_rate = round(total_errors / total_requests * 100, 1) if total_requests else 0.0
+        return {
+            'requests': int(total_requests),
+            'error_rate_percent': error_rate,
+            'worst_p95_ms': round(worst_p95, 1),
+            'in_flight': in_flight,
+            'routes': summary,
+            'status': 'degraded' if error_rate > API_ERROR_RATE_ALERT else 'healthy'
+        }
+
     def check_alerts(self, metrics: dict) -> list:
         """Check metrics against alert thresholds."""
         alerts = []
@@ -193,6 +330,25 @@ class SystemMetrics:
                 'timestamp': datetime.now().isoformat()
             })
 
+        # API alerts
+        api = metrics.get('api', {})
+        if api.get('requests', 0) >= 20 and api.get('error_rate_percent', 0) > API_ERROR_RATE_ALERT:
+            alerts.append({
+                'severity': 'warning',
+                'category': 'api',
+                'message': f"API error rate: {api['error_rate_percent']}%",
+                'timestamp': datetime.now().isoformat()
+            })
+
+        for route, stats in api.get('routes', {}).items():
+            if stats['p95_ms'] > API_P95_ALERT_MS:
+                alerts.append({
+                    'severity': 'warning',
+                    'category': 'api',
+                    'message': f"Slow route {route}: p95 {stats['p95_ms']}ms",
+                    'timestamp': datetime.now().isoformat()
+                })
+
         return alerts
 
     def save_metrics(self):
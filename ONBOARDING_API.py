@@ -9,8 +9,11 @@ import json
 import os
 from datetime import datetime
 
+from API_INFRASTRUCTURE import init_request_timing
+
 app = Flask(__name__)
 CORS(app)
+init_request_timing(app, 'onboarding')
 
 # Storage directory
 DATA_DIR = os.path.join(os.path.dirname(__file__), 'onboarding_data')
@@ -3,14 +3,25 @@
 PATTERN DETECTOR
 Analyzes text for manipulation patterns across the 7 domains.
 Core consciousness tool for manipulation immunity.
+
+Detection history is a fixed-size ring buffer of compact records with
+1h/24h rolling aggregates; set PATTERN_DETECTOR_LOG (or pass log_path)
+to also keep every full result in an append-only JSONL file.
 """
 
 import re
 import json
+import os
+import threading
+from array import array
 from pathlib import Path
 from datetime import datetime
 from typing import Optional
 
+# History configuration (environment overridable)
+HISTORY_SIZE = int(os.environ.get("PATTERN_DETECTOR_HISTORY", 1000))
+HISTORY_LOG = os.environ.get("PATTERN_DETECTOR_LOG")  # unset = no disk log
+
 # Pattern definitions by domain
 MANIPULATION_PATTERNS = {
     "gaslighting": {
@@ -147,12 +158,323 @@ MANIPULATION_PATTERNS = {
     }
 }
 
+SEVERITY_SCORES = {"low": 1, "medium": 2, "high": 3}
+
+
+# Leading group of plain alternatives, e.g. "(crisis|disaster)..." - not quantified
+_LEADING_ALTERNATIVES = re.compile(r"\(([^()\[\]\\|?*+{}.^$]+(?:\|[^()\[\]\\|?*+{}.^$]+)*)\)(?![?*+{])")
+
+
+def _indicator_branches(indicator: str) -> list:
+    """Indicator split on its leading alternatives ("(a|b)x" -> ["ax", "bx"])."""
+    m = _LEADING_ALTERNATIVES.match(indicator)
+    if not m:
+        return [indicator]
+    rest = indicator[m.end():]
+    return [alternative + rest for alternative in m.group(1).split("|")]
+
+
+def _first_literal(branch: str):
+    """The branch's required first character, or None if it is not a plain literal."""
+    if len(branch) > 1 and branch[1] in "?*+{":
+        return None
+    return branch[0] if branch[:1].isalnum() or branch[:1] in " '" else None
+
+
+class CompiledPatterns:
+    """All indicators compiled once into one combined alternation.
+
+    Indicator n is mapped back through self.indicators[n] to
+    (pattern, domain, severity, compiled indicator). The alternation is
+    factored by each indicator's first character ("y(?:ou'?re ...|...)|t(?:...)")
+    so re keeps its literal-prefix skip; named groups per indicator defeat
+    that and scan slower than the per-indicator loop they replace.
+
+    One scan of the combined regex finds every position where any indicator
+    starts; only the indicators that can start with that character then
+    re-match there, so counts, examples and group captures are exactly what
+    per-indicator re.findall produced.
+    """
+
+    def __init__(self, patterns: dict):
+        self.indicators = []
+        self.by_first = {}      # first character -> indicator indexes
+        self.anywhere = []      # indicators without a literal first character
+        buckets, loose = {}, []
+
+        for pattern_name, pattern_data in patterns.items():
+            for indicator in pattern_data["indicators"]:
+                index = len(self.indicators)
+                self.indicators.append((pattern_name, pattern_data["domain"], pattern_data["severity"],
+                                        re.compile(indicator, re.IGNORECASE)))
+                branches = _indicator_branches(indicator)
+                if all(_first_literal(b) for b in branches):
+                    for branch in branches:
+                        buckets.setdefault(branch[0], []).append(branch[1:])
+                        owners = self.by_first.setdefault(branch[0], [])
+                        if index not in owners:
+                            owners.append(index)
+                else:
+                    loose.append(indicator)
+                    self.anywhere.append(index)
+
+        alternatives = [re.escape(first) + "(?:" + "|".join(rests) + ")" for first, rests in buckets.items()]
+        alternatives += [f"(?:{indicator})" for indicator in loose]
+        combined = "|".join(alternatives)
+
+        # Text is lowercased before scanning, so lowercase indicators can skip
+        # IGNORECASE (much faster) on ASCII text; anything else folds case
+        lowercase = all(i == i.lower() for p in patterns.values() for i in p["indicators"])
+        self.combined = re.compile(combined) if combined and lowercase else None
+        self.combined_folded = re.compile(combined, re.IGNORECASE) if combined else None
+
+    def finditer(self, text: str):
+        """Yield (indicator index, match) for every indicator match.
+
+        Matches come grouped by indicator, in text order within each one.
+        Per indicator they are non-overlapping and leftmost-first, like
+        re.findall; different indicators may overlap each other.
+        """
+        exact = text.isascii() and self.combined is not None
+        combined = self.combined if exact else self.combined_folded
+        if combined is None:
+            return
+
+        everywhere = list(range(len(self.indicators)))
+        found = [[] for _ in self.indicators]
+        next_free = [0] * len(self.indicators)
+
+        # One pass over every start position where at least one indicator
+        # matches; restart one character on so overlapping starts are seen
+        search = combined.search
+        m = search(text)
+        while m is not None:
+            start = m.start()
+            if exact:
+                candidates = self.by_first.get(text[start], ())
+                if self.anywhere:
+                    candidates = sorted(set(candidates).union(self.anywhere))
+            else:
+                candidates = everywhere
+
+            for index in candidates:
+                if start < next_free[index]:
+                    continue
+                match = self.indicators[index][3].match(text, start)
+                if match is not None:
+                    found[index].append(match)
+                    next_free[index] = match.end() if match.end() > start else start + 1
+
+            m = search(text, start + 1)
+
+        for index, matches in enumerate(found):
+            for match in matches:
+                yield index, match
+
+
+def _findall_value(m):
+    """The value re.findall returns for this match (whole match, group, or tuple)."""
+    groups = m.groups('')
+    if not groups:
+        return m.group(0)
+    return groups[0] if len(groups) == 1 else groups
+
+
+COMPILED_PATTERNS = CompiledPatterns(MANIPULATION_PATTERNS)
+
+DOMAINS = ("media", "relationships", "finance", "authority", "self", "groups", "digital")
+THREAT_LEVELS = ("clean", "low", "medium", "high")
+
+
+class RollingWindow:
+    """
+    Threat-level counts and per-domain sums over the last `span` seconds.
+
+    Time is cut into fixed buckets; adding a record expires whole buckets
+    that fell out of the window, so each update is O(buckets expired).
+    """
+
+    def __init__(self, span: int, bucket_seconds: int):
+        self.span = span
+        self.bucket_seconds = bucket_seconds
+        self.slots = span // bucket_seconds
+        self.bucket_ids = [None] * self.slots
+        # Per bucket: counts per threat level, score sum, domain sums
+        self.level_counts = [[0] * len(THREAT_LEVELS) for _ in range(self.slots)]
+        self.score_sums = [0.0] * self.slots
+        self.domain_sums = [[0.0] * len(DOMAINS) for _ in range(self.slots)]
+        # Running totals across live buckets
+        self.total_levels = [0] * len(THREAT_LEVELS)
+        self.total_score = 0.0
+        self.total_domains = [0.0] * len(DOMAINS)
+        self.latest = None
+
+    def advance(self, now: float):
+        """Expire buckets older than the window ending at `now`."""
+        current = int(now // self.bucket_seconds)
+        if self.latest is not None and current <= self.latest:
+            return
+        start = current - self.slots + 1 if self.latest is None else max(self.latest + 1, current - self.slots + 1)
+        for bucket in range(start, current + 1):
+            self._expire(bucket % self.slots)
+        self.latest = current
+
+    def _expire(self, slot: int):
+        if self.bucket_ids[slot] is None:
+            return
+        for i, count in enumerate(self.level_counts[slot]):
+            self.total_levels[i] -= count
+        self.total_score -= self.score_sums[slot]
+        for i, value in enumerate(self.domain_sums[slot]):
+            self.total_domains[i] -= value
+        self.bucket_ids[slot] = None
+        self.level_counts[slot] = [0] * len(THREAT_LEVELS)
+        self.score_sums[slot] = 0.0
+        self.domain_sums[slot] = [0.0] * len(DOMAINS)
+
+    def add(self, timestamp: float, level: int, score: float, domains):
+        self.advance(timestamp)
+        bucket = int(timestamp // self.bucket_seconds)
+        if bucket <= self.latest - self.slots:
+            return  # older than the window already
+        slot = bucket % self.slots
+        self.bucket_ids[slot] = bucket
+        self.level_counts[slot][level] += 1
+        self.total_levels[level] += 1
+        self.score_sums[slot] += score
+        self.total_score += score
+        for i, value in enumerate(domains):
+            self.domain_sums[slot][i] += value
+            self.total_domains[i] += value
+
+    def summary(self, now: float) -> dict:
+        self.advance(now)
+        count = sum(self.total_levels)
+        return {
+            "count": count,
+            "threat_levels": dict(zip(THREAT_LEVELS, self.total_levels)),
+            "mean_score": round(self.total_score / count, 2) if count else 0.0,
+            "domain_means": {
+                domain: round(total / count, 2) if count else 0.0
+                for domain, total in zip(DOMAINS, self.total_domains)
+            }
+        }
+
+
+class DetectionHistory:
+    """
+    Ring buffer of the last `capacity` analyses as compact records:
+    timestamp, total score, threat level and per-domain scores, packed
+    into flat arrays. Full results go only to the optional JSONL log.
+    """
+
+    WINDOWS = {"1h": (3600, 60), "24h": (86400, 900)}  # span, bucket seconds
+
+    def __init__(self, capacity: int = HISTORY_SIZE, log_path: Optional[str] = HISTORY_LOG):
+        self.capacity = max(1, capacity)
+        self.timestamps = array("d", [0.0]) * self.capacity
+        self.scores = array("d", [0.0]) * self.capacity
+        self.levels = array("b", [0]) * self.capacity
+        self.domain_scores = array("d", [0.0]) * (self.capacity * len(DOMAINS))
+        self.total = 0  # records ever added; next slot = total % capacity
+        self.windows = {name: RollingWindow(span, bucket) for name, (span, bucket) in self.WINDOWS.items()}
+        self.lock = threading.Lock()
+
+        self.log_path = log_path
+        self.log_file = None
+        if log_path:
+            try:
+                Path(log_path).parent.mkdir(parents=True, exist_ok=True)
+                self.log_file = open(log_path, "a", encoding="utf-8", buffering=1)
+            except OSError as e:
+                print(f"[PATTERN DETECTOR] History log disabled ({log_path}): {e}")
+
+    def record(self, result: dict, timestamp: float):
+        level = THREAT_LEVELS.index(result["threat_level"])
+        domains = [result["domain_scores"].get(domain, 0) for domain in DOMAINS]
+        with self.lock:
+            slot = self.total % self.capacity
+            self.timestamps[slot] = timestamp
+            self.scores[slot] = result["total_score"]
+            self.levels[slot] = level
+            self.domain_scores[slot * len(DOMAINS):(slot + 1) * len(DOMAINS)] = array("d", domains)
+            self.total += 1
+            for window in self.windows.values():
+                window.add(timestamp, level, result["total_score"], domains)
+            if self.log_file:
+                self.log_file.write(json.dumps(result) + "\n")
+
+    def __len__(self) -> int:
+        return min(self.total, self.capacity)
+
+    def _compact(self, slot: int) -> dict:
+        offset = slot * len(DOMAINS)
+        return {
+            "timestamp": datetime.fromtimestamp(self.timestamps[slot]).isoformat(),
+            "total_score": self.scores[slot],
+            "threat_level": THREAT_LEVELS[self.levels[slot]],
+            "domain_scores": dict(zip(DOMAINS, self.domain_scores[offset:offset + len(DOMAINS)]))
+        }
+
+    def recent(self, limit: Optional[int] = None) -> list:
+        """Compact records, newest first."""
+        with self.lock:
+            count = len(self) if limit is None else min(limit, len(self))
+            return [self._compact((self.total - 1 - i) % self.capacity) for i in range(count)]
+
+    def __iter__(self):
+        """Compact records, oldest first."""
+        return iter(reversed(self.recent()))
+
+    def aggregates(self, now: Optional[float] = None) -> dict:
+        """Rolling 1h/24h counts per threat level and per-domain means."""
+        now = datetime.now().timestamp() if now is None else now
+        with self.lock:
+            return {name: window.summary(now) for name, window in self.windows.items()}
+
+    def get_stats(self) -> dict:
+        return {
+            "records": len(self),
+            "capacity": self.capacity,
+            "total_recorded": self.total,
+            "log_path": self.log_path if self.log_file else None,
+            "windows": self.aggregates()
+        }
+
+    def clear(self):
+        """Forget the buffer and aggregates (the disk log is append-only)."""
+        with self.lock:
+            self.total = 0
+            self.windows = {name: RollingWindow(span, bucket) for name, (span, bucket) in self.WINDOWS.items()}
+
+    def close(self):
+        if self.log_file:
+            self.log_file.close()
+            self.log_file = None
+
+
 class PatternDetector:
     """Detect manipulation patterns in text."""
 
-    def __init__(self):
+    def __init__(self, history_size: int = HISTORY_SIZE, log_path: Optional[str] = HISTORY_LOG):
         self.patterns = MANIPULATION_PATTERNS
-        self.detection_history = []
+        self.compiled = COMPILED_PATTERNS
+        self.detection_history = DetectionHistory(history_size, log_path)
+
+    def find_matches(self, text: str) -> list:
+        """Every indicator match with offsets into the (lowercased) text."""
+        matches = []
+        for index, m in self.compiled.finditer(text.lower()):
+            pattern_name, domain, severity, _ = self.compiled.indicators[index]
+            matches.append({
+                "pattern": pattern_name,
+                "domain": domain,
+                "severity": severity,
+                "start": m.start(),
+                "end": m.end(),
+                "match": m.group(0)
+            })
+        return sorted(matches, key=lambda x: (x["start"], x["end"]))
 
     def analyze(self, text: str) -> dict:
         """
@@ -163,22 +485,20 @@ class PatternDetector:
         """
         text_lower = text.lower()
         detections = []
-        domain_scores = {domain: 0 for domain in [
-            "media", "relationships", "finance", "authority", "self", "groups", "digital"
-        ]}
+        domain_scores = {domain: 0 for domain in DOMAINS}
+
+        # One combined scan; matches grouped per pattern in indicator order
+        found = {}
+        for index, m in self.compiled.finditer(text_lower):
+            pattern_name = self.compiled.indicators[index][0]
+            found.setdefault(pattern_name, []).append(_findall_value(m))
 
         # Check each pattern
         for pattern_name, pattern_data in self.patterns.items():
-            matches = []
-
-            for indicator in pattern_data["indicators"]:
-                found = re.findall(indicator, text_lower, re.IGNORECASE)
-                if found:
-                    matches.extend(found)
+            matches = found.get(pattern_name)
 
             if matches:
-                severity_scores = {"low": 1, "medium": 2, "high": 3}
-                score = severity_scores.get(pattern_data["severity"], 1) * len(matches)
+                score = SEVERITY_SCORES.get(pattern_data["severity"], 1) * len(matches)
 
                 detection = {
                     "pattern": pattern_name,
@@ -208,8 +528,9 @@ class PatternDetector:
         else:
             threat_level = "high"
 
+        now = datetime.now()
         result = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now.isoformat(),
             "text_length": len(text),
             "detections": sorted(detections, key=lambda x: x["score"], reverse=True),
             "domain_scores": domain_scores,
@@ -220,7 +541,7 @@ class PatternDetector:
         }
 
         # Store in history
-        self.detection_history.append(result)
+        self.detection_history.record(result, now.timestamp())
 
         return result
 
@@ -261,6 +582,10 @@ class PatternDetector:
 
         return recommendations
 
+    def get_history_stats(self) -> dict:
+        """Buffer size and rolling 1h/24h aggregates."""
+        return self.detection_history.get_stats()
+
     def quick_check(self, text: str) -> str:
         """Quick one-line assessment."""
         result = self.analyze(text)
@@ -349,5 +674,9 @@ def demo():
     for domain, data in domain_report['domains'].items():
         print(f"  {domain}: {data['level']} (score: {data['score']})")
 
+    # Rolling history
+    last_hour = detector.get_history_stats()["windows"]["1h"]
+    print(f"\nLast hour: {last_hour['count']} analyses, levels {last_hour['threat_levels']}")
+
 if __name__ == "__main__":
     demo()
@@ -8,23 +8,40 @@ Endpoints:
 - score_consciousness(pr, pa, ns) → Consciousness level
 - analyze_situation(situation, context) → Full analysis
 - seven_domains_check(domain, input) → Domain-specific analysis
+- analyze_all(text) → Every analysis from one preprocessing pass
+- iter_batch(items) → Full analysis per item across a process pool, as completed
 
 Created: 2025-11-22
 Trinity Build: C1 × C2 × C3
 """
 
+import os
 import sys
 import json
+import threading
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from itertools import islice
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterable, Iterator, Optional
 
-# Add core to path
+# Add core and projection to path
 CORE_DIR = Path(__file__).parent.parent / "core"
+PROJECTION_DIR = Path(__file__).parent.parent / "projection"
 sys.path.insert(0, str(CORE_DIR))
+sys.path.insert(0, str(PROJECTION_DIR))
 
-from PATTERN_THEORY_ENGINE import PatternTheoryEngine, analyze_situation
+from PATTERN_THEORY_ENGINE import PatternAnalysis, PatternTheoryEngine, analyze_situation
 from CONSCIOUSNESS_SCORER import ConsciousnessScorer, score_consciousness
+from MANIPULATION_DETECTOR import ManipulationDetection, ManipulationDetector
+from SEVEN_DOMAINS_ANALYZER import SevenDomainsAnalysis, SevenDomainsAnalyzer
+from RESULT_CACHE import CachedAnalyzer, ResultCache, get_result_cache
+from TIMELINE_PROJECTOR import TimelineProjector
+from TEXT_FEATURES import TextFeatures
+
+# Batch defaults - overridable per deployment
+BATCH_WORKERS = int(os.environ.get("PATTERN_BATCH_WORKERS", min(4, os.cpu_count() or 1)))
+BATCH_CHUNK_SIZE = int(os.environ.get("PATTERN_BATCH_CHUNK_SIZE", 64))
 
 class PatternTheoryAPI:
     """
@@ -44,11 +61,26 @@ class PatternTheoryAPI:
         7: "Transparency/Trust"
     }
 
-    def __init__(self):
+    def __init__(self, cache: Optional[ResultCache] = None):
         self.pattern_engine = PatternTheoryEngine()
         self.consciousness_scorer = ConsciousnessScorer()
+        self.manipulation_detector = ManipulationDetector()
+        self.domains_analyzer = SevenDomainsAnalyzer()
+        self.timeline_projector = TimelineProjector()
         self.call_count = 0
 
+        # Content-addressed cache in front of the text analyzers
+        self.cache = cache or get_result_cache()
+        self.analyze_pattern = CachedAnalyzer(
+            self.cache, "pattern", self.pattern_engine.analyze, PatternTheoryEngine, PatternAnalysis,
+            counter="analysis_count")
+        self.detect_manipulation = CachedAnalyzer(
+            self.cache, "manipulation", self.manipulation_detector.detect, ManipulationDetector, ManipulationDetection,
+            counter="detection_count")
+        self.analyze_domains = CachedAnalyzer(
+            self.cache, "domains", self.domains_analyzer.analyze, SevenDomainsAnalyzer, SevenDomainsAnalysis,
+            counter="analysis_count")
+
     def analyze(self, text: str, context: Optional[str] = None) -> Dict[str, Any]:
         """
         Primary analysis endpoint.
@@ -62,35 +94,22 @@ class PatternTheoryAPI:
         """
         self.call_count += 1
 
+        # One preprocessing pass shared by both engines
+        features = TextFeatures(text)
+
         # Get pattern analysis
-        pattern_result = self.pattern_engine.analyze(text, context)
+        pattern_result = self.analyze_pattern(text, context, features)
 
         # Get consciousness indicators from text
-        consciousness_result = self.consciousness_scorer.score_from_text(text)
+        consciousness_result = self.consciousness_scorer.score_from_text(text, features)
 
         return {
             "success": True,
             "timestamp": datetime.now().isoformat(),
             "api_version": "1.0.0",
             "analysis": {
-                "pattern": {
-                    "algorithm": pattern_result.algorithm,
-                    "truth_score": pattern_result.truth_score,
-                    "deceit_score": pattern_result.deceit_score,
-                    "pattern_type": pattern_result.pattern_type,
-                    "fifteen_degree_turns": pattern_result.fifteen_degree_turns,
-                    "golden_ratio_alignment": pattern_result.golden_ratio_alignment,
-                    "recommendation": pattern_result.recommended_action,
-                    "confidence": pattern_result.confidence
-                },
-                "consciousness": {
-                    "level": consciousness_result.consciousness_level,
-                    "level_name": consciousness_result.level_name,
-                    "manipulation_immunity": consciousness_result.manipulation_immunity,
-                    "pattern_recognition": consciousness_result.pattern_recognition,
-                    "prediction_accuracy": consciousness_result.prediction_accuracy,
-                    "neutralization_success": consciousness_result.neutralization_success
-                }
+                "pattern": self._pattern_dict(pattern_result),
+                "consciousness": self._consciousness_dict(consciousness_result)
             },
             "metadata": {
                 "call_count": self.call_count,
@@ -98,13 +117,88 @@ class PatternTheoryAPI:
             }
         }
 
+    def analyze_all(self, text: str, context: Optional[str] = None,
+                    consciousness: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Every analysis from one preprocessing pass.
+
+        Args:
+            text: Text to analyze
+            context: Optional context
+            consciousness: Level (0-100) for timeline projection; defaults
+                           to the level scored from the text
+
+        Returns:
+            Pattern, consciousness, manipulation, domains and timeline results
+        """
+        self.call_count += 1
+        features = TextFeatures(text)
+
+        pattern_result = self.analyze_pattern(text, context, features)
+        consciousness_result = self.consciousness_scorer.score_from_text(text, features)
+        manipulation = self.detect_manipulation(text, context, features)
+        domains = self.analyze_domains(text, context, features)
+        if consciousness is None:
+            consciousness = min(100.0, consciousness_result.consciousness_level)
+        projection = self.timeline_projector.project(text, context, consciousness, features)
+
+        return {
+            "success": True,
+            "timestamp": datetime.now().isoformat(),
+            "api_version": "1.0.0",
+            "analysis": {
+                "pattern": self._pattern_dict(pattern_result),
+                "consciousness": self._consciousness_dict(consciousness_result),
+                "manipulation": {
+                    "m_score": manipulation.m_score,
+                    "risk_level": manipulation.risk_level,
+                    "manipulation_type": manipulation.manipulation_type,
+                    "turns_detected": manipulation.turns_detected,
+                    "red_flags": manipulation.red_flags,
+                    "counter_strategy": manipulation.counter_strategy
+                },
+                "domains": self.domains_analyzer.to_dict(domains)["result"],
+                "timeline": self.timeline_projector.to_dict(projection)["result"]
+            },
+            "metadata": {
+                "call_count": self.call_count,
+                "input_length": len(text),
+                "sentences": len(features.sentence_spans),
+                "tokens": len(features.tokens)
+            }
+        }
+
+    @staticmethod
+    def _pattern_dict(result) -> Dict[str, Any]:
+        return {
+            "algorithm": result.algorithm,
+            "truth_score": result.truth_score,
+            "deceit_score": result.deceit_score,
+            "pattern_type": result.pattern_type,
+            "fifteen_degree_turns": result.fifteen_degree_turns,
+            "golden_ratio_alignment": result.golden_ratio_alignment,
+            "recommendation": result.recommended_action,
+            "confidence": result.confidence
+        }
+
+    @staticmethod
+    def _consciousness_dict(result) -> Dict[str, Any]:
+        return {
+            "level": result.consciousness_level,
+            "level_name": result.level_name,
+            "manipulation_immunity": result.manipulation_immunity,
+            "pattern_recognition": result.pattern_recognition,
+            "prediction_accuracy": result.prediction_accuracy,
+            "neutralization_success": result.neutralization_success
+        }
+
     def quick_check(self, text: str) -> str:
         """
         Quick truth/deceit check.
 
         Returns: "TRUTH", "DECEIT", or "NEUTRAL"
         """
-        result = self.pattern_engine.analyze(text)
+        result = self.analyze_pattern(text)
 
         if result.confidence < 0.3:
             return "NEUTRAL"
@@ -221,46 +315,195 @@ class PatternTheoryAPI:
 
         return guidance_map.get(domain, {}).get(algorithm, "No specific guidance available.")
 
-    def batch_analyze(self, items: list) -> Dict[str, Any]:
+    def analyze_item(self, text: str) -> Dict[str, Any]:
+        """
+        Full analysis of one batch item: pattern, manipulation and domains.
+
+        One preprocessing pass is shared by all three analyzers. "result"
+        follows the quick_check rule (NEUTRAL below 0.3 confidence).
+        """
+        features = TextFeatures(text)
+        pattern = self.analyze_pattern(text, None, features)
+        manipulation = self.detect_manipulation(text, None, features)
+        domains = self.analyze_domains(text, None, features)
+
+        return {
+            "text": text[:100] + "..." if len(text) > 100 else text,
+            "result": "NEUTRAL" if pattern.confidence < 0.3 else pattern.algorithm.upper(),
+            "pattern": {
+                "algorithm": pattern.algorithm,
+                "truth_score": pattern.truth_score,
+                "deceit_score": pattern.deceit_score,
+                "pattern_type": pattern.pattern_type,
+                "fifteen_degree_turns": pattern.fifteen_degree_turns,
+                "confidence": pattern.confidence
+            },
+            "manipulation": {
+                "m_score": manipulation.m_score,
+                "risk_level": manipulation.risk_level,
+                "manipulation_type": manipulation.manipulation_type,
+                "red_flags": manipulation.red_flags
+            },
+            "domains": {
+                "scores": {k: v.score for k, v in domains.domains.items()},
+                "balance_score": domains.balance_score,
+                "strongest_domain": domains.strongest_domain,
+                "weakest_domain": domains.weakest_domain
+            }
+        }
+
+    def batch_analyze(self, items: list, workers: int = 0,
+                      chunk_size: int = BATCH_CHUNK_SIZE) -> Dict[str, Any]:
         """
         Analyze multiple items at once.
 
         Args:
             items: List of texts to analyze
+            workers: Worker processes (0 = analyze in this process)
+            chunk_size: Items per worker task
 
         Returns:
-            Batch results with summary
+            Batch results (in input order) with summary
         """
-        results = []
-        truth_count = 0
-        deceit_count = 0
-
-        for item in items:
-            result = self.quick_check(item)
-            results.append({
-                "text": item[:100] + "..." if len(item) > 100 else item,
-                "result": result
-            })
-
-            if result == "TRUTH":
-                truth_count += 1
-            elif result == "DECEIT":
-                deceit_count += 1
+        summary = BatchSummary()
+        results = [None] * len(items)
+
+        for result in iter_batch(items, workers, chunk_size):
+            summary.add(result)
+            results[result.pop("index")] = result
 
         return {
             "success": True,
             "timestamp": datetime.now().isoformat(),
             "batch_size": len(items),
-            "summary": {
-                "truth_count": truth_count,
-                "deceit_count": deceit_count,
-                "neutral_count": len(items) - truth_count - deceit_count,
-                "truth_ratio": truth_count / len(items) if items else 0
-            },
+            "summary": summary.to_dict(),
             "results": results
         }
 
 
+class BatchSummary:
+    """Running TRUTH/DECEIT/NEUTRAL tally over streamed batch results."""
+
+    def __init__(self):
+        self.counts = {"TRUTH": 0, "DECEIT": 0, "NEUTRAL": 0}
+        self.errors = 0
+
+    def add(self, result: Dict[str, Any]) -> None:
+        if "error" in result:
+            self.errors += 1
+        else:
+            self.counts[result["result"]] = self.counts.get(result["result"], 0) + 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        analyzed = sum(self.counts.values())
+        return {
+            "truth_count": self.counts["TRUTH"],
+            "deceit_count": self.counts["DECEIT"],
+            "neutral_count": self.counts["NEUTRAL"],
+            "error_count": self.errors,
+            "truth_ratio": self.counts["TRUTH"] / analyzed if analyzed else 0
+        }
+
+
+# ============================================================================
+# PARALLEL BATCH
+# ============================================================================
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def _analyze_chunk(start: int, texts: list) -> list:
+    """Worker task: full analysis of consecutive items (runs in the pool).
+
+    A failing item becomes an error result; it never fails the chunk.
+    """
+    results = []
+    for offset, text in enumerate(texts):
+        if isinstance(text, str):
+            try:
+                result = _api.analyze_item(text)
+            except Exception as e:
+                result = {"error": f"{type(e).__name__}: {e}"}
+        else:
+            result = {"error": "Item must be a string"}
+        result["index"] = start + offset
+        results.append(result)
+    return results
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    """Shared worker pool, started on first use (BATCH_WORKERS processes)."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(max_workers=BATCH_WORKERS)
+        return _pool
+
+
+def iter_batch(items: Iterable, workers: int = BATCH_WORKERS,
+               chunk_size: int = BATCH_CHUNK_SIZE) -> Iterator[Dict[str, Any]]:
+    """
+    Full analysis of every item, yielded as chunks complete (not in order).
+
+    Each result carries its input "index". Items are pulled from the
+    iterable lazily and at most two chunks per worker are in flight, so a
+    slow consumer stops new work being queued and memory stays bounded by
+    the in-flight window rather than the batch size.
+
+    Args:
+        items: Texts (any iterable, e.g. a generator over an upload)
+        workers: Chunks run concurrently, capped at BATCH_WORKERS
+                 (0 or 1 = analyze in this process)
+        chunk_size: Items per worker task
+    """
+    chunk_size = max(1, chunk_size)
+    source = iter(items)
+    start = 0
+
+    def next_chunk():
+        nonlocal start
+        texts = list(islice(source, chunk_size))
+        chunk = (start, texts)
+        start += len(texts)
+        return chunk if texts else None
+
+    workers = min(workers, BATCH_WORKERS)
+    if workers <= 1:
+        chunk = next_chunk()
+        while chunk:
+            yield from _analyze_chunk(*chunk)
+            chunk = next_chunk()
+        return
+
+    pool = _get_pool()
+    pending = {}  # future -> (start, texts)
+    try:
+        while True:
+            while len(pending) < workers * 2:
+                chunk = next_chunk()
+                if chunk is None:
+                    break
+                pending[pool.submit(_analyze_chunk, *chunk)] = chunk
+            if not pending:
+                return
+
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                chunk_start, texts = pending.pop(future)
+                try:
+                    chunk_results = future.result()
+                except Exception as e:
+                    # Worker process died: report every item of the chunk, keep streaming
+                    chunk_results = [{"error": f"{type(e).__name__}: {e}", "index": chunk_start + offset}
+                                     for offset in range(len(texts))]
+                yield from chunk_results
+    finally:
+        # Client went away or a worker failed - drop queued chunks
+        for future in pending:
+            future.cancel()
+
+
 # Convenience functions for quick access
 _api = PatternTheoryAPI()
 
@@ -10,9 +10,18 @@ Trinity Build: C2 Architect
 """
 
 from datetime import datetime
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Sequence
 from dataclasses import dataclass, asdict
 
+from MARKER_MATCHER import register_markers
+from TEXT_FEATURES import TextFeatures
+
+# NumPy is optional - batch scoring falls back to plain Python loops
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 @dataclass
 class ConsciousnessScore:
     """Complete consciousness assessment result"""
@@ -46,6 +55,20 @@ class ConsciousnessScorer:
         (100, 1000): "Execution Confidence"
     }
 
+    # Text indicators for score_from_text
+    PATTERN_MARKERS = [
+        "pattern", "recognize", "see", "understand", "realize",
+        "notice", "observe", "detect", "identify", "correlate"
+    ]
+    PREDICTION_MARKERS = [
+        "predict", "anticipate", "expect", "foresee", "project",
+        "forecast", "will happen", "going to", "inevitable"
+    ]
+    NEUTRALIZATION_MARKERS = [
+        "neutralize", "counter", "block", "prevent", "stop",
+        "overcome", "defeat", "resist", "immune", "protected"
+    ]
+
     def __init__(self):
         self.history: List[ConsciousnessScore] = []
 
@@ -109,44 +132,87 @@ class ConsciousnessScorer:
         self.history.append(result)
         return result
 
-    def score_from_text(self, text: str) -> ConsciousnessScore:
+    def score_from_text(self, text: str, features: Optional[TextFeatures] = None) -> ConsciousnessScore:
         """
         Analyze text to estimate consciousness indicators.
 
         Args:
             text: Text to analyze for consciousness markers
+            features: Preprocessed text, if already computed
 
         Returns:
             ConsciousnessScore based on text analysis
         """
-        text_lower = text.lower()
-
-        # Pattern recognition indicators
-        pattern_markers = [
-            "pattern", "recognize", "see", "understand", "realize",
-            "notice", "observe", "detect", "identify", "correlate"
-        ]
-        pattern_score = sum(10 for m in pattern_markers if m in text_lower)
-        pattern_score = min(100, pattern_score + 30)  # Base of 30
-
-        # Prediction accuracy indicators
-        prediction_markers = [
-            "predict", "anticipate", "expect", "foresee", "project",
-            "forecast", "will happen", "going to", "inevitable"
-        ]
-        prediction_score = sum(10 for m in prediction_markers if m in text_lower)
-        prediction_score = min(100, prediction_score + 30)
-
-        # Neutralization success indicators
-        neutralization_markers = [
-            "neutralize", "counter", "block", "prevent", "stop",
-            "overcome", "defeat", "resist", "immune", "protected"
-        ]
-        neutralization_score = sum(10 for m in neutralization_markers if m in text_lower)
-        neutralization_score = min(100, neutralization_score + 30)
+        hits = TextFeatures.of(text, features).hits
+
+        # Indicators are stems ("recognize" -> "recognized"), base of 30 each
+        pattern_score = min(100, 10 * hits.count(self.PATTERN_MARKERS, stem=True) + 30)
+        prediction_score = min(100, 10 * hits.count(self.PREDICTION_MARKERS, stem=True) + 30)
+        neutralization_score = min(100, 10 * hits.count(self.NEUTRALIZATION_MARKERS, stem=True) + 30)
 
         return self.score(pattern_score, prediction_score, neutralization_score)
 
+    def score_batch(
+        self,
+        pattern_recognition: Sequence[float],
+        prediction_accuracy: Sequence[float],
+        neutralization_success: Sequence[float]
+    ) -> Dict[str, Any]:
+        """
+        Score many users at once - same formula as score(), as columns.
+
+        Args:
+            pattern_recognition: One value per user (0-100)
+            prediction_accuracy: One value per user (0-100)
+            neutralization_success: One value per user (0-100)
+
+        Returns:
+            Columns (NumPy arrays, or lists without NumPy) keyed like
+            ConsciousnessScore, minus timestamp. Not added to history.
+        """
+        if np is None:
+            rows = [self._score_values(pr, pa, ns) for pr, pa, ns in
+                    zip(pattern_recognition, prediction_accuracy, neutralization_success)]
+            keys = ["consciousness_level", "pattern_recognition", "prediction_accuracy",
+                    "neutralization_success", "manipulation_immunity", "level_name"]
+            return {key: [row[i] for row in rows] for i, key in enumerate(keys)}
+
+        pr = np.clip(np.asarray(pattern_recognition, dtype=float), 0, 100)
+        pa = np.clip(np.asarray(prediction_accuracy, dtype=float), 0, 100)
+        ns = np.clip(np.asarray(neutralization_success, dtype=float), 0, 100)
+
+        base_level = pr * 0.4 + pa * 0.3 + ns * 0.3
+        manipulation_immunity = pr * 0.5 + ns * 0.5
+
+        # Above 85% base, each point multiplies (max 10x at 100)
+        multiplier = np.where(base_level > 85, 1 + ((base_level - 85) / 15) * 9, 1.0)
+        consciousness_level = base_level * multiplier
+
+        return {
+            "consciousness_level": np.round(consciousness_level, 2),
+            "pattern_recognition": np.round(pr, 2),
+            "prediction_accuracy": np.round(pa, 2),
+            "neutralization_success": np.round(ns, 2),
+            "manipulation_immunity": np.round(manipulation_immunity, 2),
+            "level_name": self._level_names(base_level)
+        }
+
+    def _score_values(self, pr: float, pa: float, ns: float) -> tuple:
+        """score() without the dataclass, timestamp or history (batch fallback)."""
+        pr, pa, ns = max(0, min(100, pr)), max(0, min(100, pa)), max(0, min(100, ns))
+        base_level = pr * 0.4 + pa * 0.3 + ns * 0.3
+        level = base_level * (1 + ((base_level - 85) / 15) * 9) if base_level > 85 else base_level
+        return (round(level, 2), round(pr, 2), round(pa, 2), round(ns, 2),
+                round(pr * 0.5 + ns * 0.5, 2), self._get_level_name(base_level))
+
+    def _level_names(self, base_level):
+        """Vectorized _get_level_name over an array of base levels."""
+        bounds = sorted(self.LEVEL_NAMES)
+        edges = np.array([low for low, _ in bounds] + [bounds[-1][1]], dtype=float)
+        names = np.array(["Transcendent"] + [self.LEVEL_NAMES[b] for b in bounds] + ["Transcendent"])
+        # searchsorted(side="right") maps [low, high) to its band; 0 and len+1 are out of range
+        return names[np.searchsorted(edges, base_level, side="right")]
+
     def _get_level_name(self, base_level: float) -> str:
         """Get the name for a consciousness level."""
         for (low, high), name in self.LEVEL_NAMES.items():
@@ -219,6 +285,13 @@ class ConsciousnessScorer:
         }
 
 
+register_markers(
+    ConsciousnessScorer.PATTERN_MARKERS,
+    ConsciousnessScorer.PREDICTION_MARKERS,
+    ConsciousnessScorer.NEUTRALIZATION_MARKERS
+)
+
+
 def score_consciousness(
     pattern_recognition: float,
     prediction_accuracy: float,
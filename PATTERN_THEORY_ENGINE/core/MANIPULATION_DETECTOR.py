@@ -10,9 +10,12 @@ Trinity Build: C2 Architect
 """
 
 from datetime import datetime
-from typing import Dict, Any, List, Tuple
+from typing import Dict, Any, List, Optional, Tuple
 from dataclasses import dataclass, asdict
 
+from MARKER_MATCHER import MarkerHits, register_markers, scan
+from TEXT_FEATURES import TextFeatures
+
 @dataclass
 class ManipulationDetection:
     """Result of manipulation detection analysis"""
@@ -80,6 +83,17 @@ class ManipulationDetector:
         }
     }
 
+    # Red flags: (markers, flag), each counted once
+    RED_FLAGS = [
+        (["must", "have to", "need to", "should"], "Pressure language detected"),
+        (["only", "exclusive", "special", "secret"], "False exclusivity claim"),
+        (["expert", "authority", "professional says"], "Unverified authority appeal"),
+        (["always", "never", "everyone", "nobody"], "Absolutist language"),
+        (["stupid", "crazy", "wrong", "idiot"], "Ad hominem attack")
+    ]
+    FINANCIAL_OFFER_WORDS = ["free", "discount", "deal", "save"]
+    FINANCIAL_URGENCY_WORDS = ["now", "today", "limited"]
+
     # Risk level thresholds
     RISK_LEVELS = {
         (0, 20): "LOW",
@@ -91,38 +105,40 @@ class ManipulationDetector:
     def __init__(self):
         self.detection_count = 0
 
-    def detect(self, text: str, context: str = None) -> ManipulationDetection:
+    def detect(self, text: str, context: str = None,
+               features: Optional[TextFeatures] = None) -> ManipulationDetection:
         """
         Analyze text for manipulation patterns.
 
         Args:
             text: Text to analyze
             context: Optional additional context
+            features: Preprocessed text, if already computed
 
         Returns:
             ManipulationDetection with full analysis
         """
         self.detection_count += 1
-        text_lower = text.lower()
+        hits = TextFeatures.of(text, features).hits
 
         # Detect 15-degree turns
         turns_detected = []
         total_severity = 0
 
         for turn_type, turn_info in self.FIFTEEN_DEGREE_TURNS.items():
-            for marker in turn_info["markers"]:
-                if marker in text_lower:
-                    turns_detected.append({
-                        "type": turn_type,
-                        "marker": marker,
-                        "description": turn_info["description"],
-                        "counter": turn_info["counter"]
-                    })
-                    total_severity += 15
-                    break  # Only count each turn type once
+            # Only count each turn type once
+            marker = hits.first(turn_info["markers"])
+            if marker is not None:
+                turns_detected.append({
+                    "type": turn_type,
+                    "marker": marker,
+                    "description": turn_info["description"],
+                    "counter": turn_info["counter"]
+                })
+                total_severity += 15
 
         # Detect additional red flags
-        red_flags = self._detect_red_flags(text_lower)
+        red_flags = self._detect_red_flags(text, hits)
         total_severity += len(red_flags) * 10
 
         # Calculate M score (capped at 100)
@@ -149,34 +165,17 @@ class ManipulationDetector:
             timestamp=datetime.now().isoformat()
         )
 
-    def _detect_red_flags(self, text: str) -> List[str]:
+    def _detect_red_flags(self, text: str, hits: Optional[MarkerHits] = None) -> List[str]:
         """Detect additional manipulation red flags."""
-        red_flags = []
-
-        # Check for pressure tactics
-        if any(w in text for w in ["must", "have to", "need to", "should"]):
-            red_flags.append("Pressure language detected")
-
-        # Check for exclusivity claims
-        if any(w in text for w in ["only", "exclusive", "special", "secret"]):
-            red_flags.append("False exclusivity claim")
+        if hits is None:
+            hits = scan(text)
 
-        # Check for appeal to authority
-        if any(w in text for w in ["expert", "authority", "professional says"]):
-            red_flags.append("Unverified authority appeal")
-
-        # Check for absolutist language
-        if any(w in text for w in ["always", "never", "everyone", "nobody"]):
-            red_flags.append("Absolutist language")
-
-        # Check for character attacks
-        if any(w in text for w in ["stupid", "crazy", "wrong", "idiot"]):
-            red_flags.append("Ad hominem attack")
+        # Pressure, exclusivity, authority, absolutist and ad hominem language
+        red_flags = [flag for markers, flag in self.RED_FLAGS if hits.any(markers)]
 
         # Check for financial pressure
-        if any(w in text for w in ["free", "discount", "deal", "save"]):
-            if any(w in text for w in ["now", "today", "limited"]):
-                red_flags.append("Financial pressure tactic")
+        if hits.any(self.FINANCIAL_OFFER_WORDS) and hits.any(self.FINANCIAL_URGENCY_WORDS):
+            red_flags.append("Financial pressure tactic")
 
         return red_flags
 
@@ -272,6 +271,14 @@ class ManipulationDetector:
         }
 
 
+register_markers(
+    *[info["markers"] for info in ManipulationDetector.FIFTEEN_DEGREE_TURNS.values()],
+    *[markers for markers, _ in ManipulationDetector.RED_FLAGS],
+    ManipulationDetector.FINANCIAL_OFFER_WORDS,
+    ManipulationDetector.FINANCIAL_URGENCY_WORDS
+)
+
+
 def detect_manipulation(text: str) -> Dict[str, Any]:
     """
     Convenience function for quick detection.
@@ -0,0 +1,190 @@
+"""
+MARKER MATCHER - Single-Pass Multi-Pattern Marker Scan
+=======================================================
+One tokenizing pass over the text answers every marker check of every
+analyzer.
+
+Each analyzer registers its marker lists at class load. scan() splits the
+text into its word vocabulary once; after that every marker check is a
+set lookup (words), a bisect over the sorted vocabulary (stems) or a
+bounded str.find (multi-word phrases whose words are all present):
+
+    hits = scan(text)
+    hits.count(DECEIT_MARKERS)                # distinct whole-word markers present
+    hits.any(["invest", "money"], stem=True)  # word-start matches ("investors")
+    hits.to_list()                            # every registered hit with positions
+
+Matching rules:
+- Markers only match at a word start ("just" never hits "adjust")
+- Whole-word (default): the marker must also end at a word boundary
+- stem=True: the marker may be the start of a longer word
+- Overlapping markers all match ("but" inside "yes, but")
+
+Created: 2025-11-22
+Trinity Build: C1 × C2 × C3
+"""
+
+import re
+import threading
+from bisect import bisect_left
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Words, keeping contractions together ("don't") - pieces are indexed too
+TOKEN_RE = re.compile(r"\w+(?:'\w+)*")
+_WORD_CHAR = re.compile(r'\w')
+
+
+def _normalize(marker: str) -> str:
+    return marker.strip().lower()
+
+
+class MarkerHits:
+    """Marker lookups against one scanned text (results cached per marker)."""
+
+    def __init__(self, text_lower: str, words: set, matcher: "MarkerMatcher"):
+        self.text = text_lower
+        self.words = words
+        self.matcher = matcher
+        self._sorted_words = None
+        self._cache: Dict[Tuple[str, bool], bool] = {}
+
+    def _has_stem_word(self, stem: str) -> bool:
+        if self._sorted_words is None:
+            self._sorted_words = sorted(self.words)
+        i = bisect_left(self._sorted_words, stem)
+        return i < len(self._sorted_words) and self._sorted_words[i].startswith(stem)
+
+    def _present(self, marker: str, stem: bool) -> bool:
+        key = (marker, stem)
+        found = self._cache.get(key)
+        if found is not None:
+            return found
+
+        single, tokens = self.matcher.info(marker)
+        if marker in self.words:
+            found = True
+        elif single:
+            found = stem and self._has_stem_word(marker)
+        else:
+            # Phrase: every word must be in the vocabulary before touching the text
+            last = tokens[-1] if tokens else ''
+            found = (all(t in self.words for t in tokens[:-1])
+                     and (last in self.words or (stem and self._has_stem_word(last)))
+                     and bool(self._find(marker, stem, first_only=True)))
+        self._cache[key] = found
+        return found
+
+    def _find(self, marker: str, stem: bool, first_only: bool = False) -> List[int]:
+        """Positions of marker at word starts (and word ends unless stem)."""
+        text, positions = self.text, []
+        start = text.find(marker)
+        while start != -1:
+            end = start + len(marker)
+            if ((start == 0 or not _WORD_CHAR.match(text, start - 1))
+                    and (stem or end == len(text) or not _WORD_CHAR.match(text, end)
+                         or not _WORD_CHAR.match(marker[-1]))):
+                positions.append(start)
+                if first_only:
+                    break
+            start = text.find(marker, start + 1)
+        return positions
+
+    def has(self, marker: str, stem: bool = False) -> bool:
+        return self._present(_normalize(marker), stem)
+
+    def any(self, markers: Iterable[str], stem: bool = False) -> bool:
+        return any(self._present(_normalize(m), stem) for m in markers)
+
+    def count(self, markers: Iterable[str], stem: bool = False) -> int:
+        """Number of distinct markers present (not occurrences)."""
+        return sum(1 for m in markers if self._present(_normalize(m), stem))
+
+    def first(self, markers: Iterable[str], stem: bool = False) -> Optional[str]:
+        """First marker (in list order) that is present, or None."""
+        for m in markers:
+            if self._present(_normalize(m), stem):
+                return m
+        return None
+
+    def positions(self, marker: str, stem: bool = False) -> List[int]:
+        marker = _normalize(marker)
+        return self._find(marker, stem) if self._present(marker, stem) else []
+
+    def to_list(self, stem: bool = False) -> List[Dict]:
+        """Every registered marker hit with its position, in text order."""
+        hits = [{"marker": m, "position": p}
+                for m in self.matcher.markers if self._present(m, stem)
+                for p in self._find(m, stem)]
+        return sorted(hits, key=lambda h: (h["position"], -len(h["marker"])))
+
+
+class MarkerMatcher:
+    """Precompiled marker metadata; scan() tokenizes a text once."""
+
+    def __init__(self, markers: Iterable[str] = ()):
+        self.markers = sorted({_normalize(m) for m in markers if _normalize(m)})
+        self._info = {m: self._compile(m) for m in self.markers}
+
+    @staticmethod
+    def _compile(marker: str) -> Tuple[bool, List[str]]:
+        tokens = TOKEN_RE.findall(marker)
+        return (len(tokens) == 1 and tokens[0] == marker), tokens
+
+    def info(self, marker: str) -> Tuple[bool, List[str]]:
+        """(is a single word, its words) - unregistered markers compile on demand."""
+        info = self._info.get(marker)
+        if info is None:
+            info = self._info[marker] = self._compile(marker)
+        return info
+
+    def scan(self, text: str) -> MarkerHits:
+        """Tokenize lowercased text once into its word vocabulary."""
+        text_lower = text.lower()
+        return self.scan_tokens(text_lower, text_lower.split())
+
+    def scan_tokens(self, text_lower: str, tokens: Iterable[str]) -> MarkerHits:
+        """scan() over an already lowercased text and its whitespace split."""
+        words = set()
+        for raw in set(tokens):
+            if raw.isalnum():
+                words.add(raw)
+                continue
+            for token in TOKEN_RE.findall(raw):
+                words.add(token)
+                if "'" in token:
+                    words.update(token.split("'"))
+        return MarkerHits(text_lower, words, self)
+
+
+# ============================================================================
+# SHARED REGISTRY
+# ============================================================================
+
+_registered = set()
+_shared = None
+_lock = threading.Lock()
+
+
+def register_markers(*marker_lists: Iterable[str]) -> None:
+    """Add analyzer markers to the shared matcher (call at class load)."""
+    global _shared
+    with _lock:
+        before = len(_registered)
+        for markers in marker_lists:
+            _registered.update(_normalize(m) for m in markers if _normalize(m))
+        if len(_registered) != before:
+            _shared = None
+
+
+def shared_matcher() -> MarkerMatcher:
+    """The matcher over every registered marker (rebuilt after new registrations)."""
+    global _shared
+    with _lock:
+        if _shared is None:
+            _shared = MarkerMatcher(_registered)
+        return _shared
+
+
+def scan(text: str) -> MarkerHits:
+    """Scan text once for every registered marker."""
+    return shared_matcher().scan(text)
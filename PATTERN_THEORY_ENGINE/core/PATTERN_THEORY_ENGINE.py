@@ -16,6 +16,9 @@ from datetime import datetime
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass, asdict
 
+from MARKER_MATCHER import MarkerHits, register_markers, scan
+from TEXT_FEATURES import TextFeatures
+
 # Golden Ratio - Universal constant
 PHI = 1.618033988749895
 
@@ -82,35 +85,66 @@ class PatternTheoryEngine:
         ("appear generous", "expect return")
     ]
 
+    # Turn indicators: (marker, turn type)
+    TURN_INDICATORS = [
+        ("but", "Pivot after positive"),
+        ("however", "Contradiction introduced"),
+        ("although", "Qualifier undermining"),
+        ("yes, but", "Agreement negation"),
+        ("i agree, however", "False agreement"),
+        ("that's true, but", "Truth dismissal"),
+        ("you're right, however", "Validation undermining")
+    ]
+    EMOTION_WORDS = ["feel", "hurt", "disappointed"]
+    TARGET_WORDS = ["you", "your"]
+    URGENCY_WORDS = ["now", "immediately", "urgent", "hurry"]
+    OBLIGATION_WORDS = ["must", "need", "have to"]
+
+    # Pattern classes, checked in order: (markers, pattern type)
+    DECEIT_PATTERNS = [
+        (["free", "easy", "quick"], "False Promise Pattern"),
+        (["fear", "danger", "risk"], "Fear Manipulation Pattern"),
+        (["everyone", "they all", "nobody"], "Social Proof Manipulation"),
+        (["secret", "exclusive", "special"], "Scarcity Manipulation")
+    ]
+    TRUTH_PATTERNS = [
+        (["because", "therefore", "thus"], "Logical Reasoning Pattern"),
+        (["evidence", "data", "research"], "Evidence-Based Pattern"),
+        (["experience", "learned", "discovered"], "Experiential Truth Pattern"),
+        (["permanent", "foundation", "long-term"], "Sustainable Foundation Pattern")
+    ]
+
     def __init__(self):
         self.analysis_count = 0
 
-    def analyze(self, input_text: str, context: Optional[str] = None) -> PatternAnalysis:
+    def analyze(self, input_text: str, context: Optional[str] = None,
+                features: Optional[TextFeatures] = None) -> PatternAnalysis:
         """
         Analyze input for pattern theory metrics.
 
         Args:
             input_text: The text to analyze
             context: Optional additional context
+            features: Preprocessed input_text, if already computed
 
         Returns:
             PatternAnalysis with all metrics
         """
         self.analysis_count += 1
 
-        # Normalize input
-        text_lower = input_text.lower()
-        words = text_lower.split()
+        # One preprocessing pass shared by every check below
+        features = TextFeatures.of(input_text, features)
+        hits = features.hits
 
         # Calculate scores
-        deceit_count = sum(1 for marker in self.DECEIT_MARKERS if marker in text_lower)
-        truth_count = sum(1 for marker in self.TRUTH_MARKERS if marker in text_lower)
+        deceit_count = hits.count(self.DECEIT_MARKERS)
+        truth_count = hits.count(self.TRUTH_MARKERS)
 
         # Detect 15-degree turns
-        turns = self._detect_fifteen_degree_turns(input_text)
+        turns = self._detect_fifteen_degree_turns(input_text, hits)
 
         # Calculate Golden Ratio alignment
-        golden_alignment = self._calculate_golden_alignment(input_text)
+        golden_alignment = self._calculate_golden_alignment(input_text, features)
 
         # Determine algorithm
         total_markers = deceit_count + truth_count
@@ -140,7 +174,7 @@ class PatternTheoryEngine:
         algorithm = "Truth" if truth_score > deceit_score else "Deceit"
 
         # Determine pattern type
-        pattern_type = self._classify_pattern(input_text, algorithm)
+        pattern_type = self._classify_pattern(input_text, algorithm, hits)
 
         # Generate recommendation
         recommended_action = self._generate_recommendation(
@@ -162,47 +196,34 @@ class PatternTheoryEngine:
             timestamp=datetime.now().isoformat()
         )
 
-    def _detect_fifteen_degree_turns(self, text: str) -> List[str]:
+    def _detect_fifteen_degree_turns(self, text: str, hits: Optional[MarkerHits] = None) -> List[str]:
         """Detect subtle manipulation pivots in text."""
         turns = []
-        text_lower = text.lower()
+        if hits is None:
+            hits = scan(text)
 
         # Check for common turn patterns
-        turn_indicators = [
-            ("but ", "Pivot after positive"),
-            ("however ", "Contradiction introduced"),
-            ("although ", "Qualifier undermining"),
-            ("yes, but", "Agreement negation"),
-            ("i agree, however", "False agreement"),
-            ("that's true, but", "Truth dismissal"),
-            ("you're right, however", "Validation undermining")
-        ]
-
-        for indicator, turn_type in turn_indicators:
-            if indicator in text_lower:
+        for indicator, turn_type in self.TURN_INDICATORS:
+            if hits.has(indicator):
                 turns.append(turn_type)
 
         # Check for emotional manipulation patterns
-        if any(word in text_lower for word in ["feel", "hurt", "disappointed"]):
-            if any(word in text_lower for word in ["you", "your"]):
-                turns.append("Emotional projection")
+        if hits.any(self.EMOTION_WORDS) and hits.any(self.TARGET_WORDS):
+            turns.append("Emotional projection")
 
         # Check for urgency manipulation
-        if any(word in text_lower for word in ["now", "immediately", "urgent", "hurry"]):
-            if any(word in text_lower for word in ["must", "need", "have to"]):
-                turns.append("False urgency creation")
+        if hits.any(self.URGENCY_WORDS) and hits.any(self.OBLIGATION_WORDS):
+            turns.append("False urgency creation")
 
         return turns
 
-    def _calculate_golden_alignment(self, text: str) -> float:
+    def _calculate_golden_alignment(self, text: str, features: Optional[TextFeatures] = None) -> float:
         """
         Calculate how well the text aligns with Golden Ratio proportions.
 
         Higher alignment = more natural/truthful structure
         """
-        words = text.split()
-        sentences = text.replace('!', '.').replace('?', '.').split('.')
-        sentences = [s.strip() for s in sentences if s.strip()]
+        sentences = TextFeatures.of(text, features).sentences
 
         if not sentences:
             return 0.5
@@ -226,32 +247,20 @@ class PatternTheoryEngine:
 
         return sum(ratios) / len(ratios)
 
-    def _classify_pattern(self, text: str, algorithm: str) -> str:
+    def _classify_pattern(self, text: str, algorithm: str, hits: Optional[MarkerHits] = None) -> str:
         """Classify the specific pattern type."""
-        text_lower = text.lower()
+        if hits is None:
+            hits = scan(text)
 
         if algorithm == "Deceit":
-            if any(w in text_lower for w in ["free", "easy", "quick"]):
-                return "False Promise Pattern"
-            elif any(w in text_lower for w in ["fear", "danger", "risk"]):
-                return "Fear Manipulation Pattern"
-            elif any(w in text_lower for w in ["everyone", "they all", "nobody"]):
-                return "Social Proof Manipulation"
-            elif any(w in text_lower for w in ["secret", "exclusive", "special"]):
-                return "Scarcity Manipulation"
-            else:
-                return "General Deceit Pattern"
+            patterns, default = self.DECEIT_PATTERNS, "General Deceit Pattern"
         else:
-            if any(w in text_lower for w in ["because", "therefore", "thus"]):
-                return "Logical Reasoning Pattern"
-            elif any(w in text_lower for w in ["evidence", "data", "research"]):
-                return "Evidence-Based Pattern"
-            elif any(w in text_lower for w in ["experience", "learned", "discovered"]):
-                return "Experiential Truth Pattern"
-            elif any(w in text_lower for w in ["permanent", "foundation", "long-term"]):
-                return "Sustainable Foundation Pattern"
-            else:
-                return "General Truth Pattern"
+            patterns, default = self.TRUTH_PATTERNS, "General Truth Pattern"
+
+        for markers, pattern_type in patterns:
+            if hits.any(markers):
+                return pattern_type
+        return default
 
     def _generate_recommendation(
         self,
@@ -290,6 +299,18 @@ class PatternTheoryEngine:
         }
 
 
+register_markers(
+    PatternTheoryEngine.DECEIT_MARKERS,
+    PatternTheoryEngine.TRUTH_MARKERS,
+    [indicator for indicator, _ in PatternTheoryEngine.TURN_INDICATORS],
+    PatternTheoryEngine.EMOTION_WORDS,
+    PatternTheoryEngine.TARGET_WORDS,
+    PatternTheoryEngine.URGENCY_WORDS,
+    PatternTheoryEngine.OBLIGATION_WORDS,
+    *[markers for markers, _ in PatternTheoryEngine.DECEIT_PATTERNS + PatternTheoryEngine.TRUTH_PATTERNS]
+)
+
+
 def analyze_situation(text: str, context: str = None) -> Dict[str, Any]:
     """
     Convenience function for quick analysis.
@@ -0,0 +1,280 @@
+"""
+RESULT CACHE - Content-Addressed Cache for Pattern Theory Analyses
+==================================================================
+Dashboards and the detector tools resend the same texts constantly; the
+analyzers are deterministic apart from their timestamp, so results are
+cached by content:
+
+    key = sha256(namespace | version | normalized text | context JSON)
+
+- version: engine version + a fingerprint of the analyzer's class-level
+  marker tables, so editing any marker list invalidates its entries
+- normalized text: lowercased, surrounding whitespace stripped (both are
+  invisible to the analyzers, which work on lowercased text and stripped
+  sentences)
+- payloads are stored without their timestamp; hits get a fresh one
+  and still bump the analyzer's own call counter, so its get_stats()
+  counts cached calls too
+
+Layer 1 is an in-memory LRU. Layer 2 (optional) is SQLite, so the cache
+survives restarts and is shared by batch worker processes.
+
+    cache = get_result_cache()
+    analyze = CachedAnalyzer(cache, "pattern", engine.analyze,
+                             PatternTheoryEngine, PatternAnalysis)
+    analyze(text, context)   # same as engine.analyze(text, context)
+    cache.get_stats()        # hit rates per namespace
+
+Created: 2025-11-22
+Trinity Build: C1 × C2 × C3
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+from dataclasses import asdict, fields, is_dataclass
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional
+
+ENGINE_VERSION = "1.0.0"
+
+# Configuration (environment overridable)
+CACHE_SIZE = int(os.environ.get("PATTERN_CACHE_SIZE", 4096))
+CACHE_DB = os.environ.get("PATTERN_CACHE_DB")  # unset = memory only
+CACHE_DB_MAX_ROWS = int(os.environ.get("PATTERN_CACHE_DB_MAX_ROWS", 100000))
+
+
+def normalize_text(text: str) -> str:
+    """Cache-key form of a text (see module docstring for why this is safe)."""
+    return text.lower().strip()
+
+
+def marker_fingerprint(cls: type) -> str:
+    """Hash of a class's UPPERCASE list/tuple/dict attributes (its marker tables)."""
+    tables = {
+        name: value for name, value in sorted(vars(cls).items())
+        if name.isupper() and isinstance(value, (list, tuple, dict))
+    }
+    # repr, not JSON: some tables are keyed by tuples (RISK_LEVELS)
+    return hashlib.sha1(repr(tables).encode("utf-8")).hexdigest()[:12]
+
+
+class ResultCache:
+    """Bounded LRU of analysis payloads, optionally backed by SQLite."""
+
+    def __init__(self, max_entries: int = CACHE_SIZE, db_path: Optional[str] = CACHE_DB,
+                 max_rows: int = CACHE_DB_MAX_ROWS):
+        self.max_entries = max_entries
+        self.max_rows = max_rows
+        self.memory = OrderedDict()  # key -> JSON payload
+        self.writes = 0
+        self.lock = threading.Lock()
+        self.stats: Dict[str, Dict[str, int]] = {}
+        self.started = datetime.now().isoformat()
+
+        self.db = None
+        self.db_path = db_path
+        if db_path:
+            self._open_db(db_path)
+
+    def _open_db(self, db_path: str):
+        try:
+            self.db = sqlite3.connect(db_path, timeout=5, check_same_thread=False)
+            self.db.execute("PRAGMA journal_mode=WAL")
+            self.db.execute("PRAGMA synchronous=NORMAL")
+            self.db.execute("""
+                CREATE TABLE IF NOT EXISTS result_cache (
+                    key TEXT PRIMARY KEY,
+                    namespace TEXT NOT NULL,
+                    version TEXT NOT NULL,
+                    payload TEXT NOT NULL,
+                    created_at TEXT NOT NULL
+                )
+            """)
+            self.db.commit()
+        except sqlite3.Error as e:
+            print(f"[RESULT CACHE] SQLite disabled ({db_path}): {e}")
+            self.db = None
+
+    def prune_versions(self, namespace: str, version: str):
+        """Drop persisted entries written under an older version of namespace."""
+        if self.db is None:
+            return
+        with self.lock:
+            try:
+                self.db.execute(
+                    "DELETE FROM result_cache WHERE namespace = ? AND version != ?",
+                    (namespace, version)
+                )
+                self.db.commit()
+            except sqlite3.Error:
+                pass
+
+    @staticmethod
+    def key(namespace: str, version: str, text: str, context: Any = None) -> str:
+        # Context may be any JSON body value (string, dict, list); key on a stable encoding
+        context_key = "" if context is None else json.dumps(context, sort_keys=True, default=str)
+        material = "\x1f".join([namespace, version, normalize_text(text), context_key])
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    def _count(self, namespace: str, field: str):
+        ns = self.stats.setdefault(namespace, {"hits": 0, "misses": 0})
+        ns[field] += 1
+
+    def get(self, namespace: str, key: str) -> Optional[Dict[str, Any]]:
+        with self.lock:
+            payload = self.memory.get(key)
+            if payload is not None:
+                self.memory.move_to_end(key)
+                self._count(namespace, "hits")
+                return json.loads(payload)
+
+            if self.db is not None:
+                try:
+                    row = self.db.execute(
+                        "SELECT payload FROM result_cache WHERE key = ?", (key,)
+                    ).fetchone()
+                except sqlite3.Error:
+                    row = None
+                if row:
+                    self._remember(key, row[0])
+                    self._count(namespace, "hits")
+                    return json.loads(row[0])
+
+            self._count(namespace, "misses")
+            return None
+
+    def put(self, namespace: str, version: str, key: str, payload: Dict[str, Any]):
+        encoded = json.dumps(payload, separators=(",", ":"))
+        with self.lock:
+            self._remember(key, encoded)
+            if self.db is None:
+                return
+            try:
+                self.db.execute(
+                    "INSERT OR REPLACE INTO result_cache (key, namespace, version, payload, created_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (key, namespace, version, encoded, datetime.now().isoformat())
+                )
+                # Keep the table bounded: every 1000 writes, trim back under max_rows
+                self.writes += 1
+                if self.max_rows and self.writes % 1000 == 0:
+                    count = self.db.execute("SELECT COUNT(*) FROM result_cache").fetchone()[0]
+                    if count > self.max_rows:
+                        self.db.execute(
+                            "DELETE FROM result_cache WHERE key IN ("
+                            "SELECT key FROM result_cache ORDER BY created_at LIMIT ?)",
+                            (count - self.max_rows + self.max_rows // 10,)
+                        )
+                self.db.commit()
+            except sqlite3.Error:
+                pass
+
+    def _remember(self, key: str, encoded: str):
+        self.memory[key] = encoded
+        self.memory.move_to_end(key)
+        while len(self.memory) > self.max_entries:
+            self.memory.popitem(last=False)
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self.lock:
+            namespaces = {}
+            hits = misses = 0
+            for namespace, ns in self.stats.items():
+                total = ns["hits"] + ns["misses"]
+                namespaces[namespace] = dict(ns, hit_rate=round(ns["hits"] / total * 100, 1) if total else 0)
+                hits += ns["hits"]
+                misses += ns["misses"]
+            return {
+                "entries": len(self.memory),
+                "max_entries": self.max_entries,
+                "persistent": self.db is not None,
+                "hits": hits,
+                "misses": misses,
+                "hit_rate": round(hits / (hits + misses) * 100, 1) if hits + misses else 0,
+                "namespaces": namespaces,
+                "started": self.started
+            }
+
+    def clear(self):
+        with self.lock:
+            self.memory.clear()
+            self.stats = {}
+            if self.db is not None:
+                try:
+                    self.db.execute("DELETE FROM result_cache")
+                    self.db.commit()
+                except sqlite3.Error:
+                    pass
+
+
+class CachedAnalyzer:
+    """
+    Cache in front of one analyzer method: fn(text, context, features).
+
+    The result dataclass is stored without its timestamp and rebuilt on a
+    hit with a fresh one (nested dataclass fields are rebuilt too).
+    counter names the analyzer attribute fn increments per call
+    (analysis_count, detection_count); hits increment it as well.
+    """
+
+    def __init__(self, cache: ResultCache, namespace: str, fn: Callable,
+                 analyzer_cls: type, result_cls: type, counter: Optional[str] = None):
+        self.cache = cache
+        self.namespace = namespace
+        self.fn = fn
+        self.counter = counter
+        self.result_cls = result_cls
+        self.version = f"{ENGINE_VERSION}:{marker_fingerprint(analyzer_cls)}"
+        cache.prune_versions(namespace, self.version)
+
+    def __call__(self, text: str, context: Any = None, features=None):
+        key = self.cache.key(self.namespace, self.version, text, context)
+        payload = self.cache.get(self.namespace, key)
+        if payload is not None:
+            analyzer = getattr(self.fn, "__self__", None)
+            if self.counter and analyzer is not None:
+                setattr(analyzer, self.counter, getattr(analyzer, self.counter, 0) + 1)
+            return self._rebuild(payload)
+
+        result = self.fn(text, context, features)
+        payload = asdict(result)
+        payload.pop("timestamp", None)
+        self.cache.put(self.namespace, self.version, key, payload)
+        return result
+
+    def _rebuild(self, payload: Dict[str, Any]):
+        values = {}
+        for f in fields(self.result_cls):
+            if f.name == "timestamp":
+                values[f.name] = datetime.now().isoformat()
+            else:
+                values[f.name] = _restore(f.type, payload[f.name])
+        return self.result_cls(**values)
+
+
+def _restore(annotation, value):
+    """Rebuild dataclasses nested as a field type or as Dict[str, <dataclass>] values."""
+    if is_dataclass(annotation) and isinstance(value, dict):
+        return annotation(**value)
+    args = getattr(annotation, "__args__", None)
+    if args and len(args) == 2 and is_dataclass(args[1]) and isinstance(value, dict):
+        return {k: args[1](**v) for k, v in value.items()}
+    return value
+
+
+# Singleton instance
+_cache_instance = None
+_cache_lock = threading.Lock()
+
+
+def get_result_cache() -> ResultCache:
+    """Get or create the process-wide result cache."""
+    global _cache_instance
+    with _cache_lock:
+        if _cache_instance is None:
+            _cache_instance = ResultCache()
+        return _cache_instance
@@ -0,0 +1,86 @@
+"""
+TEXT FEATURES - Shared Per-Request Preprocessing
+=================================================
+Everything the analyzers derive from raw text, computed once and shared:
+
+    features = TextFeatures(text)
+    engine.analyze(text, features=features)
+    detector.detect(text, features=features)
+    domains.analyze(text, features=features)
+
+- lower:           lowercased text
+- tokens:          lowercased whitespace tokens
+- sentence_spans:  (start, end) of each sentence (split on . ! ?, stripped)
+- sentences:       the sentence strings
+- hits:            marker scan (MARKER_MATCHER) built from tokens
+
+Each field is computed on first use, so an analyzer that never needs
+sentences never pays for them.
+
+Created: 2025-11-22
+Trinity Build: C1 × C2 × C3
+"""
+
+import re
+from typing import List, Optional, Tuple
+
+from MARKER_MATCHER import MarkerHits, shared_matcher
+
+# Runs between sentence terminators (matches the engines' . ! ? split)
+_SENTENCE_RUN = re.compile(r'[^.!?]+')
+
+
+class TextFeatures:
+    """Lazily computed preprocessing for one text."""
+
+    __slots__ = ("text", "_lower", "_tokens", "_sentence_spans", "_hits")
+
+    def __init__(self, text: str):
+        self.text = text
+        self._lower: Optional[str] = None
+        self._tokens: Optional[List[str]] = None
+        self._sentence_spans: Optional[List[Tuple[int, int]]] = None
+        self._hits: Optional[MarkerHits] = None
+
+    @classmethod
+    def of(cls, text: str, features: Optional["TextFeatures"] = None) -> "TextFeatures":
+        """The given features if they belong to text, else fresh ones."""
+        if features is not None and features.text is text:
+            return features
+        return cls(text)
+
+    @property
+    def lower(self) -> str:
+        if self._lower is None:
+            self._lower = self.text.lower()
+        return self._lower
+
+    @property
+    def tokens(self) -> List[str]:
+        if self._tokens is None:
+            self._tokens = self.lower.split()
+        return self._tokens
+
+    @property
+    def sentence_spans(self) -> List[Tuple[int, int]]:
+        """Non-empty sentences as (start, end), surrounding whitespace excluded."""
+        if self._sentence_spans is None:
+            spans = []
+            for m in _SENTENCE_RUN.finditer(self.text):
+                raw = m.group()
+                stripped = raw.strip()
+                if stripped:
+                    start = m.start() + (len(raw) - len(raw.lstrip()))
+                    spans.append((start, start + len(stripped)))
+            self._sentence_spans = spans
+        return self._sentence_spans
+
+    @property
+    def sentences(self) -> List[str]:
+        return [self.text[start:end] for start, end in self.sentence_spans]
+
+    @property
+    def hits(self) -> MarkerHits:
+        if self._hits is None:
+            self._hits = shared_matcher().scan_tokens(self.lower, self.tokens)
+        return self._hits
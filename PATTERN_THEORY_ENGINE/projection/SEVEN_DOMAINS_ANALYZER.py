@@ -16,10 +16,24 @@ Created: 2025-11-22
 Trinity Build: C3 Oracle
 """
 
+import sys
 from datetime import datetime
-from typing import Dict, Any, List, Optional
+from pathlib import Path
+from typing import Dict, Any, Iterable, List, Optional, Sequence
 from dataclasses import dataclass, asdict
 
+# NumPy is optional - batch scoring falls back to plain Python loops
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Shared marker matcher lives in core
+sys.path.insert(0, str(Path(__file__).parent.parent / "core"))
+
+from MARKER_MATCHER import MarkerHits, register_markers, scan
+from TEXT_FEATURES import TextFeatures
+
 @dataclass
 class DomainScore:
     """Score for a single domain"""
@@ -122,24 +136,26 @@ class SevenDomainsAnalyzer:
     def __init__(self):
         self.analysis_count = 0
 
-    def analyze(self, situation: str, context: Optional[str] = None) -> SevenDomainsAnalysis:
+    def analyze(self, situation: str, context: Optional[str] = None,
+                features: Optional[TextFeatures] = None) -> SevenDomainsAnalysis:
         """
         Analyze a situation across all 7 domains.
 
         Args:
             situation: The situation to analyze
             context: Optional additional context
+            features: Preprocessed situation, if already computed
 
         Returns:
             SevenDomainsAnalysis with all domain scores
         """
         self.analysis_count += 1
-        situation_lower = situation.lower()
+        hits = TextFeatures.of(situation, features).hits
 
         # Analyze each domain
         domains = {}
         for domain_key, domain_info in self.DOMAINS.items():
-            score = self._score_domain(situation_lower, domain_info)
+            score = self._score_domain(situation, domain_info, hits)
             domains[domain_key] = score
 
         # Calculate balance score
@@ -168,12 +184,15 @@ class SevenDomainsAnalyzer:
             timestamp=datetime.now().isoformat()
         )
 
-    def _score_domain(self, text: str, domain_info: Dict) -> DomainScore:
+    def _score_domain(self, text: str, domain_info: Dict,
+                      hits: Optional[MarkerHits] = None) -> DomainScore:
         """Score a single domain based on text analysis."""
         markers = domain_info["markers"]
+        if hits is None:
+            hits = scan(text)
 
-        # Count marker occurrences
-        marker_count = sum(1 for marker in markers if marker in text)
+        # Count markers present - domain markers are stems ("invest" -> "investors")
+        marker_count = hits.count(markers, stem=True)
 
         # Calculate base score
         base_score = min(100, 30 + (marker_count * 10))
@@ -204,6 +223,68 @@ class SevenDomainsAnalyzer:
             opportunities=opportunities if opportunities else ["Maintain current level"]
         )
 
+    def marker_counts(self, texts: Iterable[str]):
+        """
+        Marker-count matrix for analyze_batch: one row per text, one column
+        per domain (DOMAINS order), same stem matching as _score_domain.
+        """
+        marker_lists = [info["markers"] for info in self.DOMAINS.values()]
+        rows = [[hits.count(markers, stem=True) for markers in marker_lists]
+                for hits in (scan(text) for text in texts)]
+        if np is None:
+            return rows
+        return np.array(rows, dtype=np.int64).reshape(len(rows), len(marker_lists))
+
+    def analyze_batch(self, marker_counts: Sequence[Sequence[int]]) -> Dict[str, Any]:
+        """
+        Score many situations from a marker-count matrix - same rules as analyze().
+
+        Args:
+            marker_counts: Rows of per-domain marker counts (DOMAINS order),
+                           e.g. from marker_counts(texts)
+
+        Returns:
+            Columns (NumPy arrays, or lists without NumPy): domain_scores
+            per domain, balance_score, balance_variance, weakest_domain,
+            strongest_domain
+        """
+        keys = list(self.DOMAINS)
+
+        if np is None:
+            scores = [[min(100, 30 + c * 10) for c in row] for row in marker_counts]
+            variances, balances, weakest, strongest = [], [], [], []
+            for row in scores:
+                avg = sum(row) / len(row)
+                variance = sum((s - avg) ** 2 for s in row) / len(row)
+                variances.append(variance)
+                balances.append(round(max(0, 100 - (variance ** 0.5)), 2))
+                weakest.append(keys[row.index(min(row))])
+                strongest.append(keys[row.index(max(row))])
+            return {
+                "domain_scores": {key: [row[i] for row in scores] for i, key in enumerate(keys)},
+                "balance_score": balances,
+                "balance_variance": variances,
+                "weakest_domain": weakest,
+                "strongest_domain": strongest
+            }
+
+        counts = np.asarray(marker_counts, dtype=np.int64).reshape(-1, len(keys))
+        scores = np.minimum(100, 30 + counts * 10)
+
+        avg = scores.mean(axis=1, keepdims=True)
+        variance = ((scores - avg) ** 2).mean(axis=1)
+        balance = np.maximum(0, 100 - np.sqrt(variance))
+
+        # argmin/argmax return the first extreme, like min()/max() over DOMAINS order
+        names = np.array(keys)
+        return {
+            "domain_scores": {key: scores[:, i] for i, key in enumerate(keys)},
+            "balance_score": np.round(balance, 2),
+            "balance_variance": variance,
+            "weakest_domain": names[scores.argmin(axis=1)],
+            "strongest_domain": names[scores.argmax(axis=1)]
+        }
+
     def _find_integration_opportunities(self, domains: Dict[str, DomainScore]) -> List[str]:
         """Find opportunities to integrate domains."""
         opportunities = []
@@ -292,6 +373,9 @@ class SevenDomainsAnalyzer:
         }
 
 
+register_markers(*[info["markers"] for info in SevenDomainsAnalyzer.DOMAINS.values()])
+
+
 def analyze_domains(situation: str) -> Dict[str, Any]:
     """
     Convenience function for quick analysis.
@@ -7,15 +7,33 @@ Timeline A: Force (low success)
 Timeline B: Pivot (medium success)
 Timeline C: Transcend (high success)
 
+simulate() runs the same model as a Monte Carlo over N scenarios
+(NumPy, seeded) and returns success-probability distributions.
+
 Created: 2025-11-22
 Trinity Build: C3 Oracle
 """
 
+import copy
+import sys
 from datetime import datetime
-from typing import Dict, Any, List, Optional
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple
 from dataclasses import dataclass, asdict
 import random
 
+# NumPy is optional - only simulation mode needs it
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Shared preprocessing lives in core
+sys.path.insert(0, str(Path(__file__).parent.parent / "core"))
+
+from TEXT_FEATURES import TextFeatures
+
 @dataclass
 class Timeline:
     """Single projected timeline"""
@@ -45,6 +63,30 @@ class TimelineProjector:
     Uses consciousness levels and pattern analysis to predict outcomes.
     """
 
+    # Marker words that favour each approach
+    FORCE_MARKERS = ["make", "force", "demand", "require", "must", "fight"]
+    PIVOT_MARKERS = ["adapt", "adjust", "change", "flexible", "alternative"]
+    TRANSCEND_MARKERS = ["transcend", "transform", "elevate", "higher", "beyond"]
+
+    # Simulation model per timeline: success = base + slope * consciousness
+    # (+ bonus if its markers appear), capped. base/slope are drawn from
+    # normals around the deterministic constants; consciousness is drawn
+    # around the given level (shared by all three timelines per scenario).
+    SIMULATION_MODELS = {
+        "A": {"name": "Force", "base": 15, "base_sd": 5, "slope": 0.10, "slope_sd": 0.05,
+              "bonus": 5, "cap": 30, "markers": "FORCE_MARKERS"},
+        "B": {"name": "Pivot", "base": 45, "base_sd": 8, "slope": 0.35, "slope_sd": 0.08,
+              "bonus": 10, "cap": 85, "markers": "PIVOT_MARKERS"},
+        "C": {"name": "Transcend", "base": 55, "base_sd": 10, "slope": 0.45, "slope_sd": 0.10,
+              "bonus": 15, "cap": 95, "markers": "TRANSCEND_MARKERS",
+              "elevated_bonus": 10, "elevated_above": 85}
+    }
+    CONSCIOUSNESS_SD = 7.5
+    SIMULATION_PERCENTILES = (5, 25, 50, 75, 95)
+    MAX_SCENARIOS = 1_000_000
+    DEFAULT_SCENARIOS = 10_000
+    DEFAULT_SEED = 1618
+
     def __init__(self):
         self.projection_count = 0
 
@@ -52,7 +94,8 @@ class TimelineProjector:
         self,
         decision: str,
         context: Optional[str] = None,
-        current_consciousness: float = 50.0
+        current_consciousness: float = 50.0,
+        features: Optional[TextFeatures] = None
     ) -> TimelineProjection:
         """
         Project 3 timelines for a decision.
@@ -61,6 +104,7 @@ class TimelineProjector:
             decision: The decision to analyze
             context: Additional context
             current_consciousness: Current consciousness level (0-100)
+            features: Preprocessed decision, if already computed
 
         Returns:
             TimelineProjection with 3 futures
@@ -68,7 +112,7 @@ class TimelineProjector:
         self.projection_count += 1
 
         # Analyze the decision
-        decision_lower = decision.lower()
+        decision_lower = TextFeatures.of(decision, features).lower
         decision_summary = self._summarize_decision(decision)
 
         # Generate Timeline A: Force
@@ -117,8 +161,7 @@ class TimelineProjector:
         success = base_success + (consciousness * 0.1)
 
         # Force indicators in decision
-        force_markers = ["make", "force", "demand", "require", "must", "fight"]
-        if any(marker in decision for marker in force_markers):
+        if any(marker in decision for marker in self.FORCE_MARKERS):
             success += 5
 
         return Timeline(
@@ -161,8 +204,7 @@ class TimelineProjector:
         success = base_success + (consciousness * 0.35)
 
         # Pivot indicators
-        pivot_markers = ["adapt", "adjust", "change", "flexible", "alternative"]
-        if any(marker in decision for marker in pivot_markers):
+        if any(marker in decision for marker in self.PIVOT_MARKERS):
             success += 10
 
         return Timeline(
@@ -206,8 +248,7 @@ class TimelineProjector:
         success = base_success + (consciousness * 0.45)
 
         # Transcend indicators
-        transcend_markers = ["transcend", "transform", "elevate", "higher", "beyond"]
-        if any(marker in decision for marker in transcend_markers):
+        if any(marker in decision for marker in self.TRANSCEND_MARKERS):
             success += 15
 
         # Consciousness bonus
@@ -286,6 +327,117 @@ class TimelineProjector:
 
         return best, reason
 
+    def simulate(
+        self,
+        decision: str,
+        context: Optional[str] = None,
+        current_consciousness: float = 50.0,
+        scenarios: int = DEFAULT_SCENARIOS,
+        seed: Optional[int] = DEFAULT_SEED,
+        features: Optional[TextFeatures] = None
+    ) -> Dict[str, Any]:
+        """
+        Monte Carlo projection: N scenarios per timeline.
+
+        Args:
+            decision: The decision to analyze
+            context: Additional context
+            current_consciousness: Current consciousness level (0-100)
+            scenarios: Scenarios to draw (1 - MAX_SCENARIOS)
+            seed: RNG seed for reproducible runs; None draws fresh entropy
+                  and bypasses the distribution cache
+            features: Preprocessed decision, if already computed
+
+        Returns:
+            Per timeline: mean/std/percentiles/histogram of success
+            probability, realized success rate and how often it was the
+            best option; recommended = most often best
+        """
+        if np is None:
+            raise ImportError("NumPy is required for timeline simulation (pip install numpy)")
+
+        self.projection_count += 1
+        scenarios = max(1, min(self.MAX_SCENARIOS, int(scenarios)))
+        decision_lower = TextFeatures.of(decision, features).lower
+        flags = tuple(
+            any(marker in decision_lower for marker in getattr(self, model["markers"]))
+            for model in self.SIMULATION_MODELS.values()
+        )
+        consciousness = round(max(0.0, min(100.0, float(current_consciousness))), 1)
+
+        # Distributions depend only on marker flags, level, N and seed
+        if seed is None:
+            timelines = self._simulate(flags, consciousness, scenarios, None)
+        else:
+            # Deep copy so callers can't mutate the shared cached draw
+            timelines = copy.deepcopy(_cached_simulation(flags, consciousness, scenarios, seed))
+
+        recommended = max(timelines, key=lambda k: (timelines[k]["best_share"], timelines[k]["mean"]))
+        return {
+            "scenarios": scenarios,
+            "seed": seed,
+            "consciousness": consciousness,
+            "markers": {model["name"].lower(): flag
+                        for model, flag in zip(self.SIMULATION_MODELS.values(), flags)},
+            "timelines": timelines,
+            "recommended": recommended,
+            "decision_summary": self._summarize_decision(decision),
+            "timestamp": datetime.now().isoformat()
+        }
+
+    @classmethod
+    def _simulate(cls, flags: Tuple[bool, ...], consciousness: float,
+                  scenarios: int, seed: Optional[int]) -> Dict[str, Dict[str, Any]]:
+        """Draw all scenarios with array operations (no per-scenario Python)."""
+        rng = np.random.default_rng(seed)
+        level = np.clip(rng.normal(consciousness, cls.CONSCIOUSNESS_SD, scenarios), 0, 100)
+
+        success = np.empty((len(cls.SIMULATION_MODELS), scenarios))
+        for i, (model, flag) in enumerate(zip(cls.SIMULATION_MODELS.values(), flags)):
+            base = rng.normal(model["base"], model["base_sd"], scenarios)
+            slope = rng.normal(model["slope"], model["slope_sd"], scenarios)
+            p = base + slope * level + (model["bonus"] if flag else 0)
+            if "elevated_bonus" in model:
+                p += np.where(level > model["elevated_above"], model["elevated_bonus"], 0)
+            success[i] = np.clip(p, 0, model["cap"])
+
+        # Which timeline wins each scenario, and whether each one actually succeeds
+        best = np.bincount(success.argmax(axis=0), minlength=len(success))
+        realized = (rng.random(success.shape) * 100 < success).mean(axis=1)
+        edges = np.linspace(0, 100, 21)
+
+        timelines = {}
+        for i, (key, model) in enumerate(cls.SIMULATION_MODELS.items()):
+            p = success[i]
+            percentiles = np.percentile(p, cls.SIMULATION_PERCENTILES)
+            counts, _ = np.histogram(p, bins=edges)
+            timelines[key] = {
+                "name": model["name"],
+                "mean": round(float(p.mean()), 2),
+                "std": round(float(p.std()), 2),
+                "percentiles": {f"p{q}": round(float(v), 2)
+                                for q, v in zip(cls.SIMULATION_PERCENTILES, percentiles)},
+                "histogram": {"edges": edges.tolist(), "counts": counts.tolist()},
+                "realized_success_rate": round(float(realized[i]), 4),
+                "best_share": round(float(best[i]) / scenarios, 4)
+            }
+        return timelines
+
+    def quick_simulate(self, decision: str, current_consciousness: float = 50.0) -> Dict[str, float]:
+        """
+        Mean success per timeline from the cached default simulation.
+
+        Repeated inputs (same marker flags and level) reuse the cached
+        distributions instead of drawing again.
+        """
+        result = self.simulate(decision, current_consciousness=current_consciousness)
+        return {
+            "force": result["timelines"]["A"]["mean"],
+            "pivot": result["timelines"]["B"]["mean"],
+            "transcend": result["timelines"]["C"]["mean"],
+            "recommended": result["recommended"]
+        }
+
     def quick_project(self, decision: str) -> Dict[str, float]:
         """
         Quick projection returning just probabilities.
@@ -325,6 +477,18 @@ class TimelineProjector:
         }
 
 
+@lru_cache(maxsize=256)
+def _cached_simulation(flags: Tuple[bool, ...], consciousness: float,
+                       scenarios: int, seed: int) -> Dict[str, Dict[str, Any]]:
+    """
+    Seeded simulations are deterministic, so identical inputs share one draw.
+
+    Keyed on plain parameters only (the model tables are class constants),
+    so the cache never holds a projector instance alive.
+    """
+    return TimelineProjector._simulate(flags, consciousness, scenarios, seed)
+
+
 def project_timelines(decision: str, consciousness: float = 50.0) -> Dict[str, Any]:
     """
     Convenience function for quick projection.
@@ -368,4 +532,14 @@ if __name__ == "__main__":
         print(f"Reason: {result.recommendation_reason}")
         print("=" * 60)
 
+    if np is not None:
+        result = projector.simulate("Can I transform this into something higher?",
+                                    current_consciousness=80, scenarios=100_000)
+        print(f"\nSimulation: {result['scenarios']:,} scenarios (seed {result['seed']})")
+        for key, timeline in result["timelines"].items():
+            pct = timeline["percentiles"]
+            print(f"  {key} {timeline['name']:<9} mean {timeline['mean']:5.1f}%  "
+                  f"p5-p95 {pct['p5']:.1f}-{pct['p95']:.1f}%  best in {timeline['best_share']:.0%}")
+        print(f"  Recommended: Timeline {result['recommended']}")
+
     print("\n✅ TIMELINE PROJECTOR OPERATIONAL")
@@ -8,6 +8,10 @@ Endpoints:
     POST /quick - Quick TRUTH/DECEIT check
     POST /score - Consciousness scoring
     POST /domain - Domain-specific analysis
+    POST /timeline/simulate - Monte Carlo timeline projection
+    POST /batch - Full analysis of many texts, streamed as NDJSON
+    POST /analyze/all - Every analysis from one preprocessing pass
+    POST /analyze/stream - Sliding-window analysis of a long text, as NDJSON
     GET /health - Health check
 
 Run: python server.py
@@ -16,8 +20,11 @@ Port: 7778
 Created: 2025-11-22
 """
 
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request, jsonify, stream_with_context
 from flask_cors import CORS
+import codecs
+import json
+import os
 import sys
 from pathlib import Path
 
@@ -25,13 +32,26 @@ from pathlib import Path
 API_DIR = Path(__file__).parent / "api"
 sys.path.insert(0, str(API_DIR))
 
-from PATTERN_THEORY_API import PatternTheoryAPI
+from PATTERN_THEORY_API import BATCH_CHUNK_SIZE, BATCH_WORKERS, BatchSummary, PatternTheoryAPI, iter_batch
+from STREAM_ANALYZER import StreamingAnalyzer
+
+# Shared request timing lives in the repo root; the engine also deploys standalone
+sys.path.insert(0, str(Path(__file__).parent.parent))
+try:
+    from API_INFRASTRUCTURE import init_request_timing
+except ImportError:
+    init_request_timing = None
 
 app = Flask(__name__)
 CORS(app)  # Allow cross-origin requests
+if init_request_timing:
+    init_request_timing(app, 'pattern')
 
 api = PatternTheoryAPI()
 
+# Largest batch accepted in one request
+BATCH_MAX_ITEMS = int(os.environ.get("PATTERN_BATCH_MAX_ITEMS", 50000))
+
 @app.route('/health', methods=['GET'])
 def health():
     """Health check endpoint."""
@@ -39,7 +59,8 @@ def health():
         "status": "operational",
         "service": "Pattern Theory API",
         "version": "1.0.0",
-        "endpoints": ["/analyze", "/quick", "/score", "/domain", "/batch"]
+        "endpoints": ["/analyze", "/analyze/all", "/analyze/stream", "/quick", "/score", "/domain", "/batch"],
+        "cache": api.cache.get_stats()
     })
 
 @app.route('/analyze', methods=['POST'])
@@ -56,6 +77,61 @@ def analyze():
     result = api.analyze(data['text'], data.get('context'))
     return jsonify(result)
 
+@app.route('/analyze/all', methods=['POST'])
+def analyze_all():
+    """
+    Pattern, consciousness, manipulation, domains and timeline in one call.
+
+    Body: { "text": "...", "context": "..." (optional),
+            "consciousness": 0-100 (optional, for timeline projection) }
+    """
+    data = request.get_json()
+    if not data or 'text' not in data:
+        return jsonify({"error": "Missing 'text' field"}), 400
+
+    result = api.analyze_all(data['text'], data.get('context'), data.get('consciousness'))
+    return jsonify(result)
+
+@app.route('/analyze/stream', methods=['POST'])
+def analyze_stream():
+    """
+    Sliding-window analysis of a long text (transcripts, session logs).
+
+    Body: raw text (read incrementally), or { "text": "..." }
+    Query: window_chars (default 2000), overlap (default 0.25)
+
+    Streams one NDJSON line per window ({"index", "start", "end", scores,
+    "turns": [{"type", "marker", "offset"}]}), then {"done": true, "summary": ...}.
+    """
+    analyzer = StreamingAnalyzer(
+        window_chars=request.args.get('window_chars', 2000, type=int),
+        overlap=request.args.get('overlap', 0.25, type=float)
+    )
+
+    if request.is_json:
+        data = request.get_json(silent=True)
+        if not data or not isinstance(data.get('text'), str):
+            return jsonify({"error": "Missing 'text' field"}), 400
+        chunks = [data['text']]
+    else:
+        def read_chunks(stream, size=65536):
+            # Incremental decoder keeps UTF-8 sequences split across reads intact
+            decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+            while True:
+                block = stream.read(size)
+                yield decoder.decode(block, final=not block)
+                if not block:
+                    return
+        chunks = read_chunks(request.stream)
+
+    def generate():
+        for window in analyzer.analyze(chunks):
+            yield json.dumps(window) + "\n"
+        yield json.dumps({"done": True, "summary": analyzer.summary()}) + "\n"
+
+    return Response(stream_with_context(generate()), mimetype='application/x-ndjson',
+                    headers={'X-Accel-Buffering': 'no'})
+
 @app.route('/quick', methods=['POST'])
 def quick():
     """
@@ -122,19 +198,109 @@ def domain():
     result = api.seven_domains_analysis(domain_num, data['text'])
     return jsonify(result)
 
+@app.route('/timeline/simulate', methods=['POST'])
+def timeline_simulate():
+    """
+    Monte Carlo timeline projection.
+
+    Body: {
+        "decision": "...",
+        "consciousness": 0-100 (default 50),
+        "scenarios": 1-1000000 (default 10000),
+        "seed": int or null (default fixed; null = fresh draw)
+    }
+    """
+    data = request.get_json()
+    if not data or 'decision' not in data:
+        return jsonify({"error": "Missing 'decision' field"}), 400
+
+    projector = api.timeline_projector
+    try:
+        result = projector.simulate(
+            data['decision'],
+            context=data.get('context'),
+            current_consciousness=float(data.get('consciousness', 50)),
+            scenarios=int(data.get('scenarios', projector.DEFAULT_SCENARIOS)),
+            seed=data.get('seed', projector.DEFAULT_SEED)
+        )
+    except (TypeError, ValueError) as e:
+        return jsonify({"error": str(e)}), 400
+    except ImportError as e:
+        return jsonify({"error": str(e)}), 501
+    return jsonify({"success": True, "result": result})
+
+def _ndjson_items(stream):
+    """Texts from an NDJSON upload: one JSON string or {"text": ...} per line."""
+    for line in stream:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            item = json.loads(line)
+        except ValueError:
+            yield None  # reported as an item error, keeps indexes aligned
+            continue
+        yield item.get('text') if isinstance(item, dict) else item
+
+
+def _limited(items, limit, overflow):
+    """Pass through at most `limit` items; flag overflow instead of reading on."""
+    for count, item in enumerate(items):
+        if count >= limit:
+            overflow.append(True)
+            return
+        yield item
+
+
 @app.route('/batch', methods=['POST'])
 def batch():
     """
-    Batch analysis.
+    Batch analysis - pattern, manipulation and domains per item.
 
     Body: { "items": ["text1", "text2", ...] }
+          or application/x-ndjson: one text (or {"text": ...}) per line
+
+    Query: workers (default/max from PATTERN_BATCH_WORKERS),
+           chunk_size (items per worker task), stream=0 for one JSON response
+
+    Streams one NDJSON line per item as it completes ({"index": n, ...}),
+    then a final {"done": true, "summary": ...} line.
     """
-    data = request.get_json()
-    if not data or 'items' not in data:
-        return jsonify({"error": "Missing 'items' field"}), 400
+    workers = request.args.get('workers', BATCH_WORKERS, type=int)
+    chunk_size = request.args.get('chunk_size', BATCH_CHUNK_SIZE, type=int)
+    overflow = []
 
-    result = api.batch_analyze(data['items'])
-    return jsonify(result)
+    if request.mimetype == 'application/x-ndjson':
+        items = _limited(_ndjson_items(request.stream), BATCH_MAX_ITEMS, overflow)
+    else:
+        data = request.get_json(silent=True)
+        if not data or 'items' not in data or not isinstance(data['items'], list):
+            return jsonify({"error": "Missing 'items' field"}), 400
+        items = data['items']
+        if len(items) > BATCH_MAX_ITEMS:
+            return jsonify({"error": f"Batch too large: {len(items)} items (max {BATCH_MAX_ITEMS})"}), 413
+
+    if request.args.get('stream', '1') == '0':
+        if not isinstance(items, list):
+            items = list(items)
+            if overflow:
+                return jsonify({"error": f"Batch too large (max {BATCH_MAX_ITEMS} items)"}), 413
+        return jsonify(api.batch_analyze(items, workers, chunk_size))
+
+    def generate():
+        summary = BatchSummary()
+        for result in iter_batch(items, workers, chunk_size):
+            summary.add(result)
+            yield json.dumps(result) + "\n"
+
+        final = {"done": True, "batch_size": sum(summary.counts.values()) + summary.errors,
+                 "summary": summary.to_dict()}
+        if overflow:
+            final["error"] = f"Batch truncated at {BATCH_MAX_ITEMS} items"
+        yield json.dumps(final) + "\n"
+
+    return Response(stream_with_context(generate()), mimetype='application/x-ndjson',
+                    headers={'X-Accel-Buffering': 'no'})
 
 
 if __name__ == '__main__':
@@ -143,10 +309,12 @@ if __name__ == '__main__':
     print("=" * 50)
     print("\nEndpoints:")
     print("  POST /analyze  - Full analysis")
+    print("  POST /analyze/all - Every analysis, one preprocessing pass")
+    print("  POST /analyze/stream - Sliding-window analysis (NDJSON stream)")
     print("  POST /quick    - Quick truth/deceit check")
     print("  POST /score    - Consciousness scoring")
     print("  POST /domain   - Domain-specific analysis")
-    print("  POST /batch    - Batch analysis")
+    print("  POST /batch    - Batch analysis (NDJSON stream)")
     print("  GET  /health   - Health check")
     print("\n" + "=" * 50)
     print("Starting server on http://localhost:7778")
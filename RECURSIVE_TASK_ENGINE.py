@@ -3,16 +3,28 @@
 RECURSIVE TASK ENGINE
 Tasks that spawn subtasks autonomously.
 Self-expanding automation for foundational system issues.
+
+Sibling subtasks run concurrently: the whole tree is decomposed up front
+and every leaf is submitted to one bounded executor, so MAX_CONCURRENT
+caps brain pipelines across all depths. Composite tasks never hold a
+worker; they complete when their last child does. Decompositions are
+memoized, Cyclotron atoms are committed in one batch per run, and
+progress events can be streamed to a callback.
 """
 
+import itertools
 import json
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import Callable, List, Dict, Optional, Tuple
 import re
 
 from AUTONOMOUS_TASK_RUNNER import AutonomousRunner
-from CYCLOTRON_BRAIN_BRIDGE import CyclotronBridge
 
 # Paths
 HOME = Path.home()
@@ -20,12 +32,19 @@ CONSCIOUSNESS = HOME / ".consciousness"
 RECURSIVE_PATH = CONSCIOUSNESS / "recursive_tasks"
 RECURSIVE_PATH.mkdir(parents=True, exist_ok=True)
 
+# Configuration (environment overridable)
+MAX_CONCURRENT = int(os.environ.get("RECURSIVE_MAX_CONCURRENT", 4))  # leaf pipelines at once, all depths
+DECOMPOSE_CACHE_SIZE = int(os.environ.get("RECURSIVE_DECOMPOSE_CACHE", 1024))
+
+_task_counter = itertools.count(1)
+
 
 class RecursiveTask:
     """A task that can spawn subtasks."""
 
     def __init__(self, description: str, priority: str = "normal", parent_id: str = None):
-        self.id = datetime.now().strftime("%Y%m%d_%H%M%S_%f")[:20]
+        # Timestamp plus a counter: siblings are created within the same microsecond
+        self.id = f"{datetime.now().strftime('%Y%m%d_%H%M%S_%f')[:20]}_{next(_task_counter)}"
         self.description = description
         self.priority = priority  # urgent, high, normal, low
         self.parent_id = parent_id
@@ -51,16 +70,95 @@ class RecursiveTask:
         }
 
 
+def normalize_description(description: str) -> str:
+    """Memo key for decomposition: surrounding and repeated whitespace removed.
+    Case is kept - the integrate pattern reads capitalized component names."""
+    return " ".join(description.split())
+
+
+@lru_cache(maxsize=DECOMPOSE_CACHE_SIZE)
+def decompose_description(description: str) -> Tuple[str, ...]:
+    """Pattern-based decomposition of a (normalized) description."""
+    lowered = description.lower()
+    subtasks = []
+
+    if "build" in lowered or "create" in lowered:
+        subtasks = [
+            f"Research requirements for: {description}",
+            f"Design architecture for: {description}",
+            f"Implement core functionality for: {description}",
+            f"Test and validate: {description}",
+            f"Document and deploy: {description}"
+        ]
+
+    elif "fix" in lowered or "resolve" in lowered:
+        subtasks = [
+            f"Diagnose root cause of: {description}",
+            f"Develop fix for: {description}",
+            f"Test fix for: {description}",
+            f"Verify no regression from: {description}"
+        ]
+
+    elif "integrate" in lowered:
+        # Extract components
+        components = re.findall(r'\b[A-Z][a-z]+\b', description)
+        if len(components) >= 2:
+            subtasks = [
+                f"Analyze {components[0]} interface",
+                f"Analyze {components[1]} interface",
+                f"Design integration layer between {components[0]} and {components[1]}",
+                f"Implement integration connectors",
+                f"Test integration end-to-end"
+            ]
+
+    elif "automate" in lowered:
+        subtasks = [
+            f"Identify manual steps in: {description}",
+            f"Design automation workflow for: {description}",
+            f"Build automation scripts for: {description}",
+            f"Schedule and monitor automation"
+        ]
+
+    elif "optimize" in lowered or "improve" in lowered:
+        subtasks = [
+            f"Measure current performance of: {description}",
+            f"Identify bottlenecks in: {description}",
+            f"Implement optimizations for: {description}",
+            f"Validate improvement in: {description}"
+        ]
+
+    return tuple(subtasks)
+
+
 class RecursiveTaskEngine:
-    """Engine for recursive task execution."""
+    """
+    Engine for recursive task execution.
+
+    progress: optional callback receiving event dicts ("run_started",
+    "decomposed", "started", "completed", "run_completed") with task id,
+    depth, leaf counters and elapsed time. Events are delivered one at a
+    time (serialized), possibly from worker threads.
+    """
 
-    def __init__(self, max_depth: int = 3):
+    def __init__(self, max_depth: int = 3, max_concurrent: int = MAX_CONCURRENT,
+                 progress: Optional[Callable[[dict], None]] = None):
         self.max_depth = max_depth
-        self.runner = AutonomousRunner()
-        self.cyclotron = CyclotronBridge()
+        self.max_concurrent = max(1, max_concurrent)
+        self.progress = progress
+        self.runner = AutonomousRunner(workers=self.max_concurrent)
+        # Share the runner's bridge so both write the same in-memory index
+        self.cyclotron = self.runner.cyclotron
         self.task_tree = {}
         self.execution_log = []
 
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._emit_lock = threading.Lock()
+        self._pending_atoms: List[dict] = []
+        self._pending_outputs: List[dict] = []
+        self._counters = {"leaves": 0, "leaves_done": 0, "tasks_done": 0}
+        self._run_started = 0.0
+
     def create_task(self, description: str, priority: str = "normal",
                    parent_id: str = None) -> RecursiveTask:
         """Create a new task."""
@@ -77,118 +175,163 @@ class RecursiveTaskEngine:
     def decompose_task(self, task: RecursiveTask) -> List[str]:
         """
         Decompose a complex task into subtasks.
-        Returns list of subtask descriptions.
+        Returns list of subtask descriptions (memoized by normalized description).
         """
         if task.depth >= self.max_depth:
             return []
+        return list(decompose_description(normalize_description(task.description)))
 
-        description = task.description.lower()
-        subtasks = []
+    # === PROGRESS ===
 
-        # Pattern-based decomposition
-        if "build" in description or "create" in description:
-            subtasks = [
-                f"Research requirements for: {task.description}",
-                f"Design architecture for: {task.description}",
-                f"Implement core functionality for: {task.description}",
-                f"Test and validate: {task.description}",
-                f"Document and deploy: {task.description}"
-            ]
+    def _emit(self, event: str, task: Optional[RecursiveTask] = None, **fields):
+        entry = {
+            "event": event,
+            "elapsed_ms": round((time.perf_counter() - self._run_started) * 1000, 1),
+            **self._counters
+        }
+        if task is not None:
+            entry.update({
+                "task_id": task.id,
+                "depth": task.depth,
+                "description": task.description[:100],
+                "status": task.status
+            })
+        entry.update(fields)
+        self.execution_log.append(entry)
 
-        elif "fix" in description or "resolve" in description:
-            subtasks = [
-                f"Diagnose root cause of: {task.description}",
-                f"Develop fix for: {task.description}",
-                f"Test fix for: {task.description}",
-                f"Verify no regression from: {task.description}"
-            ]
+        if self.progress:
+            with self._emit_lock:
+                try:
+                    self.progress(entry)
+                except Exception as e:
+                    print(f"Progress callback error: {e}")
 
-        elif "integrate" in description:
-            # Extract components
-            components = re.findall(r'\b[A-Z][a-z]+\b', task.description)
-            if len(components) >= 2:
-                subtasks = [
-                    f"Analyze {components[0]} interface",
-                    f"Analyze {components[1]} interface",
-                    f"Design integration layer between {components[0]} and {components[1]}",
-                    f"Implement integration connectors",
-                    f"Test integration end-to-end"
-                ]
-
-        elif "automate" in description:
-            subtasks = [
-                f"Identify manual steps in: {task.description}",
-                f"Design automation workflow for: {task.description}",
-                f"Build automation scripts for: {task.description}",
-                f"Schedule and monitor automation"
-            ]
+    # === EXECUTION ===
 
-        elif "optimize" in description or "improve" in description:
-            subtasks = [
-                f"Measure current performance of: {task.description}",
-                f"Identify bottlenecks in: {task.description}",
-                f"Implement optimizations for: {task.description}",
-                f"Validate improvement in: {task.description}"
-            ]
+    def _run_leaf(self, task: RecursiveTask) -> dict:
+        """Run one leaf through the brain pipeline (in a worker thread)."""
+        task.status = "in_progress"
+        self._emit("started", task)
+        try:
+            # Leaf outputs are stored with the task atoms in _flush_atoms
+            result = self.runner.run_task(task.description, mode="quick", store=False)
+            with self._lock:
+                self._pending_outputs.append({
+                    "task": task.description,
+                    "outputs": result["outputs"],
+                    "decisions": result["decisions"],
+                    "memory": result["memory"]
+                })
+            return {
+                "type": "leaf",
+                "status": result["status"],
+                "outputs": len(result.get("outputs", [])),
+                "decisions": len(result.get("decisions", []))
+            }
+        except Exception as e:
+            return {
+                "type": "leaf",
+                "status": "failed",
+                "error": str(e)
+            }
 
-        return subtasks
+    def _finish(self, task: RecursiveTask, result: dict, future: Future):
+        """Record a finished task, buffer its atom, resolve its future."""
+        task.result = result
+        task.status = "completed" if result.get("status") != "failed" else "failed"
+        task.completed = datetime.now().isoformat()
 
-    def execute_task(self, task: RecursiveTask) -> dict:
-        """Execute a task recursively."""
-        print(f"\n{'  ' * task.depth}[Depth {task.depth}] Executing: {task.description[:50]}...")
+        with self._lock:
+            self._counters["tasks_done"] += 1
+            if result.get("type") == "leaf":
+                self._counters["leaves_done"] += 1
+            # Committed to Cyclotron in one batch at the end of the run
+            self._pending_atoms.append({
+                "content": f"Task {task.status}: {task.description[:100]} (depth {task.depth})",
+                "tags": ["task", f"depth_{task.depth}", task.status]
+            })
 
-        task.status = "in_progress"
+        self._emit("completed", task)
+        future.set_result(result)
 
-        # Check if task needs decomposition
+    def _submit(self, task: RecursiveTask) -> Future:
+        """
+        Schedule a task and return a future for its result. Leaves go to the
+        executor; composites decompose, submit their children, and finish
+        from the callback of their last child.
+        """
+        print(f"\n{'  ' * task.depth}[Depth {task.depth}] Executing: {task.description[:50]}...")
+        future = Future()
         subtask_descriptions = self.decompose_task(task)
 
-        if subtask_descriptions:
-            print(f"{'  ' * task.depth}  Decomposed into {len(subtask_descriptions)} subtasks")
-
-            # Create and execute subtasks
-            subtask_results = []
-            for desc in subtask_descriptions:
-                subtask = self.create_task(desc, task.priority, task.id)
-                result = self.execute_task(subtask)
-                subtask_results.append(result)
-
-            # Aggregate results
-            task.result = {
-                "type": "composite",
-                "subtasks": len(subtask_results),
-                "successful": sum(1 for r in subtask_results if r.get("status") == "complete"),
-                "summary": f"Completed {len(subtask_results)} subtasks"
-            }
+        if not subtask_descriptions:
+            with self._lock:
+                self._counters["leaves"] += 1
+            leaf = self._executor.submit(self._run_leaf, task)
+            leaf.add_done_callback(lambda f: self._finish(
+                task, f.result() if not f.exception() else
+                {"type": "leaf", "status": "failed", "error": str(f.exception())}, future))
+            return future
 
-        else:
-            # Leaf task - execute directly
-            try:
-                result = self.runner.run_task(task.description, mode="quick")
-                task.result = {
-                    "type": "leaf",
-                    "status": result["status"],
-                    "outputs": len(result.get("outputs", [])),
-                    "decisions": len(result.get("decisions", []))
-                }
-            except Exception as e:
-                task.result = {
-                    "type": "leaf",
-                    "status": "failed",
-                    "error": str(e)
-                }
-
-        task.status = "completed" if task.result.get("status") != "failed" else "failed"
-        task.completed = datetime.now().isoformat()
-
-        # Store in Cyclotron
-        self.cyclotron.create_atom(
-            f"Task {task.status}: {task.description[:100]} (depth {task.depth})",
-            atom_type="action",
-            source="recursive_engine",
-            tags=["task", f"depth_{task.depth}", task.status]
-        )
+        task.status = "in_progress"
+        print(f"{'  ' * task.depth}  Decomposed into {len(subtask_descriptions)} subtasks")
+        self._emit("decomposed", task, subtasks=len(subtask_descriptions))
+
+        children = [self.create_task(desc, task.priority, task.id) for desc in subtask_descriptions]
+        results: List[Optional[dict]] = [None] * len(children)
+        remaining = [len(children)]
+
+        def child_done(index: int, child_future: Future):
+            results[index] = child_future.result()
+            with self._lock:
+                remaining[0] -= 1
+                last = remaining[0] == 0
+            if last:
+                # Aggregate results
+                self._finish(task, {
+                    "type": "composite",
+                    "subtasks": len(results),
+                    "successful": sum(1 for r in results if r.get("status") == "complete"),
+                    "summary": f"Completed {len(results)} subtasks"
+                }, future)
+
+        for index, child in enumerate(children):
+            self._submit(child).add_done_callback(lambda f, i=index: child_done(i, f))
+        return future
 
-        return task.result
+    def execute_task(self, task: RecursiveTask) -> dict:
+        """Execute a task recursively; sibling subtasks run concurrently."""
+        owns_executor = self._executor is None
+        if owns_executor:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_concurrent,
+                                                thread_name_prefix="recursive")
+        try:
+            return self._submit(task).result()
+        finally:
+            if owns_executor:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+                self._flush_atoms()
+
+    def _flush_atoms(self) -> int:
+        """Write buffered leaf outputs and task atoms with a single Cyclotron index commit."""
+        with self._lock:
+            pending, self._pending_atoms = self._pending_atoms, []
+            outputs, self._pending_outputs = self._pending_outputs, []
+        if not pending and not outputs:
+            return 0
+        with self.cyclotron.batch():
+            for output in outputs:
+                self.cyclotron.store_agent_output(agent_name="autonomous_runner", **output)
+            for atom in pending:
+                self.cyclotron.create_atom(
+                    atom["content"],
+                    atom_type="action",
+                    source="recursive_engine",
+                    tags=atom["tags"]
+                )
+        print(f"Committed {len(pending)} task atoms to Cyclotron")
+        return len(pending)
 
     def run(self, description: str, priority: str = "normal") -> dict:
         """Run a recursive task."""
@@ -197,16 +340,22 @@ class RecursiveTaskEngine:
         print("=" * 60)
         print(f"Task: {description}")
         print(f"Max depth: {self.max_depth}")
+        print(f"Max concurrent: {self.max_concurrent}")
         print()
 
+        self._counters = {"leaves": 0, "leaves_done": 0, "tasks_done": 0}
+        self._run_started = time.perf_counter()
+
         # Create root task
         root = self.create_task(description, priority)
+        self._emit("run_started", root)
 
         # Execute recursively
         result = self.execute_task(root)
 
         # Generate report
         report = self._generate_report(root)
+        self._emit("run_completed", root, total_tasks=report["total_tasks"])
 
         # Save execution
         self._save_execution(root)
@@ -239,6 +388,9 @@ class RecursiveTaskEngine:
             "total_tasks": total_tasks,
             "depth_distribution": depth_counts,
             "max_depth_reached": max(depth_counts.keys()) if depth_counts else 0,
+            "duration_s": round(time.perf_counter() - self._run_started, 2),
+            "max_concurrent": self.max_concurrent,
+            "decompose_cache": decompose_description.cache_info()._asdict(),
             "result": root.result
         }
 
@@ -249,6 +401,7 @@ class RecursiveTaskEngine:
         print(f"Total tasks: {report['total_tasks']}")
         print(f"Max depth: {report['max_depth_reached']}")
         print(f"Depth distribution: {report['depth_distribution']}")
+        print(f"Duration: {report['duration_s']}s ({report['max_concurrent']} concurrent)")
 
         return report
 
@@ -314,7 +467,8 @@ class FoundationalIssueResolver:
 
     def __init__(self):
         self.engine = RecursiveTaskEngine(max_depth=3)
-        self.cyclotron = CyclotronBridge()
+        # Same bridge as the engine, so resolved-issue atoms don't clobber its run
+        self.cyclotron = self.engine.cyclotron
         self.resolved = []
 
     def scan_issues(self) -> List[dict]:
@@ -415,7 +569,12 @@ def demo():
     print("RECURSIVE TASK ENGINE DEMO")
     print("=" * 60)
 
-    engine = RecursiveTaskEngine(max_depth=2)
+    def show_progress(event):
+        if event["event"] == "completed" and event["depth"] <= 1:
+            print(f"  >> {event['leaves_done']}/{event['leaves']} leaves done "
+                  f"({event['elapsed_ms']:.0f}ms): {event['description'][:50]}")
+
+    engine = RecursiveTaskEngine(max_depth=2, progress=show_progress)
 
     # Test recursive decomposition
     engine.run("Build automated backup system with rotation and cloud sync")
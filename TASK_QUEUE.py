@@ -0,0 +1,411 @@
+#!/usr/bin/env python3
+"""
+TASK QUEUE - Durable SQLite Priority Queue with Leases
+Backs AutonomousRunner's queue so several runners (threads or processes
+on one box) can drain it together.
+
+- priority order: urgent, high, normal, low; FIFO within a priority
+- lease(): claims the next ready task inside BEGIN IMMEDIATE, so two
+  consumers never get the same task; the lease is the visibility timeout
+- complete()/fail() only succeed for the current lease holder
+- expired leases (crashed or stuck worker) go back to pending; failures
+  retry with exponential backoff until max_attempts
+- QueueWorkerPool: N threads leasing and running tasks, with a heartbeat
+  extending the leases of tasks still running
+- get_stats(): depth per status, queue latency and run time percentiles,
+  throughput
+
+Created: 2025-11-22
+"""
+
+import json
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+HOME = Path.home()
+CONSCIOUSNESS = HOME / ".consciousness"
+
+# Configuration (environment overridable)
+QUEUE_DB = Path(os.environ.get("TASK_QUEUE_DB", CONSCIOUSNESS / "task_queue.db"))
+VISIBILITY_TIMEOUT = float(os.environ.get("TASK_QUEUE_VISIBILITY", 300))  # seconds a lease lasts
+MAX_ATTEMPTS = int(os.environ.get("TASK_QUEUE_MAX_ATTEMPTS", 3))
+RETRY_BACKOFF = float(os.environ.get("TASK_QUEUE_BACKOFF", 5))  # seconds, doubled per attempt
+
+PRIORITIES = {"urgent": 0, "high": 1, "normal": 2, "low": 3}
+PRIORITY_NAMES = {v: k for k, v in PRIORITIES.items()}
+
+TASK_COLUMNS = ("id", "task", "mode", "priority", "status", "attempts", "max_attempts",
+                "lease_owner", "enqueued_at", "started_at", "finished_at", "error", "result",
+                "source_key")
+
+
+def _percentile(sorted_values: List[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, int(round(pct / 100 * len(sorted_values) + 0.5)) - 1))
+    return sorted_values[rank]
+
+
+class TaskQueue:
+    """Priority task queue in one SQLite file (WAL), safe across processes."""
+
+    def __init__(self, db_path: Path = QUEUE_DB, visibility_timeout: float = VISIBILITY_TIMEOUT,
+                 max_attempts: int = MAX_ATTEMPTS, retry_backoff: float = RETRY_BACKOFF):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.visibility_timeout = visibility_timeout
+        self.max_attempts = max_attempts
+        self.retry_backoff = retry_backoff
+        self._local = threading.local()
+        self._init_schema()
+
+    def _conn(self) -> sqlite3.Connection:
+        """One connection per thread (autocommit; transactions are explicit)."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(str(self.db_path), timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.execute("PRAGMA synchronous = NORMAL")
+            conn.execute("PRAGMA busy_timeout = 30000")
+            self._local.conn = conn
+        return conn
+
+    def _init_schema(self):
+        conn = self._conn()
+        conn.executescript('''
+            CREATE TABLE IF NOT EXISTS tasks (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                task TEXT NOT NULL,
+                mode TEXT NOT NULL DEFAULT 'advanced',
+                priority INTEGER NOT NULL DEFAULT 2,
+                status TEXT NOT NULL DEFAULT 'pending',   -- pending, leased, completed, failed
+                attempts INTEGER NOT NULL DEFAULT 0,
+                max_attempts INTEGER NOT NULL DEFAULT 3,
+                available_at REAL NOT NULL,               -- pending: ready time; leased: lease expiry
+                lease_owner TEXT,
+                enqueued_at REAL NOT NULL,
+                started_at REAL,                          -- first lease (queue latency)
+                finished_at REAL,
+                error TEXT,
+                result TEXT,
+                source_key TEXT                           -- external id (e.g. imported file), unique
+            );
+            CREATE INDEX IF NOT EXISTS idx_tasks_ready
+                ON tasks(status, priority, available_at, id);
+            CREATE INDEX IF NOT EXISTS idx_tasks_finished
+                ON tasks(finished_at) WHERE finished_at IS NOT NULL;
+        ''')
+        # Queues created before source_key existed
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(tasks)")}
+        if "source_key" not in columns:
+            try:
+                conn.execute("ALTER TABLE tasks ADD COLUMN source_key TEXT")
+            except sqlite3.OperationalError as e:
+                if "duplicate column" not in str(e):  # another process migrated first
+                    raise
+        conn.execute("CREATE UNIQUE INDEX IF NOT EXISTS idx_tasks_source_key "
+                     "ON tasks(source_key) WHERE source_key IS NOT NULL")
+
+    def _write(self, fn: Callable[[sqlite3.Connection], Any]) -> Any:
+        """Run fn inside BEGIN IMMEDIATE (takes the write lock up front)."""
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            result = fn(conn)
+            conn.execute("COMMIT")
+            return result
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+    # === PRODUCER ===
+
+    def enqueue(self, task: str, priority: str = "normal", mode: str = "advanced",
+                delay: float = 0.0, max_attempts: Optional[int] = None,
+                source_key: Optional[str] = None) -> int:
+        """
+        Add a task; returns its id.
+
+        With a source_key the insert is idempotent: if a task with that key
+        already exists (e.g. another runner imported the same file), nothing
+        is added and the existing task's id is returned.
+        """
+        now = time.time()
+
+        def insert(conn):
+            cursor = conn.execute(
+                "INSERT OR IGNORE INTO tasks (task, mode, priority, max_attempts, available_at, "
+                "enqueued_at, source_key) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (task, mode, PRIORITIES.get(priority, 2), max_attempts or self.max_attempts,
+                 now + delay, now, source_key))
+            if cursor.rowcount:
+                return cursor.lastrowid
+            return conn.execute("SELECT id FROM tasks WHERE source_key = ?", (source_key,)).fetchone()[0]
+
+        return self._write(insert)
+
+    # === CONSUMER ===
+
+    @staticmethod
+    def new_owner() -> str:
+        """Lease owner id: host, process and a random suffix."""
+        return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+    def _reclaim(self, conn: sqlite3.Connection, now: float) -> int:
+        """Expired leases back to pending (or failed when out of attempts)."""
+        conn.execute(
+            "UPDATE tasks SET status = 'failed', finished_at = ?, lease_owner = NULL, "
+            "error = COALESCE(error, 'lease expired') "
+            "WHERE status = 'leased' AND available_at <= ? AND attempts >= max_attempts",
+            (now, now))
+        return conn.execute(
+            "UPDATE tasks SET status = 'pending', lease_owner = NULL "
+            "WHERE status = 'leased' AND available_at <= ?", (now,)).rowcount
+
+    def lease(self, owner: str, visibility_timeout: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """Claim the highest-priority ready task, or None if nothing is ready."""
+        timeout = visibility_timeout or self.visibility_timeout
+
+        def claim(conn):
+            now = time.time()
+            self._reclaim(conn, now)
+            row = conn.execute(
+                "SELECT id FROM tasks WHERE status = 'pending' AND available_at <= ? "
+                "ORDER BY priority, id LIMIT 1", (now,)).fetchone()
+            if row is None:
+                return None
+            conn.execute(
+                "UPDATE tasks SET status = 'leased', lease_owner = ?, available_at = ?, "
+                "attempts = attempts + 1, started_at = COALESCE(started_at, ?) WHERE id = ?",
+                (owner, now + timeout, now, row[0]))
+            return self._get(conn, row[0])
+
+        return self._write(claim)
+
+    def extend(self, task_id: int, owner: str, visibility_timeout: Optional[float] = None) -> bool:
+        """Push the lease expiry out; False if the lease was lost."""
+        expiry = time.time() + (visibility_timeout or self.visibility_timeout)
+        return self._write(lambda conn: conn.execute(
+            "UPDATE tasks SET available_at = ? WHERE id = ? AND lease_owner = ? AND status = 'leased'",
+            (expiry, task_id, owner)).rowcount == 1)
+
+    def complete(self, task_id: int, owner: str, result: Optional[str] = None) -> bool:
+        """Mark done; False if the lease expired and someone else owns the task now."""
+        return self._write(lambda conn: conn.execute(
+            "UPDATE tasks SET status = 'completed', finished_at = ?, result = ?, lease_owner = NULL, "
+            "error = NULL WHERE id = ? AND lease_owner = ? AND status = 'leased'",
+            (time.time(), result, task_id, owner)).rowcount == 1)
+
+    def fail(self, task_id: int, owner: str, error: str) -> Optional[str]:
+        """Record a failure: retry later ('pending') or give up ('failed'). None if lease lost."""
+        def record(conn):
+            row = conn.execute(
+                "SELECT attempts, max_attempts FROM tasks WHERE id = ? AND lease_owner = ? AND status = 'leased'",
+                (task_id, owner)).fetchone()
+            if row is None:
+                return None
+            attempts, max_attempts = row
+            now = time.time()
+            if attempts >= max_attempts:
+                conn.execute(
+                    "UPDATE tasks SET status = 'failed', finished_at = ?, error = ?, lease_owner = NULL "
+                    "WHERE id = ?", (now, error, task_id))
+                return "failed"
+            conn.execute(
+                "UPDATE tasks SET status = 'pending', available_at = ?, error = ?, lease_owner = NULL "
+                "WHERE id = ?", (now + self.retry_backoff * 2 ** (attempts - 1), error, task_id))
+            return "pending"
+
+        return self._write(record)
+
+    # === INSPECTION ===
+
+    @staticmethod
+    def _get(conn: sqlite3.Connection, task_id: int) -> Optional[Dict[str, Any]]:
+        row = conn.execute(f"SELECT {', '.join(TASK_COLUMNS)} FROM tasks WHERE id = ?", (task_id,)).fetchone()
+        if row is None:
+            return None
+        task = dict(zip(TASK_COLUMNS, row))
+        task["priority"] = PRIORITY_NAMES.get(task["priority"], "normal")
+        return task
+
+    def get(self, task_id: int) -> Optional[Dict[str, Any]]:
+        return self._get(self._conn(), task_id)
+
+    def pending_count(self) -> int:
+        return self._conn().execute(
+            "SELECT COUNT(*) FROM tasks WHERE status IN ('pending', 'leased')").fetchone()[0]
+
+    def get_stats(self, window: float = 3600) -> Dict[str, Any]:
+        """Depth per status, latency percentiles and throughput over the last `window` seconds."""
+        conn = self._conn()
+        now = time.time()
+        counts = dict(conn.execute("SELECT status, COUNT(*) FROM tasks GROUP BY status").fetchall())
+        oldest = conn.execute(
+            "SELECT MIN(enqueued_at) FROM tasks WHERE status = 'pending'").fetchone()[0]
+        rows = conn.execute(
+            "SELECT enqueued_at, started_at, finished_at, status FROM tasks "
+            "WHERE finished_at IS NOT NULL AND finished_at >= ?", (now - window,)).fetchall()
+
+        wait_ms = sorted((started - enqueued) * 1000 for enqueued, started, _, _ in rows if started)
+        run_ms = sorted((finished - started) * 1000 for _, started, finished, _ in rows if started)
+        completed = sum(1 for row in rows if row[3] == "completed")
+        # Busy span: first start to last finish, so a short burst isn't diluted by the window
+        starts = [started for _, started, _, _ in rows if started]
+        busy = (max(row[2] for row in rows) - min(starts)) if starts else 0.0
+
+        def summary(values):
+            return {
+                "p50_ms": round(_percentile(values, 50), 1),
+                "p95_ms": round(_percentile(values, 95), 1),
+                "max_ms": round(values[-1], 1) if values else 0.0
+            }
+
+        return {
+            "depth": {status: counts.get(status, 0) for status in ("pending", "leased", "completed", "failed")},
+            "oldest_pending_s": round(now - oldest, 1) if oldest else 0.0,
+            "window_s": window,
+            "finished_in_window": len(rows),
+            "completed_in_window": completed,
+            "throughput_per_min": round(completed / (window / 60), 2),
+            "busy_throughput_per_min": round(completed / (busy / 60), 2) if busy > 0 else 0.0,
+            "queue_latency": summary(wait_ms),
+            "run_time": summary(run_ms)
+        }
+
+    def purge(self, older_than: float = 7 * 86400) -> int:
+        """Delete finished tasks older than `older_than` seconds."""
+        cutoff = time.time() - older_than
+        return self._write(lambda conn: conn.execute(
+            "DELETE FROM tasks WHERE status IN ('completed', 'failed') AND finished_at < ?",
+            (cutoff,)).rowcount)
+
+
+class QueueWorkerPool:
+    """
+    `workers` threads leasing tasks from a TaskQueue and passing each to
+    handler(task) -> result string. Exceptions become retries. A heartbeat
+    thread extends the leases of running tasks every visibility/3 seconds,
+    so only a dead or hung runner lets a lease expire.
+    """
+
+    def __init__(self, queue: TaskQueue, handler: Callable[[Dict[str, Any]], Optional[str]],
+                 workers: int = 4, poll_interval: float = 1.0):
+        self.queue = queue
+        self.handler = handler
+        self.workers = max(1, workers)
+        self.poll_interval = poll_interval
+        self.owner = TaskQueue.new_owner()
+        self.active: Dict[int, str] = {}  # task id -> lease owner
+        self.lock = threading.Lock()
+        self.stopping = threading.Event()
+        self.results: List[Dict[str, Any]] = []
+
+    def _worker(self, index: int, drain: bool):
+        owner = f"{self.owner}:{index}"
+        while not self.stopping.is_set():
+            task = self.queue.lease(owner)
+            if task is None:
+                if drain:
+                    return
+                self.stopping.wait(self.poll_interval)
+                continue
+
+            with self.lock:
+                self.active[task["id"]] = owner
+            try:
+                result = self.handler(task)
+                outcome = "completed" if self.queue.complete(task["id"], owner, result) else "lease_lost"
+                error = None
+            except Exception as e:
+                error = f"{type(e).__name__}: {e}"
+                state = self.queue.fail(task["id"], owner, error)
+                outcome = {"pending": "retrying", "failed": "failed"}.get(state, "lease_lost")
+            finally:
+                with self.lock:
+                    self.active.pop(task["id"], None)
+
+            with self.lock:
+                self.results.append({"id": task["id"], "task": task["task"],
+                                     "outcome": outcome, "error": error})
+
+    def _heartbeat(self):
+        interval = max(0.1, self.queue.visibility_timeout / 3)
+        while not self.stopping.wait(interval):
+            with self.lock:
+                active = list(self.active.items())
+            for task_id, owner in active:
+                self.queue.extend(task_id, owner)
+
+    def run(self, drain: bool = True) -> List[Dict[str, Any]]:
+        """
+        Start the workers. drain=True returns once no task is ready;
+        drain=False keeps polling until stop() (e.g. from another thread).
+        """
+        self.stopping.clear()
+        heartbeat = threading.Thread(target=self._heartbeat, name="queue-heartbeat", daemon=True)
+        heartbeat.start()
+        threads = [
+            threading.Thread(target=self._worker, args=(i, drain), name=f"queue-worker-{i}")
+            for i in range(self.workers)
+        ]
+        for thread in threads:
+            thread.start()
+        try:
+            for thread in threads:
+                while thread.is_alive():
+                    thread.join(0.5)
+        except KeyboardInterrupt:
+            print("\nStopping workers after their current task...")
+            self.stop()
+            for thread in threads:
+                thread.join()
+        finally:
+            self.stopping.set()
+        return self.results
+
+    def stop(self):
+        self.stopping.set()
+
+
+def demo():
+    """Enqueue a few tasks and drain them with a small pool (temp database)."""
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as tmp:
+        queue = TaskQueue(Path(tmp) / "demo_queue.db", visibility_timeout=2, retry_backoff=0.1)
+        for i, priority in enumerate(["low", "normal", "urgent", "high", "normal", "flaky"]):
+            queue.enqueue(f"demo task {i}", priority="normal" if priority == "flaky" else priority,
+                          mode=priority)
+
+        attempts = {}
+
+        def handler(task):
+            attempts[task["id"]] = attempts.get(task["id"], 0) + 1
+            if task["mode"] == "flaky" and attempts[task["id"]] < 2:
+                raise RuntimeError("transient failure")
+            time.sleep(0.05)
+            return f"done by {threading.current_thread().name}"
+
+        pool = QueueWorkerPool(queue, handler, workers=3, poll_interval=0.1)
+        pool.run(drain=True)
+        time.sleep(0.2)  # let the flaky task's backoff pass
+        pool.run(drain=True)
+
+        for outcome in pool.results:
+            print(f"  #{outcome['id']} {outcome['task']}: {outcome['outcome']}"
+                  + (f" ({outcome['error']})" if outcome["error"] else ""))
+        print(json.dumps(queue.get_stats(), indent=2))
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("TASK QUEUE DEMO")
+    print("=" * 60)
+    demo()
@@ -11,8 +11,13 @@ import os
 import re
 from pathlib import Path
 
+from API_INFRASTRUCTURE import (conditional_get, file_generation, init_request_timing,
+                                init_response_optimization)
+
 app = Flask(__name__)
 CORS(app)
+init_request_timing(app, 'tools')
+init_response_optimization(app)
 
 # Paths to scan
 SCAN_PATHS = [
@@ -106,7 +111,13 @@ def scan_tools():
     return tools
 
 
+def catalog_version(*args, **kwargs):
+    """ETag source: catalog file mtime/size"""
+    return (file_generation(CATALOG_PATH), request.full_path)
+
+
 @app.route('/api/tools', methods=['GET'])
+@conditional_get(catalog_version)
 def get_all_tools():
     """GET /api/tools - List all tools with metadata"""
     catalog = load_catalog()
@@ -13,8 +13,11 @@ from datetime import datetime
 from pathlib import Path
 import threading
 
+from API_INFRASTRUCTURE import init_request_timing
+
 app = Flask(__name__)
 CORS(app)
+init_request_timing(app, 'broadcast')
 
 # Trinity state files
 TRINITY_DIR = Path.home() / ".trinity"
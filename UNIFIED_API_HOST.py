@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+"""
+UNIFIED API HOST - One production WSGI server for every Flask service
+Replaces eight `app.run()` development servers (several with debug=True).
+
+Architecture:
+- One waitress process, one shared worker thread pool
+- Legacy ports still answer exactly as before (6669, 6670, 7778, ...):
+  requests are dispatched to the right app by the port they arrived on
+- Unified port (default 8080) mounts every app under a path prefix:
+  /search/api/search, /pattern/analyze, /semantic/api/semantic, ...
+- /metrics on the unified port: Prometheus text for every service
+- Shared in-process state: one API_INFRASTRUCTURE connection pool and
+  rate limiter, one SemanticVectorEngine, one PatternTheoryAPI
+- Rate limiting is opt-in per service (--rate-limit search,...);
+  /health and /metrics are never limited
+
+Usage:
+    python UNIFIED_API_HOST.py [--threads 16] [--port 8080]
+        [--services search,pattern,...] [--no-legacy-ports] [--warm]
+        [--rate-limit search,...]
+
+Requires: pip install waitress
+"""
+
+import importlib.util
+import json
+import os
+import sys
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(ROOT_DIR))
+
+import API_INFRASTRUCTURE
+
+DEFAULT_THREADS = 16
+DEFAULT_PORT = 8080
+DEFAULT_HOST = "0.0.0.0"
+
+# Services behind the shared rate limiter (opt-in; none by default)
+RATE_LIMITED_SERVICES = [name for name in os.environ.get("UNIFIED_RATE_LIMITED", "").split(",") if name]
+# Paths (as seen by the app) that are never rate limited
+RATE_LIMIT_EXEMPT = ('/health', '/metrics')
+
+# name -> (module file, legacy port, unified prefix)
+SERVICES = {
+    'search': ('CYCLOTRON_SEARCH_V2.py', 6669, '/search'),
+    'semantic': ('CYCLOTRON_SEMANTIC_API.py', 6670, '/semantic'),
+    'pattern': ('PATTERN_THEORY_ENGINE/server.py', 7778, '/pattern'),
+    'broadcast': ('TRINITY_BROADCAST_API.py', 7777, '/trinity'),
+    'analytics': ('ANALYTICS_API.py', 5055, '/analytics'),
+    'onboarding': ('ONBOARDING_API.py', 5050, '/onboarding'),
+    'tools': ('TOOL_DISCOVERY_API.py', 5100, '/tools'),
+    'generator': ('AI_APP_GENERATOR/api/APP_GENERATOR_API.py', 5001, '/generator'),
+}
+
+
+# ============================================================================
+# APP LOADING
+# ============================================================================
+
+def load_service(name: str):
+    """Import a service module by file path and return (module, flask app).
+
+    Each module is imported exactly once, so module-level singletons
+    (engines, analyzers, broadcasters) are shared by every port/prefix.
+    """
+    filename, _, _ = SERVICES[name]
+    path = ROOT_DIR / filename
+    module_name = f"unified_{name}"
+
+    if module_name in sys.modules:
+        module = sys.modules[module_name]
+    else:
+        # Services import siblings by bare name - mirror their own sys.path setup
+        sys.path.insert(0, str(path.parent))
+        spec = importlib.util.spec_from_file_location(module_name, path)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[module_name] = module
+        try:
+            spec.loader.exec_module(module)
+        except Exception:
+            del sys.modules[module_name]
+            raise
+
+    app = module.app
+    app.config['DEBUG'] = False
+    app.config['PROPAGATE_EXCEPTIONS'] = False
+    return module, app
+
+
+def warm_models(modules: dict):
+    """Instantiate heavy shared models up front instead of on first request."""
+    semantic = modules.get('semantic')
+    if semantic is not None and hasattr(semantic, 'get_engine'):
+        print("[HOST] Warming SemanticVectorEngine...")
+        semantic.get_engine()
+
+
+# ============================================================================
+# WSGI MIDDLEWARE
+# ============================================================================
+
+class ServiceDispatcher:
+    """Route requests by arrival port (legacy) or path prefix (unified).
+
+    The shared API_INFRASTRUCTURE rate limiter only applies to services
+    listed in rate_limited, and runs after routing so per-route limits
+    match the app's own path (/api/file, not /search/api/file). Health
+    and metrics paths are always exempt.
+    """
+
+    def __init__(self, apps: dict, unified_port: int, limiter=None, rate_limited=()):
+        self.apps = apps                     # name -> wsgi app
+        self.unified_port = str(unified_port)
+        self.limiter = limiter
+        self.rate_limited = set(rate_limited) & set(apps)
+        self.by_port = {}
+        self.by_prefix = []
+        for name, app in apps.items():
+            _, port, prefix = SERVICES[name]
+            self.by_port[str(port)] = name
+            self.by_prefix.append((prefix, name))
+        # Longest prefix first
+        self.by_prefix.sort(key=lambda item: len(item[0]), reverse=True)
+
+    def __call__(self, environ, start_response):
+        port = environ.get('SERVER_PORT')
+        if port != self.unified_port and port in self.by_port:
+            return self._call(self.by_port[port], environ, start_response)
+
+        path = environ.get('PATH_INFO', '') or '/'
+        for prefix, name in self.by_prefix:
+            if path == prefix or path.startswith(prefix + '/'):
+                environ['SCRIPT_NAME'] = environ.get('SCRIPT_NAME', '') + prefix
+                environ['PATH_INFO'] = path[len(prefix):] or '/'
+                return self._call(name, environ, start_response)
+
+        if path == '/metrics':
+            body = API_INFRASTRUCTURE.render_metrics().encode()
+            start_response('200 OK', [('Content-Type', 'text/plain; version=0.0.4'),
+                                      ('Content-Length', str(len(body)))])
+            return [body]
+
+        if path in ('/', '/health'):
+            return self._json(start_response, '200 OK', {
+                'status': 'online',
+                'services': self._service_map(),
+                'pool': API_INFRASTRUCTURE.get_pool_stats(),
+                'rate_limited_services': sorted(self.rate_limited),
+                'rate_limiter': self.limiter.get_summary() if self.limiter and self.rate_limited else None
+            })
+
+        return self._json(start_response, '404 Not Found',
+                          {'error': 'Not found', 'services': self._service_map()})
+
+    def _call(self, name: str, environ, start_response):
+        app = self.apps[name]
+        route = environ.get('PATH_INFO', '') or '/'
+        if self.limiter is not None and name in self.rate_limited and route not in RATE_LIMIT_EXEMPT:
+            ip = environ.get('REMOTE_ADDR') or '127.0.0.1'
+            allowed, error = self.limiter.is_allowed(ip, route)
+            if not allowed:
+                retry_after = self.limiter.get_stats(ip, route)['reset_in']
+                return self._json(start_response, '429 Too Many Requests',
+                                  {'error': error, 'status': 429},
+                                  [('Retry-After', str(retry_after))])
+        return app(environ, start_response)
+
+    @staticmethod
+    def _json(start_response, status: str, payload: dict, extra_headers: list = None):
+        body = json.dumps(payload, default=str).encode()
+        start_response(status, [('Content-Type', 'application/json'),
+                                ('Content-Length', str(len(body)))] + (extra_headers or []))
+        return [body]
+
+    def _service_map(self) -> dict:
+        return {name: {'prefix': SERVICES[name][2], 'legacy_port': SERVICES[name][1]}
+                for name in self.apps}
+
+
+# ============================================================================
+# HOST
+# ============================================================================
+
+def build_host(services: list = None, unified_port: int = DEFAULT_PORT, warm: bool = False,
+               rate_limited: list = None):
+    """Load services and return (wsgi_app, loaded service names)."""
+    API_INFRASTRUCTURE.init_api_infrastructure()
+
+    modules, apps = {}, {}
+    for name in services or list(SERVICES):
+        try:
+            modules[name], apps[name] = load_service(name)
+            print(f"[HOST] Loaded {name:11} -> :{SERVICES[name][1]} and {SERVICES[name][2]}")
+        except Exception as e:
+            # One broken service (missing optional dependency) must not take down the rest
+            print(f"[HOST] Skipped {name:10} - {type(e).__name__}: {e}")
+
+    if warm:
+        warm_models(modules)
+
+    rate_limited = RATE_LIMITED_SERVICES if rate_limited is None else rate_limited
+    for name in rate_limited:
+        if name not in apps:
+            print(f"[HOST] Rate limit requested for unloaded service: {name}")
+    dispatcher = ServiceDispatcher(apps, unified_port, API_INFRASTRUCTURE.get_rate_limiter(), rate_limited)
+    return dispatcher, list(apps)
+
+
+def serve(threads: int = DEFAULT_THREADS, port: int = DEFAULT_PORT, host: str = DEFAULT_HOST,
+          services: list = None, legacy_ports: bool = True, warm: bool = False,
+          rate_limited: list = None):
+    """Run every service in one multi-threaded waitress server."""
+    try:
+        from waitress import serve as waitress_serve
+    except ImportError:
+        print("[HOST] waitress is required: pip install waitress")
+        sys.exit(1)
+
+    app, loaded = build_host(services, port, warm, rate_limited)
+
+    listen = [f"{host}:{port}"]
+    if legacy_ports:
+        listen += [f"{host}:{SERVICES[name][1]}" for name in loaded]
+
+    print("\n" + "=" * 60)
+    print("UNIFIED API HOST")
+    print("=" * 60)
+    print(f"  Worker threads: {threads}")
+    print(f"  Listening:      {' '.join(listen)}")
+    print(f"  Rate limited:   {', '.join(sorted(app.rate_limited)) or 'none'}")
+    print("=" * 60 + "\n")
+
+    waitress_serve(app, listen=' '.join(listen), threads=threads, ident="consciousness-api")
+
+
+def main():
+    args = sys.argv[1:]
+    options = {'threads': DEFAULT_THREADS, 'port': DEFAULT_PORT, 'host': DEFAULT_HOST,
+               'services': None, 'legacy_ports': True, 'warm': False, 'rate_limited': None}
+
+    i = 0
+    while i < len(args):
+        flag = args[i]
+        if flag in ('-h', '--help'):
+            print(__doc__)
+            return
+        elif flag == '--threads':
+            options['threads'] = int(args[i + 1])
+            i += 1
+        elif flag == '--port':
+            options['port'] = int(args[i + 1])
+            i += 1
+        elif flag == '--host':
+            options['host'] = args[i + 1]
+            i += 1
+        elif flag == '--services':
+            options['services'] = args[i + 1].split(',')
+            i += 1
+        elif flag == '--rate-limit':
+            options['rate_limited'] = [name for name in args[i + 1].split(',') if name]
+            i += 1
+        elif flag == '--no-legacy-ports':
+            options['legacy_ports'] = False
+        elif flag == '--warm':
+            options['warm'] = True
+        i += 1
+
+    serve(**options)
+
+
+if __name__ == "__main__":
+    main()